@@ -0,0 +1,120 @@
+"""
+Measure the memory a server spends per GATT attribute.
+
+The script adds SERVICES services of CHARACTERISTICS characteristics each, with
+one descriptor per characteristic, and reports the bytes allocated per
+attribute as seen by tracemalloc. The BlueZ backend registers its objects on a
+private dbus-daemon with the fake bluetoothd of
+bless.backends.bluezdbus.testing standing in for BlueZ, so no adapter is
+needed. It uses dbus_fast when installed: dbus_next drops the connection when
+the burst of InterfacesAdded signals fills the socket, and the unsent signals
+would then count as attribute memory.
+
+    python benchmarks/attribute_memory.py [--services N] [--characteristics N]
+        [--engine dbus_next|dbus_fast]
+"""
+import os
+import sys
+import asyncio
+import argparse
+import tracemalloc
+
+from typing import Callable, Dict
+
+from bless.backends.attribute import GATTAttributePermissions
+from bless.backends.characteristic import GATTCharacteristicProperties
+from bless.backends.descriptor import GATTDescriptorProperties
+from bless.backends.server import BaseBlessServer
+from bless.backends.bluezdbus.dbus.engine import get_engine
+from bless.backends.bluezdbus.server import BlessServerBlueZDBus
+from bless.backends.bluezdbus.testing import FakeBlueZ, PrivateBus
+from bless.backends.loopback.server import BlessServerLoopback
+from bless.exceptions import BlessError
+
+DESCRIPTOR: str = "00002901-0000-1000-8000-00805f9b34fb"
+
+
+def gatt(services: int, characteristics: int) -> Dict:
+    return {
+        "{:08x}-0000-1000-8000-00805f9b34fb".format(0x10000 + s): {
+            "{:08x}-0000-1000-8000-00805f9b34fb".format(0x20000 + c): {
+                "Properties": (
+                    GATTCharacteristicProperties.read
+                    | GATTCharacteristicProperties.write
+                    | GATTCharacteristicProperties.notify
+                ),
+                "Permissions": (
+                    GATTAttributePermissions.readable
+                    | GATTAttributePermissions.writeable
+                ),
+                "Value": bytearray(20),
+                "Descriptors": {
+                    DESCRIPTOR: {
+                        "Properties": GATTDescriptorProperties.read,
+                        "Permissions": GATTAttributePermissions.readable,
+                        "Value": bytearray(b"description"),
+                    }
+                },
+            }
+            for c in range(characteristics)
+        }
+        for s in range(services)
+    }
+
+
+async def measure(server: BaseBlessServer, tree: Dict) -> int:
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    await server.add_gatt(tree)
+    # Let the bus flush the signals announcing the new objects
+    await asyncio.sleep(1)
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before
+
+
+async def main(services: int, characteristics: int, engine: str):
+    tree: Dict = gatt(services, characteristics)
+    attributes: int = services * (1 + 2 * characteristics)
+    backends: Dict[str, Callable[[], BaseBlessServer]] = {
+        "loopback": lambda: BlessServerLoopback("Bench"),
+        "bluezdbus": lambda: BlessServerBlueZDBus("Bench", dbus_engine=engine),
+    }
+
+    bus = PrivateBus()
+    address: str = bus.start()
+    os.environ["DBUS_SYSTEM_BUS_ADDRESS"] = address
+    bluez = FakeBlueZ()
+    await bluez.start(address)
+    try:
+        for name, factory in backends.items():
+            server: BaseBlessServer = factory()
+            if isinstance(server, BlessServerBlueZDBus):
+                await server.setup_task
+            used: int = await measure(server, tree)
+            print(
+                "{:<10} {} attributes: {:.1f} MB, {:.0f} bytes per attribute".format(
+                    name, attributes, used / 1e6, used / attributes
+                )
+            )
+            if isinstance(server, BlessServerBlueZDBus):
+                server.bus.disconnect()
+    finally:
+        bluez.stop()
+        bus.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--services", type=int, default=10)
+    parser.add_argument("--characteristics", type=int, default=500)
+    parser.add_argument("--engine", default=None)
+    args = parser.parse_args()
+    if args.engine is None:
+        try:
+            args.engine = get_engine("dbus_fast").name
+        except BlessError:
+            args.engine = "dbus_next"
+    if not PrivateBus.available():
+        sys.exit("dbus-daemon is not installed")
+    asyncio.run(main(args.services, args.characteristics, args.engine))
@@ -0,0 +1,75 @@
+"""
+Measure the time from starting a BlueZ server to its first advertisement.
+
+A private dbus-daemon and the fake bluetoothd of
+bless.backends.bluezdbus.testing stand in for the system bus and BlueZ. The
+fake answers the calls that reach the controller after --latency ms, as
+bluetoothd does. The script reports the median of every phase in the server's
+timings over --runs cold starts.
+
+    python benchmarks/first_advertisement.py [--runs N] [--latency MS]
+"""
+import os
+import sys
+import asyncio
+import argparse
+import statistics
+
+from typing import Dict, List
+
+from bless.backends.attribute import GATTAttributePermissions
+from bless.backends.characteristic import GATTCharacteristicProperties
+from bless.backends.bluezdbus.server import BlessServerBlueZDBus
+from bless.backends.bluezdbus.testing import FakeBlueZ, PrivateBus
+
+SERVICE: str = "a07498ca-ad5b-474e-940d-16f1fbe7e8cd"
+CHAR: str = "51ff12bb-3ed8-46e5-b4f9-d64e2fec021b"
+
+
+async def run(address: str, latency: float) -> Dict[str, float]:
+    bluez = FakeBlueZ(latency=latency)
+    await bluez.start(address)
+    server = BlessServerBlueZDBus("Bench")
+    try:
+        await server.add_gatt(
+            {
+                SERVICE: {
+                    CHAR: {
+                        "Properties": GATTCharacteristicProperties.read,
+                        "Permissions": GATTAttributePermissions.readable,
+                        "Value": bytearray(20),
+                    }
+                }
+            }
+        )
+        await server.start()
+        await server.stop()
+    finally:
+        server.bus.disconnect()
+        bluez.stop()
+    return server.timings
+
+
+async def main(runs: int, latency: float):
+    bus = PrivateBus()
+    address: str = bus.start()
+    os.environ["DBUS_SYSTEM_BUS_ADDRESS"] = address
+    try:
+        results: List[Dict[str, float]] = [
+            await run(address, latency) for _ in range(runs)
+        ]
+    finally:
+        bus.stop()
+    for phase in results[0]:
+        median: float = statistics.median(r[phase] for r in results)
+        print("{:<22} {:8.1f} ms".format(phase, median * 1000))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=5.0)
+    args = parser.parse_args()
+    if not PrivateBus.available():
+        sys.exit("dbus-daemon is not installed")
+    asyncio.run(main(args.runs, args.latency / 1000))
@@ -0,0 +1,58 @@
+"""
+Measure what importing bless costs.
+
+Every measurement runs in a fresh interpreter, so nothing is cached between
+runs. The script reports the median time to import bless, and to then access
+an enum and the platform's BlessServer, which is when the backend is imported.
+
+    python benchmarks/import_time.py [--runs N] [--backend NAME]
+"""
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+from typing import Dict, List
+
+STEPS: Dict[str, str] = {
+    "import bless": "",
+    "bless.GATTCharacteristicProperties": "bless.GATTCharacteristicProperties",
+    "bless.BlessServer": "bless.BlessServer",
+}
+
+TIMER: str = """
+import time
+start = time.perf_counter()
+import bless
+{access}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(access: str, runs: int, env: Dict[str, str]) -> float:
+    times: List[float] = []
+    for _ in range(runs):
+        output: bytes = subprocess.check_output(
+            [sys.executable, "-c", TIMER.format(access=access)], env=env
+        )
+        times.append(float(output))
+    return statistics.median(times)
+
+
+def main(runs: int, backend: str):
+    env: Dict[str, str] = dict(os.environ)
+    root: str = os.path.join(os.path.dirname(__file__), "..")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    if backend:
+        env["BLESS_BACKEND"] = backend
+    for step, access in STEPS.items():
+        print("{:<36} {:8.1f} ms".format(step, measure(access, runs, env) * 1000))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--backend", default="")
+    args = parser.parse_args()
+    main(args.runs, args.backend)
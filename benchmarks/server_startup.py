@@ -0,0 +1,97 @@
+"""
+Measure the start up of many BlueZ servers in one process.
+
+A private dbus-daemon and the fake bluetoothd of
+bless.backends.bluezdbus.testing stand in for the system bus and BlueZ. The
+script creates and starts N servers, each on its own connection and then all
+sharing a BlueZBusPool, and reports the total time, the time per server and the
+number of D-Bus connections opened.
+
+    python benchmarks/server_startup.py [--servers N ...]
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+from typing import Dict, List, Optional
+
+from bless.backends.attribute import GATTAttributePermissions
+from bless.backends.characteristic import GATTCharacteristicProperties
+from bless.backends.bluezdbus.dbus.pool import BlueZBusPool
+from bless.backends.bluezdbus.server import BlessServerBlueZDBus
+from bless.backends.bluezdbus.testing import FakeBlueZ, PrivateBus
+
+SERVICE: str = "a07498ca-ad5b-474e-940d-16f1fbe7e8cd"
+CHAR: str = "51ff12bb-3ed8-46e5-b4f9-d64e2fec021b"
+
+
+async def run(address: str, servers: int, shared: bool) -> Dict:
+    bluez = FakeBlueZ(supported_instances=servers)
+    await bluez.start(address)
+    pool: Optional[BlueZBusPool] = BlueZBusPool() if shared else None
+    started: List[BlessServerBlueZDBus] = []
+
+    async def start(i: int) -> BlessServerBlueZDBus:
+        server = BlessServerBlueZDBus("Sim{}".format(i), bus_pool=pool)
+        await server.add_gatt(
+            {
+                SERVICE: {
+                    CHAR: {
+                        "Properties": GATTCharacteristicProperties.read,
+                        "Permissions": GATTAttributePermissions.readable,
+                        "Value": bytearray(20),
+                    }
+                }
+            }
+        )
+        await server.start()
+        return server
+
+    try:
+        begin: float = time.perf_counter()
+        started = list(await asyncio.gather(*[start(i) for i in range(servers)]))
+        elapsed: float = time.perf_counter() - begin
+    finally:
+        for server in started:
+            await server.stop()
+        for bus in {id(s.bus): s.bus for s in started}.values():
+            bus.disconnect()
+        bluez.stop()
+
+    return {
+        "total (ms)": elapsed * 1000,
+        "per server (ms)": elapsed * 1000 / servers,
+        "connections": len({id(s.bus) for s in started}),
+    }
+
+
+async def main(counts: List[int]):
+    bus = PrivateBus()
+    address: str = bus.start()
+    os.environ["DBUS_SYSTEM_BUS_ADDRESS"] = address
+    try:
+        for servers in counts:
+            for shared in (False, True):
+                results: Dict = await run(address, servers, shared)
+                print(
+                    "{:>4} servers {:<8} ".format(
+                        servers, "pooled" if shared else "private"
+                    )
+                    + "  ".join(
+                        "{}: {:.1f}".format(key, value)
+                        for key, value in results.items()
+                    )
+                )
+    finally:
+        bus.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--servers", type=int, nargs="+", default=[1, 10, 50])
+    args = parser.parse_args()
+    if not PrivateBus.available():
+        sys.exit("dbus-daemon is not installed")
+    asyncio.run(main(args.servers))
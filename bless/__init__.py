@@ -1,79 +1,65 @@
 import os
-import sys
+import importlib
 
-# Avoid OS-specific imports during docs builds.
-if os.environ.get("BLESS_DOCS_BUILD"):
-    pass
-elif sys.platform == "darwin":
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING
 
-    # Server
-    from bless.backends.corebluetooth.server import (  # noqa: F401
-        BlessServerCoreBluetooth as BlessServer,
-    )
-
-    # Service
-    from bless.backends.corebluetooth.service import (  # noqa: F401
-        BlessGATTServiceCoreBluetooth as BlessGATTService
-    )
-
-    # Characteristic Classes
-    from bless.backends.corebluetooth.characteristic import (  # noqa: F401
-        BlessGATTCharacteristicCoreBluetooth as BlessGATTCharacteristic,
-    )
-
-elif sys.platform == "linux":
-
-    # Server
-    from bless.backends.bluezdbus.server import (  # noqa: F401
-        BlessServerBlueZDBus as BlessServer,
-    )
-
-    # Service
-    from bless.backends.bluezdbus.service import (  # noqa: F401
-        BlessGATTServiceBlueZDBus as BlessGATTService
-    )
-
-    # Characteristic Classes
-    from bless.backends.bluezdbus.characteristic import (  # noqa: F401
-        BlessGATTCharacteristicBlueZDBus as BlessGATTCharacteristic,
-    )
-
-    # Descriptor Classes
-    from bless.backends.bluezdbus.descriptor import (  # noqa: F401
-        BlessGATTDescriptorBlueZDBus as BlessGATTDescriptor,
-    )
-
-elif sys.platform == "win32":
-
-    # Server
-    from bless.backends.winrt.server import (  # noqa: F401
-        BlessServerWinRT as BlessServer,
-    )
-
-    # Service
-    from bless.backends.winrt.service import (  # noqa: F401
-        BlessGATTServiceWinRT as BlessGATTService
-    )
-
-    # Characteristic Classes
-    from bless.backends.winrt.characteristic import (  # noqa: F401
-        BlessGATTCharacteristicWinRT as BlessGATTCharacteristic,
-    )
-
-# type: ignore
-from bless.backends.attribute import (  # noqa: E402 F401
-    GATTAttributePermissions,
-)
-
-# type: ignore
-from bless.backends.characteristic import (  # noqa: E402 F401
-    GATTCharacteristicProperties,
+from bless.backends.registry import (  # noqa: F401
+    BlessBackend,
+    backend_names,
+    get_backend,
+    register_backend,
 )
 
-# type: ignore
-from bless.backends.descriptor import (  # noqa: E402 F401
-    GATTDescriptorProperties,
-)
+if TYPE_CHECKING:
+    from bless.backends.attribute import GATTAttributePermissions  # noqa: F401
+    from bless.backends.characteristic import (  # noqa: F401
+        GATTCharacteristicProperties,
+    )
+    from bless.backends.descriptor import GATTDescriptorProperties  # noqa: F401
+    from bless.backends.runner import BlessServerThread  # noqa: F401
+
+# Everything below is imported on first access, so that importing bless does
+# not import a platform backend. BlessServer, BlessGATTService,
+# BlessGATTCharacteristic and BlessGATTDescriptor come from the backend named
+# by BLESS_BACKEND, or the platform's backend, when first accessed
+_BACKEND_ATTRIBUTES: Dict[str, str] = {
+    "BlessServer": "server",
+    "BlessGATTService": "service",
+    "BlessGATTCharacteristic": "characteristic",
+    "BlessGATTDescriptor": "descriptor",
+}
+_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "GATTAttributePermissions": (
+        "bless.backends.attribute",
+        "GATTAttributePermissions",
+    ),
+    "GATTCharacteristicProperties": (
+        "bless.backends.characteristic",
+        "GATTCharacteristicProperties",
+    ),
+    "GATTDescriptorProperties": (
+        "bless.backends.descriptor",
+        "GATTDescriptorProperties",
+    ),
+    "BlessServerThread": ("bless.backends.runner", "BlessServerThread"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    value: Any
+    if name in _BACKEND_ATTRIBUTES and not os.environ.get("BLESS_DOCS_BUILD"):
+        value = get_backend().load(_BACKEND_ATTRIBUTES[name])
+    elif name in _ATTRIBUTES:
+        module, attribute = _ATTRIBUTES[name]
+        value = getattr(importlib.import_module(module), attribute)
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_BACKEND_ATTRIBUTES) | set(_ATTRIBUTES))
 
 
 def check_test() -> bool:
@@ -1,6 +1,6 @@
 import platform
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
 from typing import Dict, List, Optional
 
 
@@ -17,6 +17,8 @@ class BlessAdvertisementData:
     is_connectable: Optional[bool] = None
     is_discoverable: Optional[bool] = None
     tx_power: Optional[int] = None
+    min_interval: Optional[int] = None
+    max_interval: Optional[int] = None
 
     def __post_init__(self) -> None:
         """
@@ -37,6 +39,8 @@ class BlessAdvertisementData:
                     "manufacturer_data",
                     "service_data",
                     "tx_power",
+                    "min_interval",
+                    "max_interval",
                 }
             )
         else:
@@ -49,6 +53,18 @@ class BlessAdvertisementData:
                 RuntimeWarning,
             )
 
+    def merge(self, other: "BlessAdvertisementData") -> "BlessAdvertisementData":
+        """
+        Return a copy of this advertisement data where every field that is set
+        on other replaces the corresponding field here.
+        """
+        changes = {
+            field.name: getattr(other, field.name)
+            for field in fields(other)
+            if getattr(other, field.name) is not None
+        }
+        return replace(self, **changes)
+
     def _unused_fields(self, used: set) -> set:
         """
         Return the provided field names that are not in the OS-used set.
@@ -61,6 +77,8 @@ class BlessAdvertisementData:
             "is_connectable": self.is_connectable is not None,
             "is_discoverable": self.is_discoverable is not None,
             "tx_power": self.tx_power is not None,
+            "min_interval": self.min_interval is not None,
+            "max_interval": self.max_interval is not None,
         }
         return {
             name for name, present in provided.items() if present and name not in used
@@ -1,4 +1,9 @@
+import sys
+
 from enum import Flag
+from uuid import UUID
+from functools import lru_cache
+from typing import Union
 
 
 class GATTAttributePermissions(Flag):
@@ -6,3 +11,24 @@ class GATTAttributePermissions(Flag):
     writeable = 0x2
     read_encryption_required = 0x4
     write_encryption_required = 0x8
+
+
+@lru_cache(maxsize=None)
+def intern_uuid(uuid: Union[str, UUID]) -> str:
+    """
+    The canonical string of a UUID. Attributes that share a UUID share the
+    string, which matters when a server hosts thousands of them
+
+    Parameters
+    ----------
+    uuid : Union[str, UUID]
+        The UUID, or any string UUID accepts
+
+    Returns
+    -------
+    str
+        The lower case, hyphenated form of the UUID
+    """
+    if not isinstance(uuid, UUID):
+        uuid = UUID(uuid)
+    return sys.intern(str(uuid))
@@ -1,6 +1,16 @@
 from uuid import UUID
-
-from typing import Union, Optional, List, Dict, cast, TYPE_CHECKING, Literal
+from functools import lru_cache
+
+from typing import (
+    Union,
+    Optional,
+    List,
+    Dict,
+    Tuple,
+    cast,
+    TYPE_CHECKING,
+    Literal,
+)
 
 from bleak.backends.characteristic import (  # type: ignore
     BleakGATTCharacteristic,
@@ -11,6 +21,7 @@ from bless.backends.attribute import GATTAttributePermissions
 from bless.backends.characteristic import (
     BlessGATTCharacteristic,
     GATTCharacteristicProperties,
+    default_max_write_without_response_size,
 )
 from bless.backends.bluezdbus.dbus.characteristic import (
     Flags,
@@ -81,10 +92,9 @@ class BlessGATTCharacteristicBlueZDBus(
         service : BlessGATTService
             The service to assign the characteristic to
         """
-        flags: List[Flags] = [
-            transform_flags_with_permissions(flag, self._permissions)
-            for flag in flags_to_dbus(self._properties_flags)
-        ]
+        flags: List[Flags] = list(
+            _dbus_flags(self._properties_flags, self._permissions)
+        )
 
         # Add to our BlueZDBus app
         bluez_service: "BlessGATTServiceBlueZDBus" = cast(
@@ -104,7 +114,9 @@ class BlessGATTCharacteristicBlueZDBus(
         self.path = gatt_char.path  # D-Bus path
         self._service_uuid = service.uuid
         self._handle = 0  # Handle will be assigned by BlueZ
-        self._max_write_without_response_size = lambda: 512  # Default MTU
+        self._max_write_without_response_size = (
+            default_max_write_without_response_size
+        )
 
     @property
     def service_uuid(self) -> str:
@@ -142,6 +154,16 @@ class BlessGATTCharacteristicBlueZDBus(
         return f"Characteristic {self._uuid}"
 
 
+@lru_cache(maxsize=None)
+def _dbus_flags(
+    properties: GATTCharacteristicProperties, permissions: GATTAttributePermissions
+) -> Tuple[Flags, ...]:
+    return tuple(
+        transform_flags_with_permissions(flag, permissions)
+        for flag in flags_to_dbus(properties)
+    )
+
+
 def transform_flags_with_permissions(
     flag: Flags, permissions: GATTAttributePermissions
 ) -> Flags:
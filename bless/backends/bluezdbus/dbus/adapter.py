@@ -0,0 +1,157 @@
+import bleak.backends.bluezdbus.defs as defs  # type: ignore
+
+from typing import Any, Dict, Optional, Tuple
+
+from bless.backends.bluezdbus.dbus.utils import SignalFollower
+
+ADAPTER_INTERFACE: str = "org.bluez.Adapter1"
+ADVERTISING_MANAGER_INTERFACE: str = "org.bluez.LEAdvertisingManager1"
+
+
+class BlueZAdapterProperties(SignalFollower):
+    """
+    Caches the properties of an adapter, such as Alias, Powered and the
+    advertising instances, so that reading them, or setting them to the value
+    they already have, costs no D-Bus round trip
+
+    Values are read on first use and then kept current from the adapter's
+    PropertiesChanged signals. Anything the signals invalidate is read again
+    on next use. Listeners are told of every change, e.g. of Powered, with
+    the interface, the name and the new value of the property
+    """
+
+    def __init__(self, bus: Any, adapter_path: str):
+        """
+        Parameters
+        ----------
+        bus : MessageBus
+            The connected system bus
+        adapter_path : str
+            The object path of the adapter
+        """
+        super(BlueZAdapterProperties, self).__init__(
+            bus,
+            [
+                (
+                    "type='signal',sender='{}',interface='{}',"
+                    "member='PropertiesChanged',path='{}'"
+                ).format(defs.BLUEZ_SERVICE, defs.PROPERTIES_INTERFACE, adapter_path)
+            ],
+        )
+        self.adapter_path: str = adapter_path
+
+        self._values: Dict[Tuple[str, str], Any] = {}
+
+    async def stop(self):
+        """
+        Stop following the adapter's property changes and forget the values
+        """
+        await super(BlueZAdapterProperties, self).stop()
+        self.invalidate()
+
+    async def get(self, interface: str, name: str) -> Any:
+        """
+        The value of a property, read from the adapter if it is not cached
+
+        Parameters
+        ----------
+        interface : str
+            The interface of the property, e.g. org.bluez.Adapter1
+        name : str
+            The property, e.g. Alias
+
+        Returns
+        -------
+        Any
+            The value
+        """
+        key: Tuple[str, str] = (interface, name)
+        if key in self._values:
+            return self._values[key]
+        reply: Any = await self._call(
+            defs.PROPERTIES_INTERFACE, "Get", "ss", [interface, name]
+        )
+        value: Any = reply.body[0].value
+        # Only keep it while the signals can tell us it changed
+        if self._started:
+            self._values[key] = value
+        return value
+
+    async def set(self, interface: str, name: str, signature: str, value: Any):
+        """
+        Set a property, unless it is known to have the value already
+
+        Parameters
+        ----------
+        interface : str
+            The interface of the property
+        name : str
+            The property
+        signature : str
+            The D-Bus signature of the value, e.g. s
+        value : Any
+            The value
+        """
+        key: Tuple[str, str] = (interface, name)
+        if key in self._values and self._values[key] == value:
+            return
+        await self._call(
+            defs.PROPERTIES_INTERFACE,
+            "Set",
+            "ssv",
+            [interface, name, self.engine.Variant(signature, value)],
+        )
+        if self._started:
+            self._values[key] = value
+
+    def invalidate(self, interface: Optional[str] = None, name: Optional[str] = None):
+        """
+        Forget cached values, so that they are read again on next use
+
+        Parameters
+        ----------
+        interface : Optional[str]
+            Only forget the properties of this interface
+        name : Optional[str]
+            Only forget this property
+        """
+        for key in list(self._values):
+            if interface is not None and key[0] != interface:
+                continue
+            if name is not None and key[1] != name:
+                continue
+            del self._values[key]
+
+    def _on_signal(self, message: Any):
+        if (
+            message.member != "PropertiesChanged"
+            or message.path != self.adapter_path
+            or message.interface != defs.PROPERTIES_INTERFACE
+        ):
+            return
+        interface, changed, invalidated = message.body
+        for name, value in changed.items():
+            self._values[(interface, name)] = value.value
+        for name in invalidated:
+            self._values.pop((interface, name), None)
+        for name, value in changed.items():
+            self._notify(interface, name, value.value)
+
+    async def _call(
+        self, interface: str, member: str, signature: str, body: Any
+    ) -> Any:
+        reply: Any = await self.bus.call(
+            self.engine.Message(
+                destination=defs.BLUEZ_SERVICE,
+                path=self.adapter_path,
+                interface=interface,
+                member=member,
+                signature=signature,
+                body=body,
+            )
+        )
+        if reply.message_type == self.engine.MessageType.ERROR:
+            raise self.engine.DBusError(
+                reply.error_name, reply.body[0] if reply.body else ""
+            )
+        return reply
@@ -1,8 +1,14 @@
 from enum import Enum
 
-from typing import List, Dict, TYPE_CHECKING
+from typing import Any, List, Dict, Optional, TYPE_CHECKING
 
-from dbus_next.service import ServiceInterface, method, dbus_property  # type: ignore
+from bless.backends.bluezdbus.dbus.engine import (
+    DBusInterface,
+    method,
+    dbus_property,
+)
+
+from bless.backends.advertisement import BlessAdvertisementData
 
 if TYPE_CHECKING:
     from bless.backends.bluezdbus.dbus.application import (  # type: ignore
@@ -10,12 +16,17 @@ if TYPE_CHECKING:
     )
 
 
+# Advertising interval bounds in ms imposed by the Bluetooth Core spec
+MIN_INTERVAL: int = 20
+MAX_INTERVAL: int = 10485759
+
+
 class Type(Enum):
     BROADCAST = "broadcast"
     PERIPHERAL = "peripheral"
 
 
-class BlueZLEAdvertisement(ServiceInterface):
+class BlueZLEAdvertisement(DBusInterface):
     """
     org.bluez.LEAdvertisement1 interface implementation
 
@@ -70,6 +81,110 @@ class BlueZLEAdvertisement(ServiceInterface):
         self.data = None
         super(BlueZLEAdvertisement, self).__init__(self.interface_name)
 
+    def set_advertisement_data(
+        self, advertisement_data: Optional[BlessAdvertisementData]
+    ) -> Dict[str, Any]:
+        """
+        Populate the advertisement from a generic advertisement payload. Fields
+        that are None in the payload are left untouched
+
+        Parameters
+        ----------
+        advertisement_data : Optional[BlessAdvertisementData]
+            The advertisement payload to apply
+
+        Returns
+        -------
+        Dict[str, Any]
+            The D-Bus properties whose values changed, suitable for
+            emit_properties_changed
+        """
+        changed: Dict[str, Any] = {}
+        if advertisement_data is None:
+            return changed
+
+        if advertisement_data.local_name is not None:
+            changed["LocalName"] = advertisement_data.local_name
+        if advertisement_data.service_uuids is not None:
+            changed["ServiceUUIDs"] = list(advertisement_data.service_uuids)
+        if advertisement_data.manufacturer_data is not None:
+            changed["ManufacturerData"] = {
+                int(company_id): self.engine.Variant("ay", bytes(data))
+                for company_id, data in advertisement_data.manufacturer_data.items()
+            }
+        if advertisement_data.service_data is not None:
+            changed["ServiceData"] = {
+                uuid: self.engine.Variant("ay", bytes(data))
+                for uuid, data in advertisement_data.service_data.items()
+            }
+        if advertisement_data.tx_power is not None:
+            changed["TxPower"] = advertisement_data.tx_power
+
+        interval_changed: Dict[str, Any] = {}
+        if (
+            advertisement_data.min_interval is not None
+            or advertisement_data.max_interval is not None
+        ):
+            interval_changed = self.set_interval(
+                advertisement_data.min_interval or self._min_interval,
+                advertisement_data.max_interval or self._max_interval,
+            )
+
+        current: Dict[str, Any] = {
+            "LocalName": self._local_name,
+            "ServiceUUIDs": self._service_uuids,
+            "ManufacturerData": self._manufacturer_data,
+            "ServiceData": self._service_data,
+            "TxPower": self._tx_power,
+        }
+        changed = {
+            name: value for name, value in changed.items() if current[name] != value
+        }
+
+        self._local_name = changed.get("LocalName", self._local_name)
+        self._service_uuids = changed.get("ServiceUUIDs", self._service_uuids)
+        self._manufacturer_data = changed.get(
+            "ManufacturerData", self._manufacturer_data
+        )
+        self._service_data = changed.get("ServiceData", self._service_data)
+        self._tx_power = changed.get("TxPower", self._tx_power)
+        changed.update(interval_changed)
+        return changed
+
+    def set_interval(self, min_interval: int, max_interval: int) -> Dict[str, Any]:
+        """
+        Set the advertising interval range
+
+        Parameters
+        ----------
+        min_interval : int
+            The minimum advertising interval in ms
+        max_interval : int
+            The maximum advertising interval in ms
+
+        Returns
+        -------
+        Dict[str, Any]
+            The D-Bus properties whose values changed, suitable for
+            emit_properties_changed
+        """
+        if not (
+            MIN_INTERVAL <= min_interval <= max_interval <= MAX_INTERVAL
+        ):
+            raise ValueError(
+                "Advertising intervals must satisfy "
+                f"{MIN_INTERVAL} <= min ({min_interval}) <= max ({max_interval}) "
+                f"<= {MAX_INTERVAL}"
+            )
+        changed: Dict[str, Any] = {}
+        if min_interval != self._min_interval:
+            changed["MinInterval"] = min_interval
+        if max_interval != self._max_interval:
+            changed["MaxInterval"] = max_interval
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        return changed
+
     @method()
     def Release(self):  # noqa: N802
         print("%s: Released!" % self.path)
@@ -1,13 +1,20 @@
 import re
+import asyncio
+import logging
 
 import bleak.backends.bluezdbus.defs as defs  # type: ignore
 
-from typing import List, Any, Callable, Optional, Union, Dict
+from typing import List, Any, Awaitable, Callable, Optional, Set, Union, Dict
 
 from dbus_next.aio import MessageBus, ProxyObject, ProxyInterface  # type: ignore
-from dbus_next.service import ServiceInterface  # type: ignore
-from dbus_next.signature import Variant  # type: ignore
 
+from bless.exceptions import BlessError
+from bless.backends.bluezdbus.dbus.engine import DBusInterface
+from bless.backends.bluezdbus.dbus.adapter import (  # type: ignore
+    ADAPTER_INTERFACE,
+    ADVERTISING_MANAGER_INTERFACE,
+    BlueZAdapterProperties,
+)
 from bless.backends.advertisement import BlessAdvertisementData
 from bless.backends.bluezdbus.dbus.advertisement import (  # type: ignore
     Type,
@@ -19,14 +26,43 @@ from bless.backends.bluezdbus.dbus.characteristic import (  # type: ignore
     BlueZGattCharacteristic,
 )
 from bless.backends.bluezdbus.dbus.descriptor import BlueZGattDescriptor  # type: ignore
+from bless.backends.bluezdbus.dbus.fastpath import value_reply, write  # type: ignore
+
+logger = logging.getLogger(__name__)
 
 
-class BlueZGattApplication(ServiceInterface):
+def base_path_for(name: str) -> str:
+    """
+    The default object path under which an application's objects are exported
+
+    Parameters
+    ----------
+    name : str
+        The name of the application
+
+    Returns
+    -------
+    str
+        /org/bluez/ followed by the name, without the characters object paths
+        do not allow
+    """
+    # Valid path must be ASCII characters "[A-Z][a-z][0-9]_"
+    # see https://dbus.freedesktop.org/doc/dbus-specification.html#message-protocol-marshaling-object-path  # noqa E501
+    return "/org/bluez/" + re.sub("[^A-Za-z0-9_]", "", name)
+
+
+class BlueZGattApplication(DBusInterface):
     """
     org.bluez.GattApplication1 interface implementation
     """
 
-    def __init__(self, name: str, destination: str, bus: MessageBus):
+    def __init__(
+        self,
+        name: str,
+        destination: str,
+        bus: MessageBus,
+        base_path: Optional[str] = None,
+    ):
         """
         Initialize a new GattApplication1
 
@@ -38,30 +74,55 @@ class BlueZGattApplication(ServiceInterface):
             The destination interface to add the application to
         bus : MessageBus
             The dbus_next connection
+        base_path : Optional[str]
+            The object path of the application, under which its services and
+            advertisements are exported. Applications sharing a connection
+            need distinct paths. Defaults to base_path_for(name)
         """
-        self.path: str = "/"
         self.app_name: str = name
         self.destination: str = destination
         self.bus: MessageBus = bus
 
-        # Valid path must be ASCII characters "[A-Z][a-z][0-9]_"
-        # see https://dbus.freedesktop.org/doc/dbus-specification.html#message-protocol-marshaling-object-path  # noqa E501
-
-        self.base_path: str = "/org/bluez/" + re.sub("[^A-Za-z0-9_]", "", self.app_name)
+        self.base_path: str = base_path or base_path_for(self.app_name)
+        # BlueZ asks the application path for the objects below it, so the
+        # application is rooted at its own path rather than at "/"
+        self.path: str = self.base_path
         self.advertisements: List[BlueZLEAdvertisement] = []
+        # The adapter path each advertisement is registered on, by its path
+        self._advertisement_adapters: Dict[str, str] = {}
+        self._advertisement_index: int = 0
+        # The adapters the application is registered with
+        self._adapters: Set[str] = set()
+        # Property caches of the adapters, by path, given by the server. Without
+        # one, properties are read and written on every call
+        self.adapter_properties: Dict[str, BlueZAdapterProperties] = {}
         self.services: List[BlueZGattService] = []
 
         self.Read: Optional[
-            Callable[[BlueZGattCharacteristic, Dict[str, Any]], bytes]
+            Callable[
+                [BlueZGattCharacteristic, Dict[str, Any]],
+                Union[bytes, Awaitable[bytes]],
+            ]
         ] = None
         self.Write: Optional[
-            Callable[[BlueZGattCharacteristic, bytes, Dict[str, Any]], None]
+            Callable[[BlueZGattCharacteristic, bytes, Dict[str, Any]], Any]
+        ] = None
+        self.StartNotify: Optional[
+            Callable[[BlueZGattCharacteristic], Any]
+        ] = None
+        self.StopNotify: Optional[
+            Callable[[BlueZGattCharacteristic], Any]
+        ] = None
+        self.Confirm: Optional[
+            Callable[[BlueZGattCharacteristic], Any]
         ] = None
-        self.StartNotify: Optional[Callable[[None], None]] = None
-        self.StopNotify: Optional[Callable[[None], None]] = None
 
         self.subscribed_characteristics: List[str] = []
 
+        # Exported characteristics by path, for the ReadValue fast path
+        self._characteristics: Dict[str, BlueZGattCharacteristic] = {}
+        self._reads: Set[asyncio.Future] = set()
+
         super(BlueZGattApplication, self).__init__(self.destination)
 
     async def add_service(self, uuid: str) -> BlueZGattService:  # noqa: F821
@@ -81,7 +142,9 @@ class BlueZGattApplication(ServiceInterface):
         """
         index: int = len(self.services) + 1
         primary: bool = index == 1
-        service: BlueZGattService = BlueZGattService(uuid, primary, index, self)
+        service: BlueZGattService = self.engine.interface(BlueZGattService)(
+            uuid, primary, index, self
+        )
         self.services.append(service)
         self.bus.export(service.path, service)
         return service
@@ -126,10 +189,32 @@ class BlueZGattApplication(ServiceInterface):
         name : str
             The namem to set the adapter alias
         """
+        properties: Optional[BlueZAdapterProperties] = self.adapter_properties.get(
+            adapter.path
+        )
+        if properties is not None:
+            await properties.set(ADAPTER_INTERFACE, "Alias", "s", name)
+            return
         iface: ProxyInterface = adapter.get_interface("org.freedesktop.DBus.Properties")
         await iface.call_set(  # type: ignore
-            "org.bluez.Adapter1", "Alias", Variant("s", name)
+            ADAPTER_INTERFACE, "Alias", self.engine.Variant("s", name)
+        )
+
+    def advertising_changed(self, adapter: ProxyObject):
+        """
+        Forget the cached advertising instances of an adapter after an
+        advertisement was registered or unregistered on it
+
+        Parameters
+        ----------
+        adapter : ProxyObject
+            The adapter
+        """
+        properties: Optional[BlueZAdapterProperties] = self.adapter_properties.get(
+            adapter.path
         )
+        if properties is not None:
+            properties.invalidate(ADVERTISING_MANAGER_INTERFACE)
 
     async def register(self, adapter: ProxyObject):
         """
@@ -138,10 +223,18 @@ class BlueZGattApplication(ServiceInterface):
         Parameters
         ----------
         adapter : ProxyObject
-            The adapter to register the application with
+            The adapter to register the application with. The same application
+            may be registered with several adapters
         """
+        if len(self._adapters) == 0:
+            self.bus.add_message_handler(self._read_value_handler)
+        self._adapters.add(adapter.path)
         iface: ProxyInterface = adapter.get_interface(defs.GATT_MANAGER_INTERFACE)
-        await iface.call_register_application(self.path, {})  # type: ignore
+        try:
+            await iface.call_register_application(self.path, {})  # type: ignore
+        except Exception:
+            self._forget_adapter(adapter.path)
+            raise
 
     async def unregister(self, adapter: ProxyObject):
         """
@@ -154,6 +247,56 @@ class BlueZGattApplication(ServiceInterface):
         """
         iface: ProxyInterface = adapter.get_interface(defs.GATT_MANAGER_INTERFACE)
         await iface.call_unregister_application(self.path)  # type: ignore
+        self._forget_adapter(adapter.path)
+
+    async def reregister(self, adapter: ProxyObject):
+        """
+        Register the application and its advertisements with an adapter again,
+        after bluetoothd restarted or the adapter was powered back on. The
+        exported objects are registered as they are, and registrations BlueZ
+        kept are left alone
+
+        Parameters
+        ----------
+        adapter : ProxyObject
+            The adapter the application was registered with
+        """
+        if adapter.path in self._adapters:
+            manager: ProxyInterface = adapter.get_interface(
+                defs.GATT_MANAGER_INTERFACE
+            )
+            await self._register_again(
+                manager.call_register_application(self.path, {})  # type: ignore
+            )
+
+        advertisements: List[BlueZLEAdvertisement] = self.advertisements_on(adapter)
+        if len(advertisements) == 0:
+            return
+        iface: ProxyInterface = adapter.get_interface(ADVERTISING_MANAGER_INTERFACE)
+        await asyncio.gather(
+            self.set_name(adapter, advertisements[-1]._local_name),
+            *[
+                self._register_again(
+                    iface.call_register_advertisement(a.path, {})  # type: ignore
+                )
+                for a in advertisements
+            ]
+        )
+        self.advertising_changed(adapter)
+
+    async def _register_again(self, call: Awaitable[Any]):
+        try:
+            await call
+        except self.engine.DBusError as e:
+            if e.type != "org.bluez.Error.AlreadyExists":
+                raise
+
+    def _forget_adapter(self, adapter_path: str):
+        if adapter_path not in self._adapters:
+            return
+        self._adapters.discard(adapter_path)
+        if len(self._adapters) == 0:
+            self.bus.remove_message_handler(self._read_value_handler)
 
     async def start_advertising(
         self,
@@ -170,34 +313,183 @@ class BlueZGattApplication(ServiceInterface):
         advertisement_data : Optional[BlessAdvertisementData]
             Optional advertisement payload to populate BlueZ advertisement data
         """
+        advertisement: BlueZLEAdvertisement = await self.prepare_advertising(
+            adapter, advertisement_data
+        )
+        await self.register_advertisement(adapter, advertisement)
+
+    async def prepare_advertising(
+        self,
+        adapter: ProxyObject,
+        advertisement_data: Optional[BlessAdvertisementData] = None,
+    ) -> BlueZLEAdvertisement:
+        """
+        The first half of start_advertising: set the adapter's alias and export
+        the advertisement, without registering it. Nothing here depends on the
+        application being registered, so it can overlap with register
+
+        Parameters
+        ----------
+        adapter : ProxyObject
+            The adapter object that will advertise
+        advertisement_data : Optional[BlessAdvertisementData]
+            Optional advertisement payload to populate BlueZ advertisement data
+
+        Returns
+        -------
+        BlueZLEAdvertisement
+            The exported advertisement, to pass to register_advertisement
+        """
         local_name: str = self.app_name
         if advertisement_data and advertisement_data.local_name is not None:
             local_name = advertisement_data.local_name
+        advertisement: BlueZLEAdvertisement = self._new_advertisement(
+            advertisement_data
+        )
+        self.bus.export(advertisement.path, advertisement)
         await self.set_name(adapter, local_name)
+        return advertisement
 
-        advertisement: BlueZLEAdvertisement = BlueZLEAdvertisement(
-            Type.PERIPHERAL, len(self.advertisements) + 1, self
-        )
+    async def register_advertisement(
+        self, adapter: ProxyObject, advertisement: BlueZLEAdvertisement
+    ):
+        """
+        The second half of start_advertising: register an advertisement
+        exported by prepare_advertising
+
+        Parameters
+        ----------
+        adapter : ProxyObject
+            The adapter object to start advertising on
+        advertisement : BlueZLEAdvertisement
+            The advertisement
+        """
         self.advertisements.append(advertisement)
+        self._advertisement_adapters[advertisement.path] = adapter.path
 
-        if advertisement_data and advertisement_data.local_name is not None:
-            advertisement._local_name = advertisement_data.local_name
-        if advertisement_data and advertisement_data.service_uuids is not None:
-            advertisement._service_uuids.extend(advertisement_data.service_uuids)
-        elif len(self.services) > 0:
-            # Only add the first UUID
-            advertisement._service_uuids.append(self.services[0].UUID)
-        if advertisement_data and advertisement_data.manufacturer_data is not None:
-            advertisement._manufacturer_data = advertisement_data.manufacturer_data
-        if advertisement_data and advertisement_data.service_data is not None:
-            advertisement._service_data = advertisement_data.service_data
-        if advertisement_data and advertisement_data.tx_power is not None:
-            advertisement._tx_power = advertisement_data.tx_power
+        iface: ProxyInterface = adapter.get_interface(ADVERTISING_MANAGER_INTERFACE)
+        await iface.call_register_advertisement(advertisement.path, {})  # type: ignore
+        self.advertising_changed(adapter)
 
-        self.bus.export(advertisement.path, advertisement)
+    async def update_advertising(
+        self,
+        adapter: ProxyObject,
+        advertisement_data: BlessAdvertisementData,
+        swap: bool = False,
+    ):
+        """
+        Update the payload of the live advertisement without stopping it
 
-        iface: ProxyInterface = adapter.get_interface("org.bluez.LEAdvertisingManager1")
-        await iface.call_register_advertisement(advertisement.path, {})  # type: ignore
+        By default the advertisement object is mutated in place and BlueZ is
+        notified through PropertiesChanged. When swap is True, a replacement
+        advertisement is registered before the current one is released so that
+        there is no gap in advertising. This requires a free advertising
+        instance on the adapter.
+
+        Parameters
+        ----------
+        adapter : ProxyObject
+            The adapter object that is advertising
+        advertisement_data : BlessAdvertisementData
+            The fields of the advertisement to change. Fields that are None
+            are left as they are
+        swap : bool
+            Whether to replace the advertisement rather than mutating it
+        """
+        advertisements: List[BlueZLEAdvertisement] = self.advertisements_on(adapter)
+        if len(advertisements) == 0:
+            raise BlessError("Cannot update advertisement: not advertising")
+
+        current: BlueZLEAdvertisement = advertisements[-1]
+        if (
+            advertisement_data.local_name is not None
+            and advertisement_data.local_name != current._local_name
+        ):
+            await self.set_name(adapter, advertisement_data.local_name)
+
+        if not swap:
+            changed: Dict[str, Any] = current.set_advertisement_data(
+                advertisement_data
+            )
+            if changed:
+                current.emit_properties_changed(changed_properties=changed)
+            return
+
+        replacement: BlueZLEAdvertisement = self._new_advertisement(None)
+        replacement._type = current._type
+        replacement._local_name = current._local_name
+        replacement._service_uuids = list(current._service_uuids)
+        replacement._manufacturer_data = dict(current._manufacturer_data)
+        replacement._service_data = dict(current._service_data)
+        replacement._tx_power = current._tx_power
+        replacement._min_interval = current._min_interval
+        replacement._max_interval = current._max_interval
+        replacement.set_advertisement_data(advertisement_data)
+        self.bus.export(replacement.path, replacement)
+
+        iface: ProxyInterface = adapter.get_interface(ADVERTISING_MANAGER_INTERFACE)
+        await iface.call_register_advertisement(replacement.path, {})  # type: ignore
+        self.advertisements[self.advertisements.index(current)] = replacement
+        self._advertisement_adapters[replacement.path] = adapter.path
+        del self._advertisement_adapters[current.path]
+        await iface.call_unregister_advertisement(current.path)  # type: ignore
+        self.advertising_changed(adapter)
+        self.bus.unexport(current.path)
+
+    def advertisements_on(self, adapter: ProxyObject) -> List[BlueZLEAdvertisement]:
+        """
+        The application's advertisements registered on an adapter
+
+        Parameters
+        ----------
+        adapter : ProxyObject
+            The adapter
+
+        Returns
+        -------
+        List[BlueZLEAdvertisement]
+            The advertisements, oldest first
+        """
+        return [
+            advertisement
+            for advertisement in self.advertisements
+            if self._advertisement_adapters.get(advertisement.path) == adapter.path
+        ]
+
+    def _new_advertisement(
+        self,
+        advertisement_data: Optional[BlessAdvertisementData],
+        advertising_type: Type = Type.PERIPHERAL,
+    ) -> BlueZLEAdvertisement:
+        """
+        Create an advertisement object with a unique path, populated from the
+        advertisement payload or with the application defaults
+
+        Parameters
+        ----------
+        advertisement_data : Optional[BlessAdvertisementData]
+            Optional advertisement payload to populate the advertisement with
+        advertising_type : Type
+            The type of advertisement
+
+        Returns
+        -------
+        BlueZLEAdvertisement
+            The new, not yet exported, advertisement
+        """
+        self._advertisement_index += 1
+        advertisement: BlueZLEAdvertisement = self.engine.interface(
+            BlueZLEAdvertisement
+        )(
+            advertising_type, self._advertisement_index, self
+        )
+        advertisement.set_advertisement_data(advertisement_data)
+        if (
+            advertisement_data is None or advertisement_data.service_uuids is None
+        ) and len(self.services) > 0:
+            # Only add the first UUID
+            advertisement._service_uuids.append(self.services[0].UUID)
+        return advertisement
 
     async def is_advertising(self, adapter: ProxyObject) -> bool:
         """
@@ -213,13 +505,21 @@ class BlueZGattApplication(ServiceInterface):
         bool
             Whether the adapter is advertising anything
         """
+        properties: Optional[BlueZAdapterProperties] = self.adapter_properties.get(
+            adapter.path
+        )
+        if properties is not None:
+            active: int = await properties.get(
+                ADVERTISING_MANAGER_INTERFACE, "ActiveInstances"
+            )
+            return active > 0
         iface: ProxyInterface = adapter.get_interface(defs.PROPERTIES_INTERFACE)
-        instances: Variant = await iface.call_get(  # type: ignore
-            "org.bluez.LEAdvertisingManager1", "ActiveInstances"
+        instances: Any = await iface.call_get(  # type: ignore
+            ADVERTISING_MANAGER_INTERFACE, "ActiveInstances"
         )
         return instances.value > 0
 
-    async def stop_advertising(self, adapter: ProxyObject):
+    async def stop_advertising(self, adapter: ProxyObject, clear_name: bool = True):
         """
         Stop Advertising
 
@@ -227,12 +527,29 @@ class BlueZGattApplication(ServiceInterface):
         ----------
         adapter : ProxyObject
             The adapter object to stop advertising
+        clear_name : bool
+            Whether to clear the adapter's alias too. Centrals that are still
+            connected read the alias as the device name
         """
-        await self.set_name(adapter, "")
-        advertisement: BlueZLEAdvertisement = self.advertisements.pop()
-        iface: ProxyInterface = adapter.get_interface("org.bluez.LEAdvertisingManager1")
-        await iface.call_unregister_advertisement(advertisement.path)  # type: ignore
-        self.bus.unexport(advertisement.path)
+        iface: ProxyInterface = adapter.get_interface(ADVERTISING_MANAGER_INTERFACE)
+
+        async def unregister(advertisement: BlueZLEAdvertisement):
+            self.advertisements.remove(advertisement)
+            del self._advertisement_adapters[advertisement.path]
+            await iface.call_unregister_advertisement(  # type: ignore
+                advertisement.path
+            )
+            self.advertising_changed(adapter)
+            self.bus.unexport(advertisement.path)
+
+        # The alias and the advertisements are independent, so the calls are
+        # made together
+        calls: List[Awaitable[Any]] = [
+            unregister(a) for a in reversed(self.advertisements_on(adapter))
+        ]
+        if clear_name:
+            calls.insert(0, self.set_name(adapter, ""))
+        await asyncio.gather(*calls)
 
     async def is_connected(self) -> bool:
         """
@@ -259,3 +576,70 @@ class BlueZGattApplication(ServiceInterface):
         o : A service or characteristic to register
         """
         self.bus.export(o.path, o)
+        if isinstance(o, BlueZGattCharacteristic):
+            self._characteristics[o.path] = o
+
+    def _read_value_handler(self, message: Any) -> bool:
+        """
+        Serve ReadValue calls ahead of the bus's reflective dispatch, replying
+        with a pre-serialised message
+
+        Parameters
+        ----------
+        message : Message
+            Any message received by the bus
+
+        Returns
+        -------
+        bool
+            Whether the message was a ReadValue call for one of our
+            characteristics, which is then answered asynchronously
+        """
+        if (
+            message.member != "ReadValue"
+            or message.message_type != self.engine.MessageType.METHOD_CALL
+            or message.interface != defs.GATT_CHARACTERISTIC_INTERFACE
+            or message.signature != "a{sv}"
+        ):
+            return False
+        characteristic: Optional[BlueZGattCharacteristic] = self._characteristics.get(
+            message.path
+        )
+        if characteristic is None:
+            return False
+        read: asyncio.Future = asyncio.ensure_future(
+            self._reply_value(characteristic, message)
+        )
+        self._reads.add(read)
+        read.add_done_callback(self._reads.discard)
+        return True
+
+    async def _reply_value(self, characteristic: BlueZGattCharacteristic, message: Any):
+        reply: Any = None
+        try:
+            # The undecorated method, which returns the value
+            value: Any = await BlueZGattCharacteristic.ReadValue(
+                characteristic, message.body[0]
+            )
+        except self.engine.DBusError as e:
+            reply = self.engine.Message.new_error(message, e.type, e.text)
+        except Exception as e:
+            logger.error("ReadValue failed", exc_info=e)
+            reply = self.engine.Message.new_error(
+                message,
+                self.engine.ErrorType.SERVICE_ERROR,
+                "The service interface raised an error: {}".format(type(e).__name__),
+            )
+        if message.flags & self.engine.MessageFlag.NO_REPLY_EXPECTED:
+            return
+        if reply is None and not self.engine.fast_path:
+            reply = self.engine.Message.new_method_return(message, "ay", [bytes(value)])
+        if reply is not None:
+            self.bus.send(reply)
+        else:
+            write(
+                self.bus,
+                value_reply(
+                    self.bus.next_serial(), message.serial, message.sender, bytes(value)
+                ),
+            )
@@ -0,0 +1,212 @@
+import asyncio
+import logging
+
+from typing import Callable, Dict, List, Optional, Set, TYPE_CHECKING
+
+from dbus_next.aio import ProxyObject  # type: ignore
+
+from bless.exceptions import BlessError
+from bless.backends.advertisement import BlessAdvertisementData
+from bless.backends.bluezdbus.dbus.advertisement import (  # type: ignore
+    BlueZLEAdvertisement,
+)
+
+if TYPE_CHECKING:
+    from bless.backends.bluezdbus.dbus.application import (  # type: ignore
+        BlueZGattApplication,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+class BlueZAdapterBalancer:
+    """
+    Spreads the centrals of one application over several adapters
+
+    The application is advertised only on the adapters with the fewest
+    connected centrals, so that the next central to connect lands on the
+    least-loaded controller. The advertisements are moved whenever a central
+    connects or disconnects. With a single adapter it is always advertised.
+    """
+
+    def __init__(
+        self,
+        app: "BlueZGattApplication",
+        adapters: List[ProxyObject],
+        connections: Callable[[ProxyObject], int],
+    ):
+        """
+        Parameters
+        ----------
+        app : BlueZGattApplication
+            The application to advertise
+        adapters : List[ProxyObject]
+            The adapters the application is registered with
+        connections : Callable[[ProxyObject], int]
+            Returns the number of centrals connected to an adapter
+        """
+        self.app: "BlueZGattApplication" = app
+        self.adapters: List[ProxyObject] = adapters
+        self.connections: Callable[[ProxyObject], int] = connections
+
+        self.advertisement_data: Optional[BlessAdvertisementData] = None
+        self._advertising: Set[str] = set()
+        # Advertisements exported by prepare, by adapter path
+        self._prepared: Dict[str, BlueZLEAdvertisement] = {}
+        self._running: bool = False
+        self._balancing: bool = False
+        self._dirty: bool = False
+        self._tasks: Set[asyncio.Future] = set()
+
+    @property
+    def advertising_adapters(self) -> List[ProxyObject]:
+        """The adapters the application is currently advertised on"""
+        return [a for a in self.adapters if a.path in self._advertising]
+
+    def least_loaded(self) -> List[ProxyObject]:
+        """
+        Determine which adapters should advertise
+
+        Returns
+        -------
+        List[ProxyObject]
+            The adapters with the fewest connected centrals
+        """
+        loads: List[int] = [self.connections(a) for a in self.adapters]
+        fewest: int = min(loads)
+        return [a for a, load in zip(self.adapters, loads) if load == fewest]
+
+    async def prepare(self, advertisement_data: Optional[BlessAdvertisementData]):
+        """
+        Set the alias and export the advertisements of the adapters that start
+        will advertise on, e.g. while the application is being registered
+
+        Parameters
+        ----------
+        advertisement_data : Optional[BlessAdvertisementData]
+            The payload to advertise on every adapter
+        """
+        self.advertisement_data = advertisement_data
+        adapters: List[ProxyObject] = [
+            a
+            for a in self.least_loaded()
+            if a.path not in self._prepared and a.path not in self._advertising
+        ]
+        advertisements: List[BlueZLEAdvertisement] = await asyncio.gather(
+            *[self.app.prepare_advertising(a, advertisement_data) for a in adapters]
+        )
+        for adapter, advertisement in zip(adapters, advertisements):
+            self._prepared[adapter.path] = advertisement
+
+    async def start(self, advertisement_data: Optional[BlessAdvertisementData]):
+        """
+        Begin advertising on the least-loaded adapters, registering the
+        advertisements prepared for them if the payload is the same
+
+        Parameters
+        ----------
+        advertisement_data : Optional[BlessAdvertisementData]
+            The payload to advertise on every adapter
+        """
+        if advertisement_data is not self.advertisement_data:
+            self._discard_prepared()
+        self.advertisement_data = advertisement_data
+        self._running = True
+        await self.balance()
+
+    async def stop(self):
+        """
+        Stop advertising on every adapter
+        """
+        self._running = False
+        for task in list(self._tasks):
+            task.cancel()
+        self._discard_prepared()
+        adapters: List[ProxyObject] = self.advertising_adapters
+        self._advertising.clear()
+        await asyncio.gather(*[self.app.stop_advertising(a) for a in adapters])
+
+    async def update(self, advertisement_data: BlessAdvertisementData, swap: bool):
+        """
+        Change the payload on every advertising adapter, and on the adapters
+        that begin advertising later
+
+        Parameters
+        ----------
+        advertisement_data : BlessAdvertisementData
+            The advertisement fields to change
+        swap : bool
+            Whether to replace the advertisements rather than mutating them
+        """
+        if not self._running:
+            raise BlessError("Cannot update advertisement: not advertising")
+        self.advertisement_data = (
+            self.advertisement_data.merge(advertisement_data)
+            if self.advertisement_data is not None
+            else advertisement_data
+        )
+        for adapter in self.advertising_adapters:
+            await self.app.update_advertising(adapter, advertisement_data, swap=swap)
+
+    def request(self):
+        """
+        Rebalance in the background, e.g. after a central connected or
+        disconnected. Must be called on the loop that owns the D-Bus connection
+        """
+        if not self._running or len(self.adapters) < 2:
+            return
+        task: asyncio.Future = asyncio.ensure_future(self._balance_in_background())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _balance_in_background(self):
+        try:
+            await self.balance()
+        except Exception:
+            logger.exception("Failed to move the advertisements")
+
+    async def balance(self):
+        """
+        Move the advertisements to the least-loaded adapters. Calls made while
+        a rebalance is in flight are folded into one more pass
+        """
+        self._dirty = True
+        if self._balancing:
+            return
+        self._balancing = True
+        try:
+            while self._dirty and self._running:
+                self._dirty = False
+                await self._reconcile()
+        finally:
+            self._balancing = False
+
+    async def _reconcile(self):
+        desired: List[ProxyObject] = self.least_loaded()
+        # Start before stopping so that the application is never unadvertised
+        await asyncio.gather(
+            *[self._start(a) for a in desired if a.path not in self._advertising]
+        )
+        self._discard_prepared()
+        for adapter in self.advertising_adapters:
+            if adapter not in desired:
+                logger.debug("Moving the advertisement off {}".format(adapter.path))
+                self._advertising.discard(adapter.path)
+                await self.app.stop_advertising(adapter, clear_name=False)
+
+    async def _start(self, adapter: ProxyObject):
+        prepared: Optional[BlueZLEAdvertisement] = self._prepared.pop(
+            adapter.path, None
+        )
+        if prepared is None:
+            await self.app.start_advertising(adapter, self.advertisement_data)
+        else:
+            await self.app.register_advertisement(adapter, prepared)
+        self._advertising.add(adapter.path)
+
+    def _discard_prepared(self):
+        # Prepared for an adapter that is no longer the least loaded, or for
+        # another payload
+        for advertisement in self._prepared.values():
+            self.app.bus.unexport(advertisement.path)
+        self._prepared.clear()
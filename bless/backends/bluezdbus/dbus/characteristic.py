@@ -1,14 +1,21 @@
+import inspect
+
 from enum import Enum
+from functools import lru_cache
 
 import bleak.backends.bluezdbus.defs as defs  # type: ignore
 
-from typing import List, TYPE_CHECKING, Any, Dict
+from typing import List, Optional, Tuple, TYPE_CHECKING, Any, Dict
 
-from dbus_next.service import ServiceInterface, method, dbus_property  # type: ignore
-from dbus_next.constants import PropertyAccess  # type: ignore
-from dbus_next.signature import Variant  # type: ignore
+from bless.backends.bluezdbus.dbus.engine import (
+    DBusInterface,
+    PropertyAccess,
+    method,
+    dbus_property,
+)
 
 from .descriptor import BlueZGattDescriptor, DescriptorFlags  # type: ignore
+from .fastpath import ValueChangedSignal  # type: ignore
 
 if TYPE_CHECKING:
     from bless.backends.bluezdbus.dbus.service import (  # type: ignore # noqa: F401
@@ -32,13 +39,33 @@ class Flags(Enum):
     ENCRYPT_AUTHENTICATED_WRITE = "encrypt-authenticated-write"
 
 
-class BlueZGattCharacteristic(ServiceInterface):
+@lru_cache(maxsize=None)
+def _flag_names(flags: Tuple[Flags, ...]) -> List[str]:
+    # Objects with the same flags share the list
+    return [flag.value for flag in flags]
+
+
+class BlueZGattCharacteristic(DBusInterface):
     """
     org.bluez.GattCharacteristic1 interface implementation
     """
 
     interface_name: str = defs.GATT_CHARACTERISTIC_INTERFACE
 
+    __slots__ = ()
+    # The instance attributes, made slots on the ported class
+    _slots: Tuple[str, ...] = (
+        "path",
+        "_uuid",
+        "_flags",
+        "_service_path",
+        "_service",
+        "_value",
+        "_notifying",
+        "descriptors",
+        "_value_signal",
+    )
+
     def __init__(
         self,
         uuid: str,
@@ -63,7 +90,7 @@ class BlueZGattCharacteristic(ServiceInterface):
         """
         self.path: str = service.path + "/char" + f"{index:04d}"
         self._uuid: str = uuid
-        self._flags: List[str] = [x.value for x in flags]
+        self._flags: List[str] = _flag_names(tuple(flags))
         self._service_path: str = service.path  # noqa: F821
         self._service: "BlueZGattService" = service  # noqa: F821
 
@@ -73,6 +100,9 @@ class BlueZGattCharacteristic(ServiceInterface):
             or "indicate" in self._flags
         )
         self.descriptors: List["BlueZGattDescriptor"] = []  # noqa: F821
+        # Laid out on the first notification, most characteristics never send
+        # one
+        self._value_signal: Optional[ValueChangedSignal] = None
 
         super(BlueZGattCharacteristic, self).__init__(self.interface_name)
 
@@ -91,9 +121,15 @@ class BlueZGattCharacteristic(ServiceInterface):
     @Value.setter  # type: ignore
     def Value(self, value: "ay"):  # type: ignore # noqa: F821 N802
         self._value = value
-        self.emit_properties_changed(
-            changed_properties={"Value": self._value}
-        )
+        if not self.engine.fast_path:
+            self.emit_properties_changed(changed_properties={"Value": value})
+            return
+        # Notifications are the hot path, so the PropertiesChanged signal is
+        # written pre-serialised rather than through emit_properties_changed
+        for bus in self.engine.ServiceInterface._get_buses(self):
+            if self._value_signal is None:
+                self._value_signal = ValueChangedSignal(self.path)
+            self._value_signal.send(bus, bytes(value))
 
     @dbus_property(access=PropertyAccess.READ)
     def Notifying(self) -> "b":  # type: ignore # noqa: F821 N802
@@ -104,10 +140,11 @@ class BlueZGattCharacteristic(ServiceInterface):
         return self._flags
 
     @method()  # noqa: F722
-    def ReadValue(self, options: "a{sv}") -> "ay":  # type: ignore # noqa: F722 F821 N802 E501
+    async def ReadValue(self, options: "a{sv}") -> "ay":  # type: ignore # noqa: F722 F821 N802 E501
         """
         Read the value of the characteristic.
-        This is to be fully implemented at the application level
+        This is to be fully implemented at the application level, which may
+        return the value or an awaitable of it
 
         Parameters
         ----------
@@ -122,13 +159,17 @@ class BlueZGattCharacteristic(ServiceInterface):
         f = self._service.app.Read
         if f is None:
             raise NotImplementedError()
-        return f(self, options)
+        value: Any = f(self, options)
+        if inspect.isawaitable(value):
+            value = await value
+        return value
 
     @method()  # noqa: F722
-    def WriteValue(self, value: "ay", options: "a{sv}"):  # type: ignore # noqa
+    async def WriteValue(self, value: "ay", options: "a{sv}"):  # type: ignore # noqa
         """
         Write a value to the characteristic
-        This is to be fully implemented at the application level
+        This is to be fully implemented at the application level, which may
+        return an awaitable
 
         Parameters
         ----------
@@ -140,7 +181,9 @@ class BlueZGattCharacteristic(ServiceInterface):
         f = self._service.app.Write
         if f is None:
             raise NotImplementedError()
-        f(self, value, options)
+        result: Any = f(self, value, options)
+        if inspect.isawaitable(result):
+            await result
 
     @method()
     def StartNotify(self):  # noqa: N802
@@ -150,8 +193,8 @@ class BlueZGattCharacteristic(ServiceInterface):
         f = self._service.app.StartNotify
         if f is None:
             raise NotImplementedError()
-        f(None)
         self._service.app.subscribed_characteristics.append(self._uuid)
+        f(self)
 
     @method()
     def StopNotify(self):  # noqa: N802
@@ -161,8 +204,19 @@ class BlueZGattCharacteristic(ServiceInterface):
         f = self._service.app.StopNotify
         if f is None:
             raise NotImplementedError()
-        f(None)
-        self._service.app.subscribed_characteristics.remove(self._uuid)
+        # Already dropped if bluetoothd went away in between
+        if self._uuid in self._service.app.subscribed_characteristics:
+            self._service.app.subscribed_characteristics.remove(self._uuid)
+        f(self)
+
+    @method()
+    def Confirm(self):  # noqa: N802
+        """
+        Called by BlueZ when a central confirms an indication
+        """
+        f = self._service.app.Confirm
+        if f is not None:
+            f(self)
 
     async def add_descriptor(
         self, uuid: str, flags: List[DescriptorFlags], value: Any
@@ -180,7 +234,7 @@ class BlueZGattCharacteristic(ServiceInterface):
             The descriptor's value
         """
         index: int = len(self.descriptors) + 1
-        descriptor: BlueZGattDescriptor = BlueZGattDescriptor(
+        descriptor: BlueZGattDescriptor = self.engine.interface(BlueZGattDescriptor)(
             uuid, flags, index, self
         )
         descriptor._value = value  # type: ignore
@@ -199,5 +253,5 @@ class BlueZGattCharacteristic(ServiceInterface):
             The dictionary that describes the characteristic
         """
         return {
-            "UUID": Variant('s', self._uuid)
+            "UUID": self.engine.Variant('s', self._uuid)
         }
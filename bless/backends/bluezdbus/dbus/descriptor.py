@@ -1,16 +1,16 @@
 from enum import Enum
+from functools import lru_cache
 
 import bleak.backends.bluezdbus.defs as defs  # type: ignore
 
-from typing import List, Dict, TYPE_CHECKING
+from typing import List, Dict, Tuple, TYPE_CHECKING
 
-from dbus_next.service import (  # type: ignore
-    ServiceInterface,
+from bless.backends.bluezdbus.dbus.engine import (
+    DBusInterface,
+    PropertyAccess,
     method,
     dbus_property,
 )
-from dbus_next.constants import PropertyAccess  # type: ignore
-from dbus_next.signature import Variant  # type: ignore
 
 if TYPE_CHECKING:
     from bless.backends.bluezdbus.dbus.characteristic import (
@@ -28,13 +28,30 @@ class DescriptorFlags(Enum):
     AUTHORIZE = "authorize"
 
 
-class BlueZGattDescriptor(ServiceInterface):
+@lru_cache(maxsize=None)
+def _flag_names(flags: Tuple[DescriptorFlags, ...]) -> List[str]:
+    # Objects with the same flags share the list
+    return [flag.value for flag in flags]
+
+
+class BlueZGattDescriptor(DBusInterface):
     """
     org.bluez.GattDescriptor1 interface implementation
     """
 
     interface_name: str = defs.GATT_DESCRIPTOR_INTERFACE
 
+    __slots__ = ()
+    # The instance attributes, made slots on the ported class
+    _slots: Tuple[str, ...] = (
+        "path",
+        "_uuid",
+        "_flags",
+        "_characteristic_path",
+        "_characteristic",
+        "_value",
+    )
+
     def __init__(
         self,
         uuid: str,
@@ -59,7 +76,7 @@ class BlueZGattDescriptor(ServiceInterface):
         """
         self.path: str = characteristic.path + "/desc" + f"{index:04d}"
         self._uuid: str = uuid
-        self._flags: List[str] = [x.value for x in flags]
+        self._flags: List[str] = _flag_names(tuple(flags))
         self._characteristic_path: str = characteristic.path  # noqa: F821
         self._characteristic: "BlueZGattCharacteristic" = characteristic  # noqa: F821
 
@@ -134,5 +151,5 @@ class BlueZGattDescriptor(ServiceInterface):
             The dictionary that describes the descriptor
         """
         return {
-            "UUID": Variant('s', self._uuid)
+            "UUID": self.engine.Variant('s', self._uuid)
         }
@@ -0,0 +1,190 @@
+import asyncio
+import logging
+
+import bleak.backends.bluezdbus.defs as defs  # type: ignore
+
+from typing import Any, Callable, Dict, Optional, Set
+
+from bless.backends.bluezdbus.dbus.utils import SignalFollower
+
+logger = logging.getLogger(__name__)
+
+DEVICE_INTERFACE: str = "org.bluez.Device1"
+
+
+def device_address(path: str) -> str:
+    """
+    Derive the Bluetooth address from a BlueZ device object path
+
+    Parameters
+    ----------
+    path : str
+        The object path, e.g. /org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF
+
+    Returns
+    -------
+    str
+        The address, e.g. AA:BB:CC:DD:EE:FF
+    """
+    return path.rsplit("/", 1)[-1].replace("dev_", "").replace("_", ":")
+
+
+class BlueZDeviceTracker(SignalFollower):
+    """
+    Tracks the centrals connected to one adapter from org.bluez.Device1
+    signals, so that connection state is a set lookup rather than a D-Bus
+    round trip or a guess from subscriptions. The devices that were connected
+    before start are only known once load_connected has run
+
+    Listeners are called with the device path and its new connection state,
+    e.g. by the servers sharing the tracker
+    """
+
+    def __init__(
+        self,
+        bus: Any,
+        adapter_path: str,
+        on_change: Optional[Callable[[str, bool], None]] = None,
+    ):
+        """
+        Parameters
+        ----------
+        bus : MessageBus
+            The connected system bus
+        adapter_path : str
+            The object path of the adapter whose devices to track
+        on_change : Optional[Callable[[str, bool], None]]
+            Called with the device path and its new connection state whenever
+            a device connects or disconnects. More callbacks can be added with
+            add_listener, e.g. by the servers sharing the tracker
+        """
+        super(BlueZDeviceTracker, self).__init__(
+            bus,
+            [
+                (
+                    "type='signal',sender='{}',interface='{}',"
+                    "member='PropertiesChanged',arg0='{}',path_namespace='{}'"
+                ).format(
+                    defs.BLUEZ_SERVICE,
+                    defs.PROPERTIES_INTERFACE,
+                    DEVICE_INTERFACE,
+                    adapter_path,
+                ),
+                (
+                    "type='signal',sender='{}',interface='{}',"
+                    "member='InterfacesAdded'"
+                ).format(defs.BLUEZ_SERVICE, defs.OBJECT_MANAGER_INTERFACE),
+                (
+                    "type='signal',sender='{}',interface='{}',"
+                    "member='InterfacesRemoved'"
+                ).format(defs.BLUEZ_SERVICE, defs.OBJECT_MANAGER_INTERFACE),
+            ],
+        )
+        self.adapter_path: str = adapter_path
+        self.on_change: Optional[Callable[[str, bool], None]] = on_change
+
+        self.connected_devices: Set[str] = set()
+        self._load_task: Optional[asyncio.Task] = None
+        self.loaded: bool = False
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether any central is connected to the adapter"""
+        return len(self.connected_devices) > 0
+
+    async def load_connected(self):
+        """
+        Load the devices that are already connected. This downloads the whole
+        org.bluez object tree, with every device bluetoothd remembers, so it
+        is kept off the start up path. The tree is only downloaded once and
+        concurrent callers share the download
+        """
+        if self.loaded:
+            return
+        if self._load_task is None:
+            self._load_task = asyncio.ensure_future(self._load())
+        try:
+            await asyncio.shield(self._load_task)
+        except Exception:
+            # Let the next caller try again
+            self._load_task = None
+            raise
+
+    async def _load(self):
+        reply: Optional[Any] = await self.bus.call(
+            self.engine.Message(
+                destination=defs.BLUEZ_SERVICE,
+                path="/",
+                interface=defs.OBJECT_MANAGER_INTERFACE,
+                member="GetManagedObjects",
+            )
+        )
+        if (
+            reply is not None
+            and reply.message_type == self.engine.MessageType.METHOD_RETURN
+        ):
+            self.load(reply.body[0])
+        self.loaded = True
+
+    def reset(self):
+        """
+        Report every connected device as disconnected, e.g. when bluetoothd
+        exits and drops the connections without removing the devices
+        """
+        for path in list(self.connected_devices):
+            self._set(path, False)
+
+    def load(self, managed_objects: Dict[str, Dict[str, Dict[str, Any]]]):
+        """
+        Seed the cache from a GetManagedObjects reply
+
+        Parameters
+        ----------
+        managed_objects : Dict[str, Dict[str, Dict[str, Any]]]
+            The object tree as returned by org.bluez
+        """
+        for path, interfaces in managed_objects.items():
+            properties: Optional[Dict[str, Any]] = interfaces.get(DEVICE_INTERFACE)
+            if properties is not None and self._owns(path):
+                self._update(path, properties)
+
+    def _owns(self, path: str) -> bool:
+        return path.startswith(self.adapter_path + "/")
+
+    def _update(self, path: str, properties: Dict[str, Any]):
+        connected: Any = properties.get("Connected")
+        if connected is None:
+            return
+        if isinstance(connected, self.engine.Variant):
+            connected = connected.value
+        self._set(path, bool(connected))
+
+    def _set(self, path: str, connected: bool):
+        if connected == (path in self.connected_devices):
+            return
+        if connected:
+            self.connected_devices.add(path)
+        else:
+            self.connected_devices.discard(path)
+        logger.debug(
+            "Device {} {}".format(
+                path, "connected" if connected else "disconnected"
+            )
+        )
+        if self.on_change is not None:
+            self.on_change(path, connected)
+        self._notify(path, connected)
+
+    def _on_signal(self, message: Any):
+        if message.member == "PropertiesChanged":
+            interface, changed, invalidated = message.body
+            if interface == DEVICE_INTERFACE and self._owns(message.path):
+                self._update(message.path, changed)
+        elif message.member == "InterfacesAdded":
+            path, interfaces = message.body
+            if DEVICE_INTERFACE in interfaces and self._owns(path):
+                self._update(path, interfaces[DEVICE_INTERFACE])
+        elif message.member == "InterfacesRemoved":
+            path, interfaces = message.body
+            if DEVICE_INTERFACE in interfaces:
+                self._set(path, False)
@@ -0,0 +1,269 @@
+import os
+import importlib
+
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    TYPE_CHECKING,
+    cast,
+)
+
+from bless.exceptions import BlessError
+
+if TYPE_CHECKING:
+    # Every engine's ServiceInterface has this API
+    from dbus_next.service import ServiceInterface  # type: ignore
+else:
+    ServiceInterface = object
+
+# The D-Bus libraries the BlueZ backend can run on. dbus_fast is a compiled,
+# API compatible fork of dbus_next
+ENGINES = ("dbus_next", "dbus_fast")
+DEFAULT_ENGINE: str = "dbus_next"
+
+T = TypeVar("T")
+
+
+class PropertyAccess(Enum):
+    READ = "read"
+    WRITE = "write"
+    READWRITE = "readwrite"
+
+
+def method(name: Optional[str] = None, disabled: bool = False) -> Callable[[T], T]:
+    """
+    Mark a method of a DBusInterface as a D-Bus method. Like dbus_next's
+    decorator, the in and out signatures are read from the annotations
+
+    Parameters
+    ----------
+    name : Optional[str]
+        The D-Bus name, the function name if None
+    disabled : bool
+        Whether the method is hidden from the bus
+    """
+
+    def decorator(fn: T) -> T:
+        fn._dbus_method = {"name": name, "disabled": disabled}  # type: ignore
+        return fn
+
+    return decorator
+
+
+class _Property(property):
+    def __init__(
+        self,
+        fget: Callable,
+        access: PropertyAccess,
+        name: Optional[str],
+        disabled: bool,
+        fset: Optional[Callable] = None,
+    ):
+        super(_Property, self).__init__(fget, fset)
+        self.access: PropertyAccess = access
+        self.name: Optional[str] = name
+        self.disabled: bool = disabled
+
+    def setter(self, fset: Callable) -> "_Property":
+        return _Property(
+            cast(Callable, self.fget), self.access, self.name, self.disabled, fset
+        )
+
+
+def dbus_property(
+    access: PropertyAccess = PropertyAccess.READWRITE,
+    name: Optional[str] = None,
+    disabled: bool = False,
+) -> Callable[[Callable], _Property]:
+    """
+    Mark a getter of a DBusInterface as a D-Bus property. The signature is
+    read from the return annotation
+
+    Parameters
+    ----------
+    access : PropertyAccess
+        Whether the property can be read, written or both
+    name : Optional[str]
+        The D-Bus name, the getter name if None
+    disabled : bool
+        Whether the property is hidden from the bus
+    """
+
+    def decorator(fn: Callable) -> _Property:
+        return _Property(fn, access, name, disabled)
+
+    return decorator
+
+
+class DBusInterface(ServiceInterface):
+    """
+    Base of the interfaces bless exports, written once for every engine
+
+    Instantiating a subclass creates an instance of the subclass ported to the
+    default engine. Use DBusEngine.interface to pick the engine instead.
+
+    A subclass that sets ``__slots__ = ()`` and lists its instance attributes
+    in ``_slots`` gets ported classes without an instance dict. Slots can only
+    be added on the ported class, since the ServiceInterface of dbus_fast has
+    its own instance layout.
+    """
+
+    __slots__ = ()
+    _slots: Tuple[str, ...] = ()
+    engine: "DBusEngine"
+
+    def __new__(cls, *args, **kwargs):
+        if "engine" not in cls.__dict__:
+            cls = get_engine().interface(cls)
+        return super(DBusInterface, cls).__new__(cls)
+
+    def __init__(self, name: str):
+        super(DBusInterface, self).__init__(name)
+
+
+class DBusEngine:
+    """
+    The names the BlueZ backend uses from one D-Bus library
+    """
+
+    def __init__(self, name: str):
+        """
+        Parameters
+        ----------
+        name : str
+            One of ENGINES
+        """
+        if name not in ENGINES:
+            raise BlessError(
+                "Unknown D-Bus engine {}, choose one of {}".format(name, ENGINES)
+            )
+        try:
+            aio: Any = importlib.import_module(name + ".aio")
+        except ImportError as e:
+            raise BlessError("The {} engine is not installed".format(name)) from e
+        message_bus: Any = importlib.import_module(name + ".aio.message_bus")
+        service: Any = importlib.import_module(name + ".service")
+        constants: Any = importlib.import_module(name + ".constants")
+        message: Any = importlib.import_module(name + ".message")
+        signature: Any = importlib.import_module(name + ".signature")
+        errors: Any = importlib.import_module(name + ".errors")
+        introspection: Any = importlib.import_module(name + ".introspection")
+
+        self.name: str = name
+        self.MessageBus: Any = aio.MessageBus
+        self.ProxyObject: Any = aio.ProxyObject
+        self.ServiceInterface: Any = service.ServiceInterface
+        self.BusType: Any = constants.BusType
+        self.MessageType: Any = constants.MessageType
+        self.MessageFlag: Any = constants.MessageFlag
+        self.ErrorType: Any = constants.ErrorType
+        self.PropertyAccess: Any = constants.PropertyAccess
+        self.Message: Any = message.Message
+        self.Variant: Any = signature.Variant
+        self.DBusError: Any = errors.DBusError
+        self.Node: Any = introspection.Node
+
+        # Notifications and ReadValue replies are written pre-serialised
+        # through private internals of the library. They are checked once, so
+        # that a release without them falls back to the public API
+        self.fast_path: bool = hasattr(self.ServiceInterface, "_get_buses") and (
+            hasattr(getattr(message_bus, "_MessageWriter", None), "schedule_write")
+        )
+
+        self._method: Any = service.method
+        self._dbus_property: Any = service.dbus_property
+        self._interfaces: Dict[type, type] = {}
+
+    def interface(self, cls: Type[T]) -> Type[T]:
+        """
+        Port a DBusInterface subclass to this engine
+
+        Parameters
+        ----------
+        cls : Type[DBusInterface]
+            The interface
+
+        Returns
+        -------
+        Type[DBusInterface]
+            A subclass of cls and of the engine's ServiceInterface, created once
+        """
+        ported: Optional[type] = self._interfaces.get(cls)
+        if ported is not None:
+            return ported  # type: ignore
+        namespace: Dict[str, Any] = {
+            "engine": self,
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+        }
+        slots: List[str] = []
+        # Walk from the base so that overrides win
+        for klass in reversed(cls.__mro__):
+            slots.extend(vars(klass).get("_slots", ()))
+            for attribute, member in vars(klass).items():
+                if isinstance(member, _Property):
+                    ported_property: Any = self._dbus_property(
+                        access=self.PropertyAccess(member.access.value),
+                        name=member.name,
+                        disabled=member.disabled,
+                    )(member.fget)
+                    if member.fset is not None:
+                        ported_property = ported_property.setter(member.fset)
+                    namespace[attribute] = ported_property
+                elif callable(member) and hasattr(member, "_dbus_method"):
+                    namespace[attribute] = self._method(**member._dbus_method)(member)
+        if all("__slots__" in vars(klass) for klass in cls.__mro__[:-1]):
+            namespace["__slots__"] = tuple(dict.fromkeys(slots))
+        ported = type(cls.__name__, (cls, self.ServiceInterface), namespace)
+        self._interfaces[cls] = ported
+        return ported  # type: ignore
+
+    def __repr__(self) -> str:
+        return "DBusEngine({!r})".format(self.name)
+
+
+_engines: Dict[str, DBusEngine] = {}
+
+
+def get_engine(name: Optional[str] = None) -> DBusEngine:
+    """
+    Parameters
+    ----------
+    name : Optional[str]
+        One of ENGINES. If None, the BLESS_DBUS_ENGINE environment variable,
+        or dbus_next if it is not set
+
+    Returns
+    -------
+    DBusEngine
+        The engine, created once per name
+    """
+    if name is None:
+        name = os.environ.get("BLESS_DBUS_ENGINE", DEFAULT_ENGINE)
+    engine: Optional[DBusEngine] = _engines.get(name)
+    if engine is None:
+        engine = _engines[name] = DBusEngine(name)
+    return engine
+
+
+def engine_of(bus: Any) -> DBusEngine:
+    """
+    Parameters
+    ----------
+    bus : MessageBus
+        A bus of any engine
+
+    Returns
+    -------
+    DBusEngine
+        The engine the bus belongs to, the default engine for anything else
+    """
+    name: str = type(bus).__module__.split(".")[0]
+    return get_engine(name if name in ENGINES else None)
@@ -0,0 +1,257 @@
+import struct
+
+from functools import lru_cache
+
+import bleak.backends.bluezdbus.defs as defs  # type: ignore
+
+from typing import Any, List, Tuple
+
+# D-Bus wire constants, see
+# https://dbus.freedesktop.org/doc/dbus-specification.html#message-protocol
+LITTLE_ENDIAN: bytes = b"l"
+PROTOCOL_VERSION: int = 1
+METHOD_RETURN: int = 2
+SIGNAL: int = 4
+
+HEADER_PATH: int = 1
+HEADER_INTERFACE: int = 2
+HEADER_MEMBER: int = 3
+HEADER_REPLY_SERIAL: int = 5
+HEADER_DESTINATION: int = 6
+HEADER_SIGNATURE: int = 8
+
+_U32: struct.Struct = struct.Struct("<I")
+_U32_PAIR: struct.Struct = struct.Struct("<II")
+
+
+class _Marshaller:
+    """
+    Just enough of the D-Bus marshalling rules to lay out the fixed parts of
+    a message once
+    """
+
+    def __init__(self, offset: int = 0):
+        self.data: bytearray = bytearray()
+        # The position of data[0] in the message, for alignment
+        self.offset: int = offset
+
+    def align(self, n: int):
+        self.data += bytes(-(self.offset + len(self.data)) % n)
+
+    def byte(self, value: int):
+        self.data.append(value)
+
+    def u32(self, value: int):
+        self.align(4)
+        self.data += _U32.pack(value)
+
+    def string(self, value: str):
+        encoded: bytes = value.encode()
+        self.u32(len(encoded))
+        self.data += encoded + b"\x00"
+
+    def signature(self, value: str):
+        self.byte(len(value))
+        self.data += value.encode() + b"\x00"
+
+    def field(self, code: int, signature: str, value: Any):
+        self.align(8)
+        self.byte(code)
+        self.signature(signature)
+        if signature == "u":
+            self.u32(value)
+        elif signature == "g":
+            self.signature(value)
+        else:
+            self.string(value)
+
+
+def _header_fields(fields: List[Tuple[int, str, Any]]) -> bytes:
+    """
+    The header field array, from its length to the padding before the body
+    """
+    marshaller: _Marshaller = _Marshaller(16)
+    for field in fields:
+        marshaller.field(*field)
+    length: int = len(marshaller.data)
+    marshaller.align(8)
+    return _U32.pack(length) + bytes(marshaller.data)
+
+
+class SerializedMessage:
+    """
+    An already marshalled message. The bus writers of both engines accept it in
+    place of a Message, since all they do with one is marshall it
+    """
+
+    __slots__ = ("data", "unix_fds")
+
+    def __init__(self, data: bytes):
+        self.data: bytes = data
+        self.unix_fds: List[int] = []
+
+    def _marshall(self, negotiate_unix_fd: bool = False) -> bytes:
+        return self.data
+
+
+def write(bus: Any, data: bytes):
+    """
+    Queue a marshalled message on the bus, bypassing Message and the
+    marshaller. The serial in data must come from bus.next_serial()
+
+    Parameters
+    ----------
+    bus : MessageBus
+        The connected bus, of either engine
+    data : bytes
+        The complete message
+    """
+    bus._writer.schedule_write(SerializedMessage(data))
+
+
+class _ValueChangedBody:
+    """
+    The parts of the signal body that only depend on the interface, shared by
+    every object path of that interface
+    """
+
+    __slots__ = ("before_dict", "entries_start", "entry", "value_start")
+
+    def __init__(self, interface: str):
+        # Body: interface, then a{sv} with the single "Value" entry, then an
+        # empty as. The body starts 8 aligned, so offsets within it suffice
+        before_dict: _Marshaller = _Marshaller()
+        before_dict.string(interface)
+        before_dict.align(4)
+        self.before_dict: bytes = bytes(before_dict.data)
+
+        entry: _Marshaller = _Marshaller(len(self.before_dict) + 4)
+        entry.align(8)
+        self.entries_start: int = entry.offset + len(entry.data)
+        entry.string("Value")
+        entry.signature("ay")
+        entry.align(4)
+        self.entry: bytes = bytes(entry.data)
+        # Where the array length of the value goes, the bytes follow it
+        self.value_start: int = entry.offset + len(entry.data) + 4
+
+
+_SIGNAL_HEAD: bytes = LITTLE_ENDIAN + bytes([SIGNAL, 0, PROTOCOL_VERSION])
+
+
+@lru_cache(maxsize=None)
+def _value_changed_body(interface: str) -> _ValueChangedBody:
+    return _ValueChangedBody(interface)
+
+
+class ValueChangedSignal:
+    """
+    The PropertiesChanged signal BlueZ turns into a notification, laid out once
+    per object path so that sending one only packs the serial and lengths around
+    the new value
+    """
+
+    __slots__ = ("_fields", "_body")
+
+    def __init__(self, path: str, interface: str = defs.GATT_CHARACTERISTIC_INTERFACE):
+        """
+        Parameters
+        ----------
+        path : str
+            The path of the characteristic or descriptor
+        interface : str
+            The interface whose Value changed
+        """
+        self._fields: bytes = _header_fields(
+            [
+                (HEADER_PATH, "o", path),
+                (HEADER_INTERFACE, "s", defs.PROPERTIES_INTERFACE),
+                (HEADER_MEMBER, "s", "PropertiesChanged"),
+                (HEADER_SIGNATURE, "g", "sa{sv}as"),
+            ]
+        )
+        self._body: _ValueChangedBody = _value_changed_body(interface)
+
+    def marshall(self, serial: int, value: bytes) -> bytes:
+        """
+        Parameters
+        ----------
+        serial : int
+            The message serial
+        value : bytes
+            The new value
+
+        Returns
+        -------
+        bytes
+            The signal
+        """
+        body: _ValueChangedBody = self._body
+        length: int = len(value)
+        end: int = body.value_start + length
+        padding: int = -end % 4
+        return b"".join(
+            (
+                _SIGNAL_HEAD,
+                _U32_PAIR.pack(end + padding + 4, serial),
+                self._fields,
+                body.before_dict,
+                _U32.pack(end - body.entries_start),
+                body.entry,
+                _U32.pack(length),
+                value,
+                bytes(padding + 4),
+            )
+        )
+
+    def send(self, bus: Any, value: bytes):
+        """
+        Parameters
+        ----------
+        bus : MessageBus
+            The bus the path is exported on
+        value : bytes
+            The new value
+        """
+        write(bus, self.marshall(bus.next_serial(), value))
+
+
+def value_reply(
+    serial: int, reply_serial: int, destination: str, value: bytes
+) -> bytes:
+    """
+    The method return of a ReadValue call
+
+    Parameters
+    ----------
+    serial : int
+        The message serial
+    reply_serial : int
+        The serial of the ReadValue call
+    destination : str
+        The sender of the ReadValue call
+    value : bytes
+        The value read
+
+    Returns
+    -------
+    bytes
+        The reply
+    """
+    fields: bytes = _header_fields(
+        [
+            (HEADER_REPLY_SERIAL, "u", reply_serial),
+            (HEADER_DESTINATION, "s", destination),
+            (HEADER_SIGNATURE, "g", "ay"),
+        ]
+    )
+    return b"".join(
+        (
+            LITTLE_ENDIAN,
+            bytes([METHOD_RETURN, 0, PROTOCOL_VERSION]),
+            _U32_PAIR.pack(4 + len(value), serial),
+            fields,
+            _U32.pack(len(value)),
+            value,
+        )
+    )
@@ -0,0 +1,141 @@
+import asyncio
+import concurrent.futures
+import inspect
+import logging
+import threading
+
+from asyncio import AbstractEventLoop
+from typing import Any, Awaitable, Callable, Optional, TypeVar, cast
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BlueZIOThread:
+    """
+    An event loop on its own thread for the D-Bus connection, so that BlueZ
+    requests are answered however busy the application's loop is
+
+    Objects created on this loop, such as the MessageBus and the exported
+    interfaces, must only be used from it: run coroutines with run and plain
+    calls with call_soon.
+    """
+
+    def __init__(self):
+        self.loop: Optional[AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """
+        Start the loop thread, if it is not running yet
+        """
+        if self._thread is not None:
+            return
+        ready: threading.Event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(ready,), name="bless-dbus", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+
+    def stop(self):
+        """
+        Stop the loop and wait for the thread to end
+        """
+        if self._thread is None or self.loop is None:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self._thread = None
+
+    async def run(self, coroutine: Awaitable[T]) -> T:
+        """
+        Run a coroutine on the I/O loop and wait for it from another loop
+
+        Parameters
+        ----------
+        coroutine : Awaitable[T]
+            The coroutine
+
+        Returns
+        -------
+        T
+            Its result
+        """
+        assert self.loop is not None
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coroutine, self.loop)  # type: ignore
+        )
+
+    def call_soon(self, func: Callable[..., Any], *args: Any):
+        """
+        Schedule a plain call on the I/O loop from any thread
+
+        Parameters
+        ----------
+        func : Callable[..., Any]
+            The function
+        *args : Any
+            Its arguments
+        """
+        assert self.loop is not None
+        self.loop.call_soon_threadsafe(func, *args)
+
+    def _run(self, ready: threading.Event):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+            self.loop = None
+
+
+def call_on_loop(
+    loop: AbstractEventLoop, func: Callable[..., T], *args: Any
+) -> "asyncio.Future[T]":
+    """
+    Run a function on another thread's loop. If it returns an awaitable,
+    that is awaited on the other loop too
+
+    Parameters
+    ----------
+    loop : AbstractEventLoop
+        The loop to run func on
+    func : Callable[..., T]
+        The function
+    *args : Any
+        Its arguments
+
+    Returns
+    -------
+    asyncio.Future[T]
+        Its result, awaitable on the calling thread's loop
+    """
+    future: "concurrent.futures.Future[T]" = concurrent.futures.Future()
+
+    def settle(task: "asyncio.Future[T]"):
+        if task.cancelled():
+            future.set_exception(concurrent.futures.CancelledError())
+        elif task.exception() is not None:
+            future.set_exception(cast(BaseException, task.exception()))
+        else:
+            future.set_result(task.result())
+
+    def call():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result: Any = func(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            return
+        if inspect.isawaitable(result):
+            asyncio.ensure_future(result).add_done_callback(settle)
+        else:
+            future.set_result(result)
+
+    loop.call_soon_threadsafe(call)
+    return asyncio.wrap_future(future)
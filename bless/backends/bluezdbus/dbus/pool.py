@@ -0,0 +1,261 @@
+import asyncio
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, TypeVar
+
+from dbus_next.aio import ProxyObject  # type: ignore
+
+from bless.backends.bluezdbus.dbus.adapter import BlueZAdapterProperties
+from bless.backends.bluezdbus.dbus.application import base_path_for
+from bless.backends.bluezdbus.dbus.devices import BlueZDeviceTracker
+from bless.backends.bluezdbus.dbus.engine import DBusEngine, engine_of, get_engine
+from bless.backends.bluezdbus.dbus.io import BlueZIOThread
+from bless.backends.bluezdbus.dbus.utils import get_adapter  # type: ignore
+from bless.backends.bluezdbus.dbus.watcher import BlueZServiceWatcher
+
+T = TypeVar("T")
+
+
+class BlueZBusPool:
+    """
+    Shares one system bus connection, the adapters found on it, their
+    property caches and their device trackers, and the watch on bluetoothd,
+    among the servers of a process
+
+    Without a pool every server opens its own connection and looks its adapter
+    up again. Servers created with the same `bus_pool` keyword argument connect
+    and resolve each adapter once between them, and their applications are
+    exported under distinct paths on the shared connection. The pool belongs
+    to the loop that owns the connection: the I/O thread's if it has one
+    """
+
+    def __init__(
+        self,
+        bus: Any = None,
+        dbus_engine: Optional[str] = None,
+        io_thread: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        bus : Optional[MessageBus]
+            An already connected system bus to share. If None, the pool
+            connects on first use
+        dbus_engine : Optional[str]
+            The D-Bus library to connect with, as for the server. Ignored when
+            a bus is given
+        io_thread : bool
+            Whether the connection is owned by a BlueZIOThread shared by the
+            servers, see BlessServerBlueZDBus
+        """
+        self.engine: DBusEngine = (
+            engine_of(bus) if bus is not None else get_engine(dbus_engine)
+        )
+        self.io_thread: Optional[BlueZIOThread] = None
+        if io_thread:
+            self.io_thread = BlueZIOThread()
+            self.io_thread.start()
+
+        self._bus: Any = bus
+        # A connection given by the caller is theirs to close
+        self._owns_bus: bool = bus is None
+        self._shared: Dict[Hashable, asyncio.Future] = {}
+        self._base_paths: Set[str] = set()
+
+    async def bus(self) -> Any:
+        """
+        The shared connection
+
+        Returns
+        -------
+        MessageBus
+            The system bus, connected by the first caller
+        """
+        if self._bus is None:
+            self._bus = await self._once("bus", self._connect)
+        return self._bus
+
+    async def adapter(self, name: Optional[str] = None) -> ProxyObject:
+        """
+        The proxy of an adapter, looked up once
+
+        Parameters
+        ----------
+        name : Optional[str]
+            The adapter, e.g. "hci1". Defaults to hci0, as for get_adapter
+
+        Returns
+        -------
+        ProxyObject
+            The adapter
+        """
+        bus: Any = await self.bus()
+        name = name if name is not None else "hci0"
+        return await self._once(("adapter", name), lambda: get_adapter(bus, name))
+
+    async def device_tracker(self, adapter_path: str) -> BlueZDeviceTracker:
+        """
+        The started device tracker of an adapter. Servers register their
+        callbacks with its add_listener
+
+        Parameters
+        ----------
+        adapter_path : str
+            The object path of the adapter
+
+        Returns
+        -------
+        BlueZDeviceTracker
+            The tracker shared by every server on the adapter
+        """
+        bus: Any = await self.bus()
+
+        async def start() -> BlueZDeviceTracker:
+            tracker: BlueZDeviceTracker = BlueZDeviceTracker(bus, adapter_path)
+            await tracker.start()
+            return tracker
+
+        return await self._once(("device_tracker", adapter_path), start)
+
+    async def adapter_properties(self, adapter_path: str) -> BlueZAdapterProperties:
+        """
+        The started property cache of an adapter
+
+        Parameters
+        ----------
+        adapter_path : str
+            The object path of the adapter
+
+        Returns
+        -------
+        BlueZAdapterProperties
+            The cache shared by every server on the adapter
+        """
+        bus: Any = await self.bus()
+
+        async def start() -> BlueZAdapterProperties:
+            properties: BlueZAdapterProperties = BlueZAdapterProperties(
+                bus, adapter_path
+            )
+            await properties.start()
+            return properties
+
+        return await self._once(("adapter_properties", adapter_path), start)
+
+    async def service_watcher(self) -> BlueZServiceWatcher:
+        """
+        The started watch on the owner of org.bluez
+
+        Returns
+        -------
+        BlueZServiceWatcher
+            The watcher shared by every server on the connection
+        """
+        bus: Any = await self.bus()
+
+        async def start() -> BlueZServiceWatcher:
+            watcher: BlueZServiceWatcher = BlueZServiceWatcher(bus)
+            await watcher.start()
+            return watcher
+
+        return await self._once("service_watcher", start)
+
+    def base_path(self, name: str) -> str:
+        """
+        Claim an object path for an application on the shared connection
+
+        Parameters
+        ----------
+        name : str
+            The name of the application
+
+        Returns
+        -------
+        str
+            base_path_for(name), with a numeric suffix if another application
+            of the same name already claimed it
+        """
+        base: str = base_path_for(name)
+        path: str = base
+        suffix: int = 1
+        while path in self._base_paths:
+            suffix += 1
+            path = "{}_{}".format(base, suffix)
+        self._base_paths.add(path)
+        return path
+
+    def claim_base_path(self, path: str) -> bool:
+        """
+        Claim a given object path again, e.g. for a server restarted after it
+        released its path
+
+        Parameters
+        ----------
+        path : str
+            The path
+
+        Returns
+        -------
+        bool
+            False if another application holds it
+        """
+        if path in self._base_paths:
+            return False
+        self._base_paths.add(path)
+        return True
+
+    def release_base_path(self, path: str):
+        """
+        Give up a path claimed with base_path, so that a server created later
+        under the same name gets it
+
+        Parameters
+        ----------
+        path : str
+            The path
+        """
+        self._base_paths.discard(path)
+
+    async def close(self):
+        """
+        Disconnect the connection the pool opened and stop its I/O thread.
+        The servers on the pool must be stopped first
+        """
+        bus: Any = self._bus if self._owns_bus else None
+        self._bus = None
+        self._shared.clear()
+        self._base_paths.clear()
+        if self.io_thread is not None:
+            if bus is not None:
+                await self.io_thread.run(self._disconnect(bus))
+            self.io_thread.stop()
+            self.io_thread = None
+        elif bus is not None:
+            await self._disconnect(bus)
+
+    @staticmethod
+    async def _disconnect(bus: Any):
+        bus.disconnect()
+        try:
+            await bus.wait_for_disconnect()
+        except Exception:
+            # The error the connection ended with, expected here
+            pass
+
+    async def _connect(self) -> Any:
+        return await self.engine.MessageBus(
+            bus_type=self.engine.BusType.SYSTEM
+        ).connect()
+
+    async def _once(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        # Concurrent callers share the one attempt, a failed one is retried by
+        # the next caller
+        future: Optional[asyncio.Future] = self._shared.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._shared[key] = future
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            if self._shared.get(key) is future:
+                del self._shared[key]
+            raise
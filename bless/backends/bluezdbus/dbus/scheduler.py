@@ -0,0 +1,282 @@
+import asyncio
+import logging
+
+import bleak.backends.bluezdbus.defs as defs  # type: ignore
+
+from dataclasses import dataclass
+from typing import List, Optional, TYPE_CHECKING
+
+from dbus_next.aio import ProxyObject, ProxyInterface  # type: ignore
+from dbus_next.signature import Variant  # type: ignore
+
+from bless.backends.advertisement import BlessAdvertisementData
+from bless.backends.bluezdbus.dbus.advertisement import (  # type: ignore
+    Type,
+    BlueZLEAdvertisement,
+)
+
+if TYPE_CHECKING:
+    from bless.backends.bluezdbus.dbus.application import (  # type: ignore
+        BlueZGattApplication,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class AdvertisementSet:
+    """
+    A payload managed by the BlueZAdvertisementScheduler
+
+    Attributes
+    ----------
+    advertisement : BlueZLEAdvertisement
+        The exported advertisement object that carries the payload
+    priority : int
+        Sets with a higher priority are always registered before sets with a
+        lower priority. Sets sharing the priority level that does not fit in
+        the remaining instances take turns
+    """
+
+    advertisement: BlueZLEAdvertisement
+    priority: int = 0
+
+    @property
+    def min_interval(self) -> int:
+        """The minimum advertising interval of this set in ms"""
+        return self.advertisement._min_interval
+
+    @property
+    def max_interval(self) -> int:
+        """The maximum advertising interval of this set in ms"""
+        return self.advertisement._max_interval
+
+
+class BlueZAdvertisementScheduler:
+    """
+    Manages several concurrent advertisements for one application
+
+    BlueZ exposes a limited number of advertising instances per adapter
+    (LEAdvertisingManager1.SupportedInstances). Sets are registered by
+    priority and, when there are more sets than free instances, the lowest
+    priority level that still gets an instance is rotated round robin every
+    rotation_interval seconds.
+    """
+
+    def __init__(
+        self,
+        app: "BlueZGattApplication",
+        adapter: ProxyObject,
+        rotation_interval: float = 1.0,
+        max_instances: Optional[int] = None,
+    ):
+        """
+        Parameters
+        ----------
+        app : BlueZGattApplication
+            The application that owns the advertisements
+        adapter : ProxyObject
+            The adapter to advertise on
+        rotation_interval : float
+            Seconds each rotating set stays registered before yielding
+        max_instances : Optional[int]
+            Overrides the number of instances reported by the adapter
+        """
+        self.app: "BlueZGattApplication" = app
+        self.adapter: ProxyObject = adapter
+        self.rotation_interval: float = rotation_interval
+
+        self.sets: List[AdvertisementSet] = []
+        self._registered: List[AdvertisementSet] = []
+        self._max_instances: Optional[int] = max_instances
+        self._rotation: int = 0
+        self._rotation_task: Optional[asyncio.Task] = None
+        self._running: bool = False
+
+    @property
+    def instances_in_use(self) -> List[AdvertisementSet]:
+        """The sets that are currently registered with BlueZ"""
+        return list(self._registered)
+
+    async def supported_instances(self) -> int:
+        """
+        The number of advertising instances the adapter supports. The value is
+        queried once and cached
+
+        Returns
+        -------
+        int
+            The number of advertisements that can be registered at once
+        """
+        if self._max_instances is None:
+            iface: ProxyInterface = self.adapter.get_interface(
+                defs.PROPERTIES_INTERFACE
+            )
+            instances: Variant = await iface.call_get(  # type: ignore
+                "org.bluez.LEAdvertisingManager1", "SupportedInstances"
+            )
+            self._max_instances = int(instances.value)
+        return self._max_instances
+
+    async def add_set(
+        self,
+        advertisement_data: Optional[BlessAdvertisementData] = None,
+        min_interval: int = 100,
+        max_interval: int = 100,
+        priority: int = 0,
+        advertising_type: Type = Type.PERIPHERAL,
+    ) -> AdvertisementSet:
+        """
+        Add an advertisement payload to the schedule
+
+        Parameters
+        ----------
+        advertisement_data : Optional[BlessAdvertisementData]
+            The payload to advertise
+        min_interval : int
+            The minimum advertising interval in ms
+        max_interval : int
+            The maximum advertising interval in ms
+        priority : int
+            The scheduling priority of the set
+        advertising_type : Type
+            Whether the advertisement is connectable (peripheral) or not
+            (broadcast)
+
+        Returns
+        -------
+        AdvertisementSet
+            The scheduled set
+        """
+        advertisement: BlueZLEAdvertisement = self.app._new_advertisement(
+            advertisement_data, advertising_type
+        )
+        advertisement.set_interval(min_interval, max_interval)
+        advertisement_set: AdvertisementSet = AdvertisementSet(advertisement, priority)
+        self.app.bus.export(advertisement.path, advertisement)
+        self.sets.append(advertisement_set)
+        if self._running:
+            await self._reconcile()
+        return advertisement_set
+
+    async def remove_set(self, advertisement_set: AdvertisementSet):
+        """
+        Remove a set from the schedule, unregistering it if needed
+
+        Parameters
+        ----------
+        advertisement_set : AdvertisementSet
+            The set to remove
+        """
+        self.sets.remove(advertisement_set)
+        if advertisement_set in self._registered:
+            await self._unregister(advertisement_set)
+        self.app.bus.unexport(advertisement_set.advertisement.path)
+        if self._running:
+            await self._reconcile()
+
+    async def start(self):
+        """
+        Register the sets that fit and begin rotating the remainder
+        """
+        self._running = True
+        await self._reconcile()
+        if self._rotation_task is None:
+            self._rotation_task = asyncio.ensure_future(self._rotate_forever())
+
+    async def stop(self):
+        """
+        Stop rotating and unregister every set
+        """
+        self._running = False
+        if self._rotation_task is not None:
+            self._rotation_task.cancel()
+            self._rotation_task = None
+        for advertisement_set in list(self._registered):
+            await self._unregister(advertisement_set)
+
+    async def recover(self):
+        """
+        Register the sets again after bluetoothd restarted or the adapter was
+        powered back on, either of which may drop the advertisements
+        """
+        self._registered.clear()
+        if self._running:
+            await self._reconcile()
+
+    async def rotate(self):
+        """
+        Advance the round robin by one step
+        """
+        self._rotation += 1
+        await self._reconcile()
+
+    async def schedule(self) -> List[AdvertisementSet]:
+        """
+        Determine which sets should currently be registered
+
+        Returns
+        -------
+        List[AdvertisementSet]
+            The sets that should hold an advertising instance
+        """
+        # Instances held by the application's own advertisement
+        foreign: int = len(self.app.advertisements_on(self.adapter))
+        free: int = max(await self.supported_instances() - foreign, 0)
+
+        selected: List[AdvertisementSet] = []
+        for priority in sorted({s.priority for s in self.sets}, reverse=True):
+            group: List[AdvertisementSet] = [
+                s for s in self.sets if s.priority == priority
+            ]
+            remaining: int = free - len(selected)
+            if len(group) <= remaining:
+                selected.extend(group)
+                continue
+            offset: int = self._rotation % len(group)
+            rotated: List[AdvertisementSet] = group[offset:] + group[:offset]
+            selected.extend(rotated[:remaining])
+            break
+        return selected
+
+    async def _reconcile(self):
+        desired: List[AdvertisementSet] = await self.schedule()
+        # Release instances before claiming new ones so we never exceed the
+        # adapter's limit
+        for advertisement_set in list(self._registered):
+            if advertisement_set not in desired:
+                await self._unregister(advertisement_set)
+        for advertisement_set in desired:
+            if advertisement_set not in self._registered:
+                await self._register(advertisement_set)
+
+    async def _register(self, advertisement_set: AdvertisementSet):
+        iface: ProxyInterface = self.adapter.get_interface(
+            "org.bluez.LEAdvertisingManager1"
+        )
+        # BlueZ may still hold it after a power cycle
+        await self.app._register_again(
+            iface.call_register_advertisement(  # type: ignore
+                advertisement_set.advertisement.path, {}
+            )
+        )
+        self._registered.append(advertisement_set)
+        self.app.advertising_changed(self.adapter)
+
+    async def _unregister(self, advertisement_set: AdvertisementSet):
+        iface: ProxyInterface = self.adapter.get_interface(
+            "org.bluez.LEAdvertisingManager1"
+        )
+        self._registered.remove(advertisement_set)
+        await iface.call_unregister_advertisement(  # type: ignore
+            advertisement_set.advertisement.path
+        )
+        self.app.advertising_changed(self.adapter)
+
+    async def _rotate_forever(self):
+        while True:
+            await asyncio.sleep(self.rotation_interval)
+            try:
+                await self.rotate()
+            except Exception:
+                logger.exception("Failed to rotate advertisements")
@@ -1,9 +1,11 @@
-from typing import List, TYPE_CHECKING, Any, Dict
+from typing import List, Tuple, TYPE_CHECKING, Any, Dict
 
 from dbus_next.aio import MessageBus  # type: ignore
-from dbus_next.service import ServiceInterface, dbus_property  # type: ignore
-from dbus_next.constants import PropertyAccess  # type: ignore
-from dbus_next.signature import Variant  # type: ignore
+from bless.backends.bluezdbus.dbus.engine import (
+    DBusInterface,
+    PropertyAccess,
+    dbus_property,
+)
 
 from bleak.backends.bluezdbus import defs  # type: ignore
 
@@ -15,13 +17,25 @@ if TYPE_CHECKING:
     )
 
 
-class BlueZGattService(ServiceInterface):
+class BlueZGattService(DBusInterface):
     """
     org.bluez.GattService1 interface implementation
     """
 
     interface_name: str = defs.GATT_SERVICE_INTERFACE
 
+    __slots__ = ()
+    # The instance attributes, made slots on the ported class
+    _slots: Tuple[str, ...] = (
+        "path",
+        "bus",
+        "destination",
+        "_uuid",
+        "_primary",
+        "app",
+        "characteristics",
+    )
+
     def __init__(
         self,
         uuid: str,
@@ -82,7 +96,9 @@ class BlueZGattService(ServiceInterface):
             The characteristic's value
         """
         index: int = len(self.characteristics) + 1
-        characteristic: BlueZGattCharacteristic = BlueZGattCharacteristic(
+        characteristic: BlueZGattCharacteristic = self.engine.interface(
+            BlueZGattCharacteristic
+        )(
             uuid, flags, index, self
         )
         characteristic._value = value  # type: ignore
@@ -101,6 +117,6 @@ class BlueZGattService(ServiceInterface):
             The dictionary that describes the service
         """
         return {
-            "Primary": Variant('b', self._primary),
-            "UUID": Variant('s', self._uuid)
+            "Primary": self.engine.Variant('b', self._primary),
+            "UUID": self.engine.Variant('s', self._uuid)
         }
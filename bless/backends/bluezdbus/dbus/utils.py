@@ -1,15 +1,62 @@
+import asyncio
+import logging
+
 import bleak.backends.bluezdbus.defs as defs  # type: ignore
 
-from typing import Dict, List, Optional
+from typing import Any, Callable, List, Optional, Tuple
 
-from dbus_next.aio import MessageBus, ProxyObject, ProxyInterface  # type: ignore
+from dbus_next.aio import MessageBus, ProxyObject  # type: ignore
 from dbus_next.introspection import Node  # type: ignore
 
+from bless.backends.bluezdbus.dbus.engine import DBusEngine, engine_of
+
+logger = logging.getLogger(__name__)
+
+BLUEZ_PATH: str = "/org/bluez"
+
+
+def adapter_path(adapter: str) -> str:
+    """
+    The object path of an adapter
+
+    Parameters
+    ----------
+    adapter : str
+        The name of the adapter, e.g. 'hci0', or its full object path
+
+    Returns
+    -------
+    str
+        The object path, e.g. /org/bluez/hci0
+    """
+    if adapter.startswith("/"):
+        return adapter
+    return BLUEZ_PATH + "/" + adapter
+
+
+async def _introspect_adapter(bus: MessageBus, path: str) -> Optional[Node]:
+    """
+    Introspect an object of the bluez service
+
+    Returns
+    -------
+    Optional[Node]
+        The introspection data, or None if the object is not an adapter
+    """
+    try:
+        node: Node = await bus.introspect(defs.BLUEZ_SERVICE, path)
+    except engine_of(bus).DBusError:
+        return None
+    if not any(i.name == defs.GATT_MANAGER_INTERFACE for i in node.interfaces):
+        return None
+    return node
+
 
 async def list_adapters(bus: MessageBus) -> List[str]:
     """
     Returns a list of strings that represent host-controller interfaces for
-    bluetooth
+    bluetooth. The children of /org/bluez are introspected rather than
+    downloading the whole object tree, which holds every known device
 
     Parameters
     ----------
@@ -21,23 +68,26 @@ async def list_adapters(bus: MessageBus) -> List[str]:
     List[str]
         A list of adapter interfaces on the dbus
     """
-    bluez_node: Node = await bus.introspect(defs.BLUEZ_SERVICE, "/")
-    bluez_obj: ProxyObject = bus.get_proxy_object(defs.BLUEZ_SERVICE, "/", bluez_node)
-    interface: ProxyInterface = bluez_obj.get_interface(defs.OBJECT_MANAGER_INTERFACE)
-    bt_objects: Dict = await interface.call_get_managed_objects()  # type: ignore
+    bluez_node: Node = await bus.introspect(defs.BLUEZ_SERVICE, BLUEZ_PATH)
+    paths: List[str] = sorted(adapter_path(child.name) for child in bluez_node.nodes)
+    nodes: List[Optional[Node]] = await asyncio.gather(
+        *[_introspect_adapter(bus, path) for path in paths]
+    )
+    return [path for path, node in zip(paths, nodes) if node is not None]
 
-    adapters: List[str] = [
-        objs
-        for objs, props in bt_objects.items()
-        if defs.GATT_MANAGER_INTERFACE in props.keys()
-    ]
-    return adapters
+
+async def _resolve_adapter(bus: MessageBus, adapter: str) -> Tuple[str, Node]:
+    path: str = adapter_path(adapter)
+    node: Optional[Node] = await _introspect_adapter(bus, path)
+    if node is None:
+        raise Exception(f"No adapter named {adapter} found")
+    return path, node
 
 
 async def find_adapter(bus: MessageBus, adapter: str = "hci0") -> str:
     """
-    Returns the first object within the bluez service that has a GattManager1
-    interface
+    Returns the object path of an adapter, checking that it exists and has a
+    GattManager1 interface
 
     Parameters
     ----------
@@ -45,42 +95,166 @@ async def find_adapter(bus: MessageBus, adapter: str = "hci0") -> str:
         The currently connected message bus to communicate with BlueZ
 
     adapter : str
-        The adapter to find. Default is 'hci0'
+        The adapter to find, by name or object path. Default is 'hci0'
 
     Returns
     -------
     str
         The dbus path to the adapter
     """
-    adapter_strs: List[str] = await list_adapters(bus)
-    found_adapter: List[str] = [a for a in adapter_strs if adapter in a]
-    if len(found_adapter) > 0:
-        return found_adapter[0]
-    raise Exception(f"No adapter named {adapter} found")
+    path, _ = await _resolve_adapter(bus, adapter)
+    return path
+
+
+async def wait_for_adapter(
+    bus: MessageBus, adapter: str, timeout: float = 30.0, interval: float = 0.1
+) -> str:
+    """
+    Find an adapter that may not be there yet, e.g. while bluetoothd starts
+    and exports its adapters after claiming its name
+
+    Parameters
+    ----------
+    bus : MessageBus
+        The currently connected message bus to communicate with BlueZ
+    adapter : str
+        The adapter to find, by name or object path
+    timeout : float
+        Seconds to keep looking for
+    interval : float
+        Seconds between lookups
+
+    Returns
+    -------
+    str
+        The dbus path to the adapter
+    """
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    deadline: float = loop.time() + timeout
+    while True:
+        try:
+            return await find_adapter(bus, adapter)
+        except Exception:
+            if loop.time() + interval > deadline:
+                raise
+        await asyncio.sleep(interval)
 
 
 async def get_adapter(bus: MessageBus, adapter: Optional[str] = None) -> ProxyObject:
     """
     Gets the bluetooth adapter specified by adapter or the default if adapter
-    is None
+    is None. The adapter is introspected directly, in one round trip
 
     Parameters
     ----------
     bus : MessageBus
         The connected DBus object
     adapter: Optional[str]
-        A string that points to the HCI adapter
+        A string that points to the HCI adapter, e.g. 'hci1' or
+        '/org/bluez/hci1'
 
     Returns
     -------
     ProxyObject
         The adapter object
     """
-    adapter_path: str = await find_adapter(
+    path, node = await _resolve_adapter(
         bus, adapter if adapter is not None else "hci0"
     )
-    adapter_node: Node = await bus.introspect(defs.BLUEZ_SERVICE, adapter_path)
-    adapter_obj: ProxyObject = bus.get_proxy_object(
-        defs.BLUEZ_SERVICE, adapter_path, adapter_node
-    )
+    adapter_obj: ProxyObject = bus.get_proxy_object(defs.BLUEZ_SERVICE, path, node)
     return adapter_obj
+
+
+class SignalFollower:
+    """
+    Base of the caches that follow D-Bus signals. While started, the match
+    rules are registered with the bus daemon and every signal is handed to
+    _on_signal, which tells the listeners what changed
+    """
+
+    def __init__(self, bus: Any, match_rules: List[str]):
+        """
+        Parameters
+        ----------
+        bus : MessageBus
+            The connected system bus
+        match_rules : List[str]
+            The rules that route the followed signals to the bus
+        """
+        self.bus: Any = bus
+        self.engine: DBusEngine = engine_of(bus)
+        self.listeners: List[Callable[..., None]] = []
+
+        self._match_rules: List[str] = match_rules
+        self._started: bool = False
+
+    def add_listener(self, listener: Callable[..., None]):
+        """
+        Call a function whenever the followed state changes
+
+        Parameters
+        ----------
+        listener : Callable[..., None]
+            Called with what changed, as documented by the subclass
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[..., None]):
+        """
+        Stop calling a function added with add_listener
+
+        Parameters
+        ----------
+        listener : Callable[..., None]
+            The function
+        """
+        self.listeners.remove(listener)
+
+    async def start(self):
+        """
+        Subscribe to the signals
+        """
+        if self._started:
+            return
+        self._started = True
+        self.bus.add_message_handler(self._on_message)
+        for rule in self._match_rules:
+            await self._call_bus("AddMatch", rule)
+
+    async def stop(self):
+        """
+        Unsubscribe from the signals
+        """
+        if not self._started:
+            return
+        self._started = False
+        self.bus.remove_message_handler(self._on_message)
+        for rule in self._match_rules:
+            await self._call_bus("RemoveMatch", rule)
+
+    def _on_signal(self, message: Any):
+        raise NotImplementedError()
+
+    def _notify(self, *args: Any):
+        for listener in list(self.listeners):
+            listener(*args)
+
+    def _on_message(self, message: Any) -> bool:
+        if message.message_type == self.engine.MessageType.SIGNAL:
+            self._on_signal(message)
+        # Never consume the message, other handlers may need it
+        return False
+
+    async def _call_bus(self, member: str, rule: str):
+        reply: Optional[Any] = await self.bus.call(
+            self.engine.Message(
+                destination="org.freedesktop.DBus",
+                path="/org/freedesktop/DBus",
+                interface="org.freedesktop.DBus",
+                member=member,
+                signature="s",
+                body=[rule],
+            )
+        )
+        if reply is not None and reply.message_type == self.engine.MessageType.ERROR:
+            logger.warning("{} failed for {}: {}".format(member, rule, reply.body))
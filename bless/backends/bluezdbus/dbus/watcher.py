@@ -0,0 +1,80 @@
+import logging
+
+import bleak.backends.bluezdbus.defs as defs  # type: ignore
+
+from typing import Any, Optional
+
+from bless.backends.bluezdbus.dbus.utils import SignalFollower
+
+logger = logging.getLogger(__name__)
+
+
+class BlueZServiceWatcher(SignalFollower):
+    """
+    Follows the owner of the org.bluez name, so that the servers notice when
+    bluetoothd exits or restarts. Everything registered with BlueZ is lost
+    when it does
+
+    Listeners are called with the unique name of the new owner, or None if
+    bluetoothd exited
+    """
+
+    def __init__(self, bus: Any):
+        """
+        Parameters
+        ----------
+        bus : MessageBus
+            The connected system bus
+        """
+        super(BlueZServiceWatcher, self).__init__(
+            bus,
+            [
+                (
+                    "type='signal',sender='org.freedesktop.DBus',"
+                    "interface='org.freedesktop.DBus',member='NameOwnerChanged',"
+                    "arg0='{}'"
+                ).format(defs.BLUEZ_SERVICE)
+            ],
+        )
+        self.owner: Optional[str] = None
+
+    async def start(self):
+        """
+        Subscribe to NameOwnerChanged and look up the current owner
+        """
+        if self._started:
+            return
+        await super(BlueZServiceWatcher, self).start()
+
+        reply: Optional[Any] = await self.bus.call(
+            self.engine.Message(
+                destination="org.freedesktop.DBus",
+                path="/org/freedesktop/DBus",
+                interface="org.freedesktop.DBus",
+                member="GetNameOwner",
+                signature="s",
+                body=[defs.BLUEZ_SERVICE],
+            )
+        )
+        if (
+            reply is not None
+            and reply.message_type == self.engine.MessageType.METHOD_RETURN
+        ):
+            self.owner = reply.body[0]
+
+    def _on_signal(self, message: Any):
+        if (
+            message.member != "NameOwnerChanged"
+            or message.interface != "org.freedesktop.DBus"
+        ):
+            return
+        name, old_owner, new_owner = message.body
+        if name != defs.BLUEZ_SERVICE:
+            return
+        self.owner = new_owner or None
+        logger.info(
+            "bluetoothd {}".format(
+                "started as {}".format(new_owner) if new_owner else "exited"
+            )
+        )
+        self._notify(self.owner)
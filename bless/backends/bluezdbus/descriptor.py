@@ -1,7 +1,6 @@
 from uuid import UUID
-from typing import Union, Optional, List, Dict, cast, TYPE_CHECKING, Literal
-
-from bleak.backends.bluezdbus.defs import GattDescriptor1
+from functools import lru_cache
+from typing import Union, Optional, List, Tuple, cast, TYPE_CHECKING, Literal
 
 from bless.backends.attribute import GATTAttributePermissions
 from bless.backends.descriptor import (
@@ -73,10 +72,9 @@ class BlessGATTDescriptorBlueZDBus(BlessGATTDescriptor):
         characteristic : BlessGATTCharacteristic
             The characteristic to assign the descriptor to
         """
-        flags: List[DescriptorFlags] = [
-            transform_flags_with_permissions(flag, self._permissions)
-            for flag in flags_to_dbus(self._properties)
-        ]
+        flags: List[DescriptorFlags] = list(
+            _dbus_flags(self._properties, self._permissions)
+        )
 
         # Add to our BlueZDBus app
         bluez_characteristic: "BlessGATTCharacteristicBlueZDBus" = cast(
@@ -88,17 +86,11 @@ class BlessGATTDescriptorBlueZDBus(BlessGATTDescriptor):
             )
         )
         self.gatt: BlueZGattDescriptor = gatt_desc
-        dict_obj: Dict = await gatt_desc.get_obj()
-        obj: GattDescriptor1 = GattDescriptor1(
-            UUID=dict_obj["UUID"],
-            Characteristic=characteristic.uuid,
-            Value=bytes(self.value),
-            Flags=cast(_Flags, flags),
-        )
 
-        # Add a Bleak Descriptor properties
+        # Add a Bleak Descriptor properties, with the BlueZ object as the
+        # backend-specific object like characteristics and services
         super(BlessGATTDescriptor, self).__init__(
-            obj, 0, self._uuid, characteristic
+            gatt_desc, 0, self._uuid, characteristic
         )
 
     @property
@@ -114,7 +106,17 @@ class BlessGATTDescriptorBlueZDBus(BlessGATTDescriptor):
     @property
     def uuid(self) -> str:
         """The uuid of this characteristic"""
-        return self.obj.get("UUID").value
+        return self._uuid
+
+
+@lru_cache(maxsize=None)
+def _dbus_flags(
+    properties: GATTDescriptorProperties, permissions: GATTAttributePermissions
+) -> Tuple[DescriptorFlags, ...]:
+    return tuple(
+        transform_flags_with_permissions(flag, permissions)
+        for flag in flags_to_dbus(properties)
+    )
 
 
 def transform_flags_with_permissions(
@@ -1,22 +1,57 @@
+import time
 import asyncio
+import logging
+import functools
 
 from uuid import UUID
 
-from typing import Any, Optional, cast, Dict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+    cast,
+)
 
 from asyncio import AbstractEventLoop
 
-from dbus_next.aio import MessageBus, ProxyObject  # type: ignore
-from dbus_next.constants import BusType  # type: ignore
+from dbus_next.aio import ProxyObject  # type: ignore
 
 from bless.backends.server import BaseBlessServer  # type: ignore
 from bless.backends.advertisement import BlessAdvertisementData
 from bless.backends.bluezdbus.characteristic import BlessGATTCharacteristicBlueZDBus
 from bless.backends.bluezdbus.descriptor import BlessGATTDescriptorBlueZDBus
+from bless.backends.bluezdbus.dbus.adapter import (  # type: ignore
+    ADAPTER_INTERFACE,
+    BlueZAdapterProperties,
+)
 from bless.backends.bluezdbus.dbus.application import (  # type: ignore
     BlueZGattApplication,
 )
-from bless.backends.bluezdbus.dbus.utils import get_adapter  # type: ignore
+from bless.backends.bluezdbus.dbus.balancer import (  # type: ignore
+    BlueZAdapterBalancer,
+)
+from bless.backends.bluezdbus.dbus.engine import DBusEngine  # type: ignore
+from bless.backends.bluezdbus.dbus.devices import (  # type: ignore
+    BlueZDeviceTracker,
+    device_address,
+)
+from bless.backends.bluezdbus.dbus.io import (  # type: ignore
+    BlueZIOThread,
+    call_on_loop,
+)
+from bless.backends.bluezdbus.dbus.pool import BlueZBusPool  # type: ignore
+from bless.backends.bluezdbus.dbus.scheduler import (  # type: ignore
+    BlueZAdvertisementScheduler,
+)
+from bless.backends.bluezdbus.dbus.utils import wait_for_adapter  # type: ignore
+from bless.backends.bluezdbus.dbus.watcher import (  # type: ignore
+    BlueZServiceWatcher,
+)
 from bless.backends.bluezdbus.dbus.characteristic import (  # type: ignore
     BlueZGattCharacteristic,
 )
@@ -37,6 +72,26 @@ from bless.backends.descriptor import (  # type: ignore
 
 from bleak.uuids import normalize_uuid_str
 
+from bless.exceptions import BlessATTError, BlessError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Seconds to wait for an adapter to reappear after bluetoothd restarted
+RECOVERY_TIMEOUT: float = 30.0
+
+# The D-Bus errors BlueZ turns into ATT error codes, the rest become
+# "unlikely error"
+ATT_ERRORS: Dict[int, str] = {
+    BlessATTError.READ_NOT_PERMITTED: "org.bluez.Error.NotPermitted",
+    BlessATTError.WRITE_NOT_PERMITTED: "org.bluez.Error.NotPermitted",
+    BlessATTError.REQUEST_NOT_SUPPORTED: "org.bluez.Error.NotSupported",
+    BlessATTError.INVALID_OFFSET: "org.bluez.Error.InvalidOffset",
+    BlessATTError.INSUFFICIENT_AUTHORIZATION: "org.bluez.Error.NotAuthorized",
+    BlessATTError.INVALID_ATTRIBUTE_VALUE_LENGTH: "org.bluez.Error.InvalidValueLength",
+}
+
 
 class BlessServerBlueZDBus(BaseBlessServer):
     """
@@ -46,13 +101,69 @@ class BlessServerBlueZDBus(BaseBlessServer):
     ----------
     name : str
         The name of the server that will be advertised]
-
+    io_thread : Optional[BlueZIOThread]
+        The thread whose loop owns the D-Bus connection, created when the
+        `io_thread` keyword argument is True so that a busy application loop
+        does not delay BlueZ. Read and write handlers are then called on the
+        server's loop, or on the I/O thread if the `loop_safe_handlers` keyword
+        argument is True. Unless it belongs to a shared pool, the thread ends,
+        and the connection is closed, when the server's `async with` block
+        exits
+    engine : DBusEngine
+        The D-Bus library the server runs on, chosen with the `dbus_engine`
+        keyword argument ("dbus_next" or "dbus_fast") or the BLESS_DBUS_ENGINE
+        environment variable
+    adapters : List[ProxyObject]
+        The adapters the GATT tree is served on, named by the `adapters`
+        keyword argument, e.g. ["hci0", "hci1"], or else by `adapter`. The
+        first one is also available as `adapter`. The server is advertised on
+        the adapters with the fewest connected centrals
+    bus_pool : BlueZBusPool
+        The source of the D-Bus connection and adapters. Servers given the same
+        pool with the `bus_pool` keyword argument share them, and its engine
+        and I/O thread, instead of each opening a connection of its own
+    timings : Dict[str, float]
+        How long, in seconds, the phases of bringing the server up and down
+        took: "setup" (connecting and finding the adapters), "register"
+        (exporting and registering the application), "prepare_advertisement"
+        (setting the alias and exporting the advertisement, during
+        "register"), "advertise" (registering the advertisement),
+        "first_advertisement" (from the call to start until advertising,
+        including any wait for setup), "stop" and "recovery" (from bluetoothd
+        reappearing, or an adapter being powered on, until the application
+        and its advertisements are registered again)
+
+    When bluetoothd restarts, or an adapter is powered off and on again, the
+    server registers its exported application and advertisements again by
+    itself
     """
 
     def __init__(self, name: str, loop: Optional[AbstractEventLoop] = None, **kwargs):
         super(BlessServerBlueZDBus, self).__init__(loop=loop, **kwargs)
         self.name: str = name
         self._adapter: Optional[str] = kwargs.get("adapter", None)
+        self._adapter_names: List[Optional[str]] = list(
+            kwargs.get("adapters", None) or [self._adapter]
+        )
+        # A pool of its own is closed with the server, see __aexit__
+        self._private_pool: bool = kwargs.get("bus_pool", None) is None
+        self.bus_pool: BlueZBusPool = kwargs.get("bus_pool", None) or BlueZBusPool(
+            dbus_engine=kwargs.get("dbus_engine", None),
+            io_thread=kwargs.get("io_thread", False),
+        )
+        self.engine: DBusEngine = self.bus_pool.engine
+        self.io_thread: Optional[BlueZIOThread] = self.bus_pool.io_thread
+        self.loop_safe_handlers: bool = kwargs.get("loop_safe_handlers", False)
+        self.timings: Dict[str, float] = {}
+
+        self._serving: bool = False
+        self._recovery_task: Optional[asyncio.Future] = None
+        self._recovery_pending: Set[str] = set()
+        self._recovery_begin: float = 0.0
+        # The adapters last reported as powered off
+        self._powered_off: Set[str] = set()
+        # Loads the centrals connected before the server started
+        self._devices_task: Optional[asyncio.Future] = None
 
         self.setup_task: asyncio.Task = self.loop.create_task(self.setup())
 
@@ -60,25 +171,165 @@ class BlessServerBlueZDBus(BaseBlessServer):
         """
         Asyncronous side of init
         """
-        self.bus: MessageBus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        await self._timed("setup", self._on_bus(self._setup_bus()))
+
+    async def _setup_bus(self):
+        self.bus: Any = await self.bus_pool.bus()
+
+        self.app: BlueZGattApplication = self.engine.interface(BlueZGattApplication)(
+            self.name, "org.bluez", self.bus, self.bus_pool.base_path(self.name)
+        )
+
+        self.app.Read = self._from_bus(self.read, self.loop_safe_handlers)
+        self.app.Write = self._from_bus(self.write, self.loop_safe_handlers)
 
-        self.app: BlueZGattApplication = BlueZGattApplication(
-            self.name, "org.bluez", self.bus
+        # BlueZ only calls these for the first and last subscriber of each
+        # adapter, so the primary adapter stands in for the individual centrals.
+        # The application counts the adapters subscribed to a characteristic
+        self.app.StartNotify = self._from_bus(
+            lambda x: self.subscriptions.subscribe(x._uuid, self.adapter.path)
+        )
+        self.app.StopNotify = self._from_bus(self._stop_notify)
+        self.app.Confirm = self._from_bus(
+            lambda x: self._indication_confirmed(x._uuid, self.adapter.path)
         )
 
-        self.app.Read = self.read
-        self.app.Write = self.write
+        self.adapters: List[ProxyObject] = list(
+            await asyncio.gather(
+                *[self.bus_pool.adapter(name) for name in self._adapter_names]
+            )
+        )
+        self.adapter: ProxyObject = self.adapters[0]
 
-        # We don't need to define these
-        self.app.StartNotify = lambda x: None
-        self.app.StopNotify = lambda x: None
+        self.advertising_scheduler: BlueZAdvertisementScheduler = (
+            BlueZAdvertisementScheduler(self.app, self.adapter)
+        )
 
-        potential_adapter: Optional[ProxyObject] = await get_adapter(
-            self.bus, self._adapter
+        properties, trackers, watcher = await asyncio.gather(
+            asyncio.gather(
+                *[self.bus_pool.adapter_properties(a.path) for a in self.adapters]
+            ),
+            asyncio.gather(
+                *[self.bus_pool.device_tracker(a.path) for a in self.adapters]
+            ),
+            self.bus_pool.service_watcher(),
         )
-        if potential_adapter is None:
-            raise Exception("Could not locate bluetooth adapter")
-        self.adapter: ProxyObject = cast(ProxyObject, potential_adapter)
+        self.service_watcher: BlueZServiceWatcher = watcher
+        self.device_trackers: Dict[str, BlueZDeviceTracker] = {}
+        # The listeners are added while the server runs, so that a stopped
+        # server on a shared pool is not kept alive by them
+        self._property_listeners: Dict[str, Callable[[str, str, Any], None]] = {}
+        for adapter, adapter_properties, tracker in zip(
+            self.adapters, properties, trackers
+        ):
+            self.app.adapter_properties[adapter.path] = adapter_properties
+            self._property_listeners[adapter.path] = functools.partial(
+                self._adapter_property_changed, adapter
+            )
+            self.device_trackers[adapter.path] = tracker
+        self._base_path_claimed: bool = True
+        self._listening: bool = False
+        self.device_tracker: BlueZDeviceTracker = self.device_trackers[
+            self.adapter.path
+        ]
+
+        self.balancer: BlueZAdapterBalancer = BlueZAdapterBalancer(
+            self.app,
+            self.adapters,
+            lambda a: len(self.device_trackers[a.path].connected_devices),
+        )
+
+    async def _load_devices(self):
+        """
+        Load the centrals already connected to the adapters, see
+        BlueZDeviceTracker.load_connected
+        """
+
+        async def load():
+            await asyncio.gather(
+                *[t.load_connected() for t in self.device_trackers.values()]
+            )
+
+        await self._on_bus(load())
+
+    async def _load_devices_late(self):
+        try:
+            await self._timed("load_devices", self._load_devices())
+        except Exception as e:
+            logger.warning("Failed to load the connected devices: {}".format(e))
+
+    async def _timed(self, phase: str, coroutine: Awaitable[T]) -> T:
+        """
+        Await a coroutine, recording how long it took in timings
+
+        Parameters
+        ----------
+        phase : str
+            The name of the phase
+        coroutine : Awaitable[T]
+            The coroutine
+
+        Returns
+        -------
+        T
+            Its result
+        """
+        begin: float = time.perf_counter()
+        try:
+            return await coroutine
+        finally:
+            self.timings[phase] = time.perf_counter() - begin
+
+    async def _on_bus(self, coroutine: Awaitable[T]) -> T:
+        """
+        Run a coroutine that uses the D-Bus connection on the loop that owns it
+
+        Parameters
+        ----------
+        coroutine : Awaitable[T]
+            The coroutine
+
+        Returns
+        -------
+        T
+            Its result
+        """
+        if self.io_thread is None:
+            return await coroutine
+        return await self.io_thread.run(coroutine)
+
+    def _from_bus(
+        self, func: Callable[..., Any], loop_safe: bool = False
+    ) -> Callable[..., Any]:
+        """
+        Wrap a function called by the D-Bus connection so that it runs on the
+        server's loop. The wrapper returns an awaitable of the result
+
+        Parameters
+        ----------
+        func : Callable[..., Any]
+            The function
+        loop_safe : bool
+            Whether func may be called on the I/O thread instead
+
+        Returns
+        -------
+        Callable[..., Any]
+            The function to give to the D-Bus objects
+        """
+        if self.io_thread is None or loop_safe:
+            return func
+        return functools.partial(call_on_loop, self.loop, func)
+
+    def _set_gatt_value(self, characteristic: BlueZGattCharacteristic, value: bytes):
+        """
+        Set the value of a BlueZ characteristic, emitting PropertiesChanged
+        from the loop that owns the D-Bus connection
+        """
+        if self.io_thread is None:
+            characteristic.Value = value  # type: ignore
+        else:
+            self.io_thread.call_soon(setattr, characteristic, "Value", value)
 
     async def start(
         self, advertisement_data: Optional[BlessAdvertisementData] = None, **kwargs
@@ -96,21 +347,73 @@ class BlessServerBlueZDBus(BaseBlessServer):
         bool
             Whether the server started successfully
         """
+        begin: float = time.perf_counter()
         await self.setup_task
 
-        # Make our app available
-        self.bus.export(self.app.path, self.app)
-
-        # Register
-        await self.app.register(self.adapter)
-
-        # advertise
-        await self.app.start_advertising(
-            self.adapter, advertisement_data=advertisement_data
+        if self.advertising_policy is not None:
+            first_tier = self.advertising_policy.first_tier
+            interval_data: BlessAdvertisementData = BlessAdvertisementData(
+                min_interval=first_tier.min_interval,
+                max_interval=first_tier.max_interval,
+            )
+            advertisement_data = (
+                advertisement_data.merge(interval_data)
+                if advertisement_data is not None
+                else interval_data
+            )
+
+        # The alias and the advertisement do not depend on the application, so
+        # they are readied while BlueZ registers it. Only then is the
+        # advertisement registered, so that centrals find the services
+        await asyncio.gather(
+            self._timed("register", self._on_bus(self._register())),
+            self._timed(
+                "prepare_advertisement",
+                self._on_bus(self.balancer.prepare(advertisement_data)),
+            ),
+        )
+        await self._timed(
+            "advertise", self._on_bus(self.balancer.start(advertisement_data))
         )
+        self.timings["first_advertisement"] = time.perf_counter() - begin
+        # Centrals that were connected before the server started are only
+        # needed by is_connected, which waits for them
+        self._devices_task = asyncio.ensure_future(self._load_devices_late())
+        self._started()
+        await self._start_advertising_policy()
+
+        # Additional advertisement sets
+        if len(self.advertising_scheduler.sets) > 0:
+            await self._on_bus(self.advertising_scheduler.start())
 
         return True
 
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        Stop the server and, unless it was given a shared pool, close its
+        connection and I/O thread. A server that is only stopped keeps them,
+        so that it can start again
+        """
+        await super(BlessServerBlueZDBus, self).__aexit__(exc_type, exc_val, exc_tb)
+        if self._private_pool:
+            await self.bus_pool.close()
+
+    async def _register(self):
+        if not self._base_path_claimed:
+            if not self.bus_pool.claim_base_path(self.app.base_path):
+                raise BlessError(
+                    "Another server on the pool uses {}".format(self.app.base_path)
+                )
+            self._base_path_claimed = True
+        self._listen(True)
+
+        # Make our app available
+        self.bus.export(self.app.path, self.app)
+
+        # Register the one tree with every adapter
+        await asyncio.gather(*[self.app.register(a) for a in self.adapters])
+        self._serving = True
+
     async def stop(self) -> bool:
         """
         Stop the server
@@ -120,16 +423,102 @@ class BlessServerBlueZDBus(BaseBlessServer):
         bool
             Whether the server stopped successfully
         """
+        self._stop_advertising_policy()
+        if self._devices_task is not None:
+            self._devices_task.cancel()
+            self._devices_task = None
+        await self._timed("stop", self._on_bus(self._unregister()))
+        self.subscriptions.clear()
+        self._stopped()
+
+        return True
+
+    async def _unregister(self):
+        self._serving = False
+        self._recovery_pending.clear()
+        if self._recovery_task is not None:
+            self._recovery_task.cancel()
+
         # Stop Advertising
-        await self.app.stop_advertising(self.adapter)
+        await self.advertising_scheduler.stop()
 
-        # Unregister
-        await self.app.unregister(self.adapter)
+        # Stop advertising and unregister together
+        await asyncio.gather(
+            self.balancer.stop(), *[self.app.unregister(a) for a in self.adapters]
+        )
 
         # Remove our App
         self.bus.unexport(self.app.path, self.app)
 
-        return True
+        self._listen(False)
+        self.bus_pool.release_base_path(self.app.base_path)
+        self._base_path_claimed = False
+
+    def _listen(self, listen: bool):
+        """
+        Add, or remove, the server's listeners on the shared service watcher,
+        adapter property caches and device trackers
+
+        Parameters
+        ----------
+        listen : bool
+            Whether to add them
+        """
+        if listen == self._listening:
+            return
+        self._listening = listen
+        if listen:
+            self.service_watcher.add_listener(self._bluez_owner_changed)
+        else:
+            self.service_watcher.remove_listener(self._bluez_owner_changed)
+        for adapter in self.adapters:
+            adapter_properties: BlueZAdapterProperties = self.app.adapter_properties[
+                adapter.path
+            ]
+            tracker: BlueZDeviceTracker = self.device_trackers[adapter.path]
+            if listen:
+                adapter_properties.add_listener(self._property_listeners[adapter.path])
+                tracker.add_listener(self._device_changed)
+            else:
+                adapter_properties.remove_listener(
+                    self._property_listeners[adapter.path]
+                )
+                tracker.remove_listener(self._device_changed)
+
+    async def update_advertisement(
+        self, advertisement_data: BlessAdvertisementData, swap: bool = False, **kwargs
+    ):
+        """
+        Change the payload of the running advertisement without unregistering
+        it, so that values such as sensor readings in the manufacturer data can
+        be refreshed frequently
+
+        Parameters
+        ----------
+        advertisement_data : BlessAdvertisementData
+            The advertisement fields to change. Fields that are None are left
+            as they are
+        swap : bool
+            If True, register a replacement advertisement before releasing the
+            current one instead of emitting PropertiesChanged on it
+        """
+        await self.setup_task
+        await self._on_bus(self.balancer.update(advertisement_data, swap))
+
+    async def set_advertising_interval(self, min_interval: int, max_interval: int):
+        """
+        Change the advertising interval of the running advertisement
+
+        Parameters
+        ----------
+        min_interval : int
+            The minimum advertising interval in ms
+        max_interval : int
+            The maximum advertising interval in ms
+        """
+        await self.update_advertisement(
+            BlessAdvertisementData(min_interval=min_interval, max_interval=max_interval)
+        )
 
     async def is_connected(self) -> bool:
         """
@@ -140,7 +529,10 @@ class BlessServerBlueZDBus(BaseBlessServer):
         bool
             Whether any peripheral devices are connected
         """
-        return await self.app.is_connected()
+        await self.setup_task
+        if not all(t.loaded for t in self.device_trackers.values()):
+            await self._load_devices()
+        return any(t.is_connected for t in self.device_trackers.values())
 
     async def is_advertising(self) -> bool:
         """
@@ -152,7 +544,10 @@ class BlessServerBlueZDBus(BaseBlessServer):
             True if the server is advertising
         """
         await self.setup_task
-        return await self.app.is_advertising(self.adapter)
+        for adapter in self.adapters:
+            if await self._on_bus(self.app.is_advertising(adapter)):
+                return True
+        return False
 
     async def add_new_service(self, uuid: str):
         """
@@ -165,7 +560,7 @@ class BlessServerBlueZDBus(BaseBlessServer):
         """
         await self.setup_task
         service: BlessGATTServiceBlueZDBus = BlessGATTServiceBlueZDBus(uuid)
-        await service.init(self)
+        await self._on_bus(service.init(self))
         self.services[service.uuid] = service
 
     async def add_new_characteristic(
@@ -202,7 +597,7 @@ class BlessServerBlueZDBus(BaseBlessServer):
         characteristic: BlessGATTCharacteristicBlueZDBus = (
             BlessGATTCharacteristicBlueZDBus(char_uuid, properties, permissions, value)
         )
-        await characteristic.init(service)
+        await self._on_bus(characteristic.init(service))
 
         # Add it to the service
         self.services[service.uuid].add_characteristic(characteristic)
@@ -252,17 +647,19 @@ class BlessServerBlueZDBus(BaseBlessServer):
             BlessGATTDescriptorBlueZDBus(std_desc_uuid, properties, permissions, value)
         )
 
-        await descriptor.init(characteristic)
+        await self._on_bus(descriptor.init(characteristic))
 
         # Add it to the characteristic
         service.get_characteristic(str(UUID(char_uuid))).add_descriptor(descriptor)
 
-    def update_value(self, service_uuid: str, char_uuid: str) -> bool:
+    def update_value(
+        self, service_uuid: str, char_uuid: str, value: Any = None
+    ) -> bool:
         """
         Update the characteristic value. This is different than using
         characteristic.set_value. This method ensures that subscribed devices
         receive notifications, assuming the characteristic in question is
-        notifyable
+        notifyable. When no central is subscribed nothing is sent
 
         Parameters
         ----------
@@ -272,6 +669,9 @@ class BlessServerBlueZDBus(BaseBlessServer):
         char_uuid : str
             The string representation of the UUID for the characteristic whose
             value is to be updated
+        value : Any
+            Optional new value, native if the characteristic has a codec,
+            stored before notifying
 
         Returns
         -------
@@ -290,17 +690,201 @@ class BlessServerBlueZDBus(BaseBlessServer):
             BlessGATTCharacteristicBlueZDBus,
             bless_service.get_characteristic(char_uuid),
         )
+        if value is not None:
+            bless_char.typed_value = value
         cur_value: Any = bless_char.value
 
         characteristic: BlueZGattCharacteristic = bless_char.gatt
-        characteristic.Value = bytes(cur_value)  # type: ignore
+        if not self.subscriptions.is_subscribed(char_uuid):
+            # Keep the value current without signalling nobody
+            characteristic._value = bytes(cur_value)
+            return True
+        self._set_gatt_value(characteristic, bytes(cur_value))
         return True
 
-    def read(self, char: BlueZGattCharacteristic, options: Dict[str, Any]) -> bytes:
+    async def _send_indication(
+        self, service_uuid: str, char_uuid: str, central: str
+    ) -> bool:
+        """
+        Emit the characteristic value. BlueZ turns the change into an
+        indication for the characteristics subscribed to with indications and
+        calls Confirm once the central acknowledges it
+
+        Parameters
+        ----------
+        service_uuid : str
+            The string representation of the UUID for the service
+        char_uuid : str
+            The string representation of the UUID for the characteristic
+        central : str
+            The adapter path, which stands in for the subscribed centrals
+
+        Returns
+        -------
+        bool
+            Whether the indication was sent
+        """
+        bless_char: BlessGATTCharacteristicBlueZDBus = cast(
+            BlessGATTCharacteristicBlueZDBus, self.get_characteristic(char_uuid)
+        )
+        self._set_gatt_value(bless_char.gatt, bytes(bless_char.value))
+        return True
+
+    def _stop_notify(self, characteristic: BlueZGattCharacteristic):
+        # Still subscribed through another adapter
+        if characteristic._uuid in self.app.subscribed_characteristics:
+            return
+        self.subscriptions.unsubscribe(characteristic._uuid, self.adapter.path)
+
+    def _device_changed(self, path: str, connected: bool):
+        """
+        Called by the device trackers, on the loop that owns the D-Bus
+        connection, when a central connects or disconnects
+
+        Parameters
+        ----------
+        path : str
+            The D-Bus path of the device
+        connected : bool
+            Whether the device is now connected
+        """
+        self.balancer.request()
+        self._from_bus(self._device_connection_changed)(path, connected)
+
+    def _bluez_owner_changed(self, owner: Optional[str]):
+        """
+        Called by the service watcher, on the loop that owns the D-Bus
+        connection, when bluetoothd exits or starts
+
+        Parameters
+        ----------
+        owner : Optional[str]
+            The unique name of the new bluetoothd, or None if it exited
+        """
+        # Whatever was cached came from the previous bluetoothd
+        for adapter_properties in self.app.adapter_properties.values():
+            adapter_properties.invalidate()
+        if owner is None:
+            for tracker in self.device_trackers.values():
+                tracker.reset()
+            self._drop_subscriptions()
+            return
+        self._powered_off.clear()
+        self._request_recovery(self.adapters)
+
+    def _adapter_property_changed(
+        self, adapter: ProxyObject, interface: str, name: str, value: Any
+    ):
+        """
+        Called by the adapter property caches, on the loop that owns the D-Bus
+        connection, when a property of an adapter changes
+
+        Parameters
+        ----------
+        adapter : ProxyObject
+            The adapter
+        interface : str
+            The interface of the property
+        name : str
+            The property
+        value : Any
+            Its new value
+        """
+        if interface != ADAPTER_INTERFACE or name != "Powered":
+            return
+        if value:
+            self._powered_off.discard(adapter.path)
+            self._request_recovery([adapter])
+            return
+        self._powered_off.add(adapter.path)
+        # StopNotify does not tell the adapters apart, so the subscriptions
+        # are only dropped once none of them can hold any
+        if all(a.path in self._powered_off for a in self.adapters):
+            self._drop_subscriptions()
+
+    def _drop_subscriptions(self):
+        """
+        Forget every subscription when BlueZ dropped them without calling
+        StopNotify, i.e. when bluetoothd exited or the adapters powered off
+        """
+        uuids: Set[str] = set(self.app.subscribed_characteristics)
+        self.app.subscribed_characteristics.clear()
+        if len(uuids) > 0:
+            self._from_bus(self._unsubscribe_all)(uuids)
+
+    def _unsubscribe_all(self, uuids: Set[str]):
+        for uuid in uuids:
+            self.subscriptions.unsubscribe(uuid, self.adapter.path)
+
+    def _request_recovery(self, adapters: List[ProxyObject]):
+        """
+        Register the application and advertisements with the adapters again in
+        the background. Requests made while a recovery is in flight are folded
+        into it
+
+        Parameters
+        ----------
+        adapters : List[ProxyObject]
+            The adapters to recover
+        """
+        if not self._serving:
+            return
+        self._recovery_pending.update(a.path for a in adapters)
+        if self._recovery_task is None:
+            self._recovery_begin = time.perf_counter()
+            self._recovery_task = asyncio.ensure_future(self._recover())
+
+    async def _recover(self):
+        try:
+            while len(self._recovery_pending) > 0:
+                adapters: List[ProxyObject] = [
+                    a for a in self.adapters if a.path in self._recovery_pending
+                ]
+                self._recovery_pending.clear()
+                await asyncio.gather(*[self._recover_adapter(a) for a in adapters])
+            self.timings["recovery"] = time.perf_counter() - self._recovery_begin
+            logger.info(
+                "Registered again in {:.3f}s".format(self.timings["recovery"])
+            )
+        finally:
+            self._recovery_task = None
+
+    async def _recover_adapter(self, adapter: ProxyObject):
+        try:
+            # The adapter is exported a little after bluetoothd claims its name
+            await wait_for_adapter(self.bus, adapter.path, RECOVERY_TIMEOUT)
+            await self.app.reregister(adapter)
+            if adapter is self.adapter:
+                await self.advertising_scheduler.recover()
+        except Exception:
+            logger.exception("Failed to register with {} again".format(adapter.path))
+
+    def _device_connection_changed(self, path: str, connected: bool):
+        """
+        Called when a central connects to or disconnects from any adapter
+
+        Parameters
+        ----------
+        path : str
+            The D-Bus path of the device
+        connected : bool
+            Whether the device is now connected
+        """
+        self._central_connection_changed(
+            device_address(path),
+            connected,
+            any(t.is_connected for t in self.device_trackers.values()),
+        )
+
+    async def read(
+        self, char: BlueZGattCharacteristic, options: Dict[str, Any]
+    ) -> bytes:
         """
         Read request.
         This re-routes the the request incomming on the dbus to the server to
-        be re-routed to the user defined handler
+        be re-routed to the user defined handler. A BlessATTError is returned
+        to BlueZ as the matching org.bluez.Error. For long reads BlueZ asks
+        again for the value from an offset
 
         Note: the BlueZ App handles the data as a list of ints
 
@@ -314,7 +898,15 @@ class BlessServerBlueZDBus(BaseBlessServer):
         bytes
             The value of the characteristic
         """
-        return bytes(self.read_request(char.UUID, options))
+        offset: Any = options.get("offset")
+        offset = int(getattr(offset, "value", offset) or 0)
+        try:
+            value: Any = await self.read_request_async(char.UUID, options)
+            return bytes(value[offset:] if offset else value)
+        except BlessATTError as e:
+            raise self.engine.DBusError(
+                ATT_ERRORS.get(e.code, "org.bluez.Error.Failed"), str(e)
+            ) from e
 
     def write(
         self, char: BlueZGattCharacteristic, value: bytes, options: Dict[str, Any]
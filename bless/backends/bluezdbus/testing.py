@@ -0,0 +1,574 @@
+"""
+A stand-in for BlueZ on a private D-Bus daemon, so that the BlueZ backend can
+be exercised end to end without an adapter.
+
+PrivateBus starts a dbus-daemon that anybody may own names on. FakeBlueZ claims
+org.bluez on it, exports hci0, and any further adapters asked for, with
+Adapter1, GattManager1 and LEAdvertisingManager1, and, once an application
+registers, drives its GATT objects the way bluetoothd does for a remote
+central.
+
+The test suite and the benchmarks use it. It needs dbus-daemon, see
+PrivateBus.available.
+"""
+import os
+import shutil
+import asyncio
+import tempfile
+import subprocess
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from dbus_next import Message, MessageType, Variant  # type: ignore
+from dbus_next.aio import MessageBus  # type: ignore
+from dbus_next.constants import PropertyAccess  # type: ignore
+from dbus_next.errors import DBusError  # type: ignore
+from dbus_next.service import (  # type: ignore
+    ServiceInterface,
+    dbus_property,
+    method,
+)
+
+ADAPTER_PATH: str = "/org/bluez/hci0"
+GATT_MANAGER: str = "org.bluez.GattManager1"
+ADVERTISING_MANAGER: str = "org.bluez.LEAdvertisingManager1"
+CHARACTERISTIC: str = "org.bluez.GattCharacteristic1"
+DEVICE: str = "org.bluez.Device1"
+PROPERTIES: str = "org.freedesktop.DBus.Properties"
+OBJECT_MANAGER: str = "org.freedesktop.DBus.ObjectManager"
+
+CONFIG: str = """<!DOCTYPE busconfig PUBLIC
+ "-//freedesktop//DTD D-Bus Bus Configuration 1.0//EN"
+ "http://www.freedesktop.org/standards/dbus/1.0/busconfig.dtd">
+<busconfig>
+  <listen>unix:path={socket}</listen>
+  <auth>EXTERNAL</auth>
+  <policy context="default">
+    <allow user="*"/>
+    <allow own="*"/>
+    <allow send_type="method_call"/>
+    <allow send_type="signal"/>
+    <allow send_type="method_return"/>
+    <allow send_type="error"/>
+    <allow receive_type="method_call"/>
+    <allow receive_type="signal"/>
+    <allow receive_type="method_return"/>
+    <allow receive_type="error"/>
+  </policy>
+</busconfig>
+"""
+
+
+class PrivateBus:
+    """
+    A dbus-daemon listening on a socket in a temporary directory
+    """
+
+    def __init__(self):
+        self.address: Optional[str] = None
+        self._directory: Optional[str] = None
+        self._process: Optional[subprocess.Popen] = None
+
+    @staticmethod
+    def available() -> bool:
+        """Whether dbus-daemon is installed"""
+        return shutil.which("dbus-daemon") is not None
+
+    def start(self) -> str:
+        """Start the daemon and return its address"""
+        self._directory = tempfile.mkdtemp()
+        config: str = os.path.join(self._directory, "bus.conf")
+        socket: str = os.path.join(self._directory, "bus")
+        with open(config, "w") as f:
+            f.write(CONFIG.format(socket=socket))
+        self._process = subprocess.Popen(
+            ["dbus-daemon", "--config-file=" + config, "--nofork", "--print-address"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        assert self._process.stdout is not None
+        self.address = self._process.stdout.readline().decode().strip()
+        return self.address
+
+    def stop(self):
+        """Stop the daemon and remove its socket"""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.wait()
+            self._process = None
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+
+class FakeAdapter(ServiceInterface):
+    def __init__(self, address: str = "00:11:22:33:44:55"):
+        super(FakeAdapter, self).__init__("org.bluez.Adapter1")
+        self._address: str = address
+        self._alias: str = "fake"
+        self._powered: bool = True
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Address(self) -> "s":  # type: ignore # noqa: F821 N802
+        return self._address
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Powered(self) -> "b":  # type: ignore # noqa: F821 N802
+        return self._powered
+
+    @dbus_property()
+    def Alias(self) -> "s":  # type: ignore # noqa: F821 N802
+        return self._alias
+
+    @Alias.setter  # type: ignore
+    def Alias(self, value: "s"):  # type: ignore # noqa: F821 N802
+        self._alias = value
+        self.emit_properties_changed({"Alias": value})
+
+
+class FakeDevice(ServiceInterface):
+    def __init__(self, address: str, adapter_path: str, connected: bool):
+        super(FakeDevice, self).__init__(DEVICE)
+        self._address: str = address
+        self._adapter: str = adapter_path
+        self._connected: bool = connected
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Address(self) -> "s":  # type: ignore # noqa: F821 N802
+        return self._address
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Adapter(self) -> "o":  # type: ignore # noqa: F821 N802
+        return self._adapter
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Connected(self) -> "b":  # type: ignore # noqa: F821 N802
+        return self._connected
+
+
+class FakeGattManager(ServiceInterface):
+    # Calls are answered by FakeBlueZ._on_message, which knows the caller
+    def __init__(self):
+        super(FakeGattManager, self).__init__(GATT_MANAGER)
+
+    @method()
+    def RegisterApplication(self, path: "o", options: "a{sv}"):  # type: ignore # noqa: F821 F722 N802 E501
+        pass
+
+    @method()
+    def UnregisterApplication(self, path: "o"):  # type: ignore # noqa: F821 N802
+        pass
+
+
+class FakeAdvertisingManager(ServiceInterface):
+    def __init__(self, bluez: "FakeBlueZ", adapter_path: str):
+        super(FakeAdvertisingManager, self).__init__(ADVERTISING_MANAGER)
+        self.bluez: "FakeBlueZ" = bluez
+        self.adapter_path: str = adapter_path
+
+    @method()
+    def RegisterAdvertisement(self, path: "o", options: "a{sv}"):  # type: ignore # noqa: F821 F722 N802 E501
+        pass
+
+    @method()
+    def UnregisterAdvertisement(self, path: "o"):  # type: ignore # noqa: F821 N802
+        pass
+
+    @dbus_property(access=PropertyAccess.READ)
+    def ActiveInstances(self) -> "y":  # type: ignore # noqa: F821 N802
+        return len(self.bluez.advertisements_on(self.adapter_path))
+
+    @dbus_property(access=PropertyAccess.READ)
+    def SupportedInstances(self) -> "y":  # type: ignore # noqa: F821 N802
+        return self.bluez.supported_instances - len(
+            self.bluez.advertisements_on(self.adapter_path)
+        )
+
+    @dbus_property(access=PropertyAccess.READ)
+    def SupportedIncludes(self) -> "as":  # type: ignore # noqa: F821 F722 N802
+        return ["tx-power", "appearance", "local-name"]
+
+
+class FakeBlueZ:
+    """
+    Owns org.bluez on a bus and plays the part of bluetoothd and of a remote
+    central
+
+    Attributes
+    ----------
+    applications : Dict[str, Dict[str, Dict[str, Any]]]
+        The managed objects of the registered applications, by path
+    registrations : Set[Tuple[str, str]]
+        The adapter path and application path of every registration
+    advertisements : Dict[str, Dict[str, Any]]
+        The properties of every registered advertisement, by path
+    advertised_on : Dict[str, str]
+        The adapter path of every registered advertisement, by path
+    notifications : List[Tuple[str, bytes]]
+        The characteristic path and value of every notification received
+    calls : List[Tuple[str, str, str]]
+        The path, interface and member of every method call received, e.g.
+        to count round trips
+    latency : float
+        Seconds bluetoothd takes to answer the manager calls and adapter
+        property changes, as it does when it talks to the controller
+    adapter_delay : float
+        Seconds between claiming org.bluez and exporting the adapters, as
+        bluetoothd takes to bring its controllers up
+    """
+
+    def __init__(
+        self,
+        supported_instances: int = 5,
+        adapters: int = 1,
+        latency: float = 0.0,
+        adapter_delay: float = 0.0,
+    ):
+        self.supported_instances: int = supported_instances
+        self.latency: float = latency
+        self.adapter_delay: float = adapter_delay
+        self.address: Optional[str] = None
+        self.adapter_paths: List[str] = [
+            "/org/bluez/hci{}".format(i) for i in range(adapters)
+        ]
+        self.bus: Optional[MessageBus] = None
+        self.owner: Optional[str] = None
+        self.applications: Dict[str, Dict[str, Any]] = {}
+        self.registrations: Set[Tuple[str, str]] = set()
+        self.advertisements: Dict[str, Dict[str, Any]] = {}
+        self.advertised_on: Dict[str, str] = {}
+        self.notifications: List[Tuple[str, bytes]] = []
+        self.calls: List[Tuple[str, str, str]] = []
+        self.adapters: Dict[str, FakeAdapter] = {}
+        self.advertising_managers: Dict[str, FakeAdvertisingManager] = {}
+        self.notified: asyncio.Event = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self, address: str):
+        """Claim org.bluez on the bus at address and export the adapters"""
+        self.address = address
+        self.bus = await MessageBus(bus_address=address).connect()
+        # Anything exported at "/" makes it introspect with ObjectManager
+        self.bus.export("/", ServiceInterface("org.bluez.FakeRoot1"))
+        self.bus.add_message_handler(self._on_message)
+        await self.bus.request_name("org.bluez")
+        if self.adapter_delay > 0:
+            await asyncio.sleep(self.adapter_delay)
+        for i, path in enumerate(self.adapter_paths):
+            self.adapters[path] = FakeAdapter("00:11:22:33:44:{:02X}".format(0x55 + i))
+            self.advertising_managers[path] = FakeAdvertisingManager(self, path)
+            self.bus.export(path, self.adapters[path])
+            self.bus.export(path, FakeGattManager())
+            self.bus.export(path, self.advertising_managers[path])
+
+    def stop(self):
+        """Exit, releasing org.bluez"""
+        for task in self._tasks:
+            task.cancel()
+        if self.bus is not None:
+            self.bus.disconnect()
+            self.bus = None
+
+    async def restart(self, downtime: float = 0.0):
+        """
+        Exit, forgetting every registration, and start again on a new
+        connection, as bluetoothd does when it is restarted
+        """
+        assert self.address is not None
+        self.stop()
+        self.owner = None
+        self.applications = {}
+        self.registrations.clear()
+        self.advertisements.clear()
+        self.advertised_on.clear()
+        await asyncio.sleep(downtime)
+        await self.start(self.address)
+
+    def set_powered(self, adapter_path: str, powered: bool):
+        """Power an adapter off, which drops its advertisements, or on"""
+        self.adapters[adapter_path]._powered = powered
+        self.adapters[adapter_path].emit_properties_changed({"Powered": powered})
+        if not powered:
+            for path in self.advertisements_on(adapter_path):
+                del self.advertisements[path]
+                del self.advertised_on[path]
+            self._instances_changed(adapter_path)
+
+    # The central's side
+
+    def characteristic(self, uuid: str) -> str:
+        """The path of the registered characteristic with the UUID"""
+        for path, interfaces in self.applications.items():
+            properties: Optional[Dict[str, Any]] = interfaces.get(CHARACTERISTIC)
+            if properties is not None and properties["UUID"].value == uuid:
+                return path
+        raise KeyError(uuid)
+
+    async def read(self, uuid: str, offset: int = 0, mtu: int = 23) -> bytes:
+        """ReadValue as bluetoothd sends it for a Read or Read Blob request"""
+        reply: Message = await self._call(
+            self.characteristic(uuid),
+            CHARACTERISTIC,
+            "ReadValue",
+            "a{sv}",
+            [self._options(offset=offset, mtu=mtu)],
+        )
+        return reply.body[0]
+
+    async def read_long(self, uuid: str, mtu: int = 23) -> bytes:
+        """Read a value longer than the MTU with Read Blob requests"""
+        chunk_size: int = mtu - 1
+        value: bytes = b""
+        while True:
+            chunk: bytes = (await self.read(uuid, len(value), mtu))[:chunk_size]
+            value += chunk
+            if len(chunk) < chunk_size:
+                return value
+
+    async def write(self, uuid: str, value: bytes, command: bool = False):
+        """WriteValue for a Write Request, or a Write Command"""
+        options: Dict[str, Variant] = self._options(offset=0, mtu=23)
+        options["type"] = Variant("s", "command" if command else "request")
+        await self._call(
+            self.characteristic(uuid),
+            CHARACTERISTIC,
+            "WriteValue",
+            "aya{sv}",
+            [bytes(value), options],
+        )
+
+    async def acquire_write(self, uuid: str) -> Tuple[int, int]:
+        """AcquireWrite, returning the file descriptor and MTU"""
+        reply: Message = await self._call(
+            self.characteristic(uuid),
+            CHARACTERISTIC,
+            "AcquireWrite",
+            "a{sv}",
+            [self._options(mtu=23)],
+        )
+        return reply.unix_fds[reply.body[0]], reply.body[1]
+
+    async def start_notify(self, uuid: str):
+        await self._call(self.characteristic(uuid), CHARACTERISTIC, "StartNotify")
+
+    async def stop_notify(self, uuid: str):
+        await self._call(self.characteristic(uuid), CHARACTERISTIC, "StopNotify")
+
+    async def wait_for_notifications(self, count: int, timeout: float = 5.0):
+        async def wait():
+            while len(self.notifications) < count:
+                self.notified.clear()
+                await self.notified.wait()
+
+        await asyncio.wait_for(wait(), timeout)
+
+    @property
+    def registered(self) -> Set[str]:
+        """The paths of the adapters an application is registered with"""
+        return {adapter_path for adapter_path, _ in self.registrations}
+
+    def advertisements_on(self, adapter_path: str) -> List[str]:
+        """The paths of the advertisements registered on an adapter"""
+        return [p for p, a in self.advertised_on.items() if a == adapter_path]
+
+    def add_device(
+        self, address: str, connected: bool = False, adapter_path: str = ADAPTER_PATH
+    ):
+        """
+        Export a device, as bluetoothd does for every device it has seen or
+        paired with, whether or not it is connected
+        """
+        assert self.bus is not None
+        path: str = "{}/dev_{}".format(adapter_path, address.replace(":", "_"))
+        self.bus.export(path, FakeDevice(address, adapter_path, connected))
+
+    def connect_device(
+        self, address: str, connected: bool = True, adapter_path: str = ADAPTER_PATH
+    ):
+        """Announce a central connecting to, or disconnecting from, an adapter"""
+        assert self.bus is not None
+        path: str = "{}/dev_{}".format(adapter_path, address.replace(":", "_"))
+        properties: Dict[str, Variant] = {
+            "Address": Variant("s", address),
+            "Adapter": Variant("o", adapter_path),
+            "Connected": Variant("b", connected),
+        }
+        if connected:
+            signal = Message.new_signal(
+                "/", OBJECT_MANAGER, "InterfacesAdded", "oa{sa{sv}}",
+                [path, {DEVICE: properties}],
+            )
+        else:
+            signal = Message.new_signal(
+                path, PROPERTIES, "PropertiesChanged", "sa{sv}as",
+                [DEVICE, {"Connected": Variant("b", False)}, []],
+            )
+        self.bus.send(signal)
+
+    @staticmethod
+    def alias_message(adapter_path: str, alias: str) -> Message:
+        """The Properties.Set call another program makes to rename an adapter"""
+        return Message(
+            destination="org.bluez",
+            path=adapter_path,
+            interface=PROPERTIES,
+            member="Set",
+            signature="ssv",
+            body=["org.bluez.Adapter1", "Alias", Variant("s", alias)],
+        )
+
+    # bluetoothd's side
+
+    def _on_message(self, message: Message) -> Any:
+        if message.message_type == MessageType.SIGNAL:
+            if (
+                message.member == "PropertiesChanged"
+                and message.sender == self.owner
+                and message.body[0] == CHARACTERISTIC
+                and "Value" in message.body[1]
+            ):
+                self.notifications.append(
+                    (message.path, bytes(message.body[1]["Value"].value))
+                )
+                self.notified.set()
+            return False
+        if message.message_type != MessageType.METHOD_CALL:
+            return False
+        self.calls.append((message.path, message.interface, message.member))
+        if (
+            self.latency > 0
+            and message.interface == PROPERTIES
+            and message.member == "Set"
+            and message.path in self.adapters
+        ):
+            self._tasks.append(asyncio.ensure_future(self._set(message)))
+            return True
+        if message.interface not in (GATT_MANAGER, ADVERTISING_MANAGER):
+            return False
+        self._tasks.append(asyncio.ensure_future(self._handle(message)))
+        return True
+
+    async def _set(self, message: Message):
+        assert self.bus is not None
+        await asyncio.sleep(self.latency)
+        interface, name, value = message.body
+        setattr(self.adapters[message.path], name, value.value)
+        self.bus.send(Message.new_method_return(message))
+
+    async def _handle(self, message: Message):
+        assert self.bus is not None
+        await asyncio.sleep(self.latency)
+        try:
+            path: str = message.body[0]
+            if message.member == "RegisterApplication":
+                if (message.path, path) in self.registrations:
+                    raise DBusError("org.bluez.Error.AlreadyExists", "Already Exists")
+                await self._register_application(message.sender, path)
+                self.registrations.add((message.path, path))
+            elif message.member == "UnregisterApplication":
+                self.registrations.discard((message.path, path))
+                if path not in {p for _, p in self.registrations}:
+                    self.applications = {
+                        p: interfaces
+                        for p, interfaces in self.applications.items()
+                        if not p.startswith(path + "/")
+                    }
+                if len(self.registrations) == 0:
+                    self.owner = None
+            elif message.member == "RegisterAdvertisement":
+                if path in self.advertisements:
+                    raise DBusError("org.bluez.Error.AlreadyExists", "Already Exists")
+                if not self.adapters[message.path]._powered:
+                    raise DBusError("org.bluez.Error.NotReady", "Resource Not Ready")
+                in_use: int = len(self.advertisements_on(message.path))
+                if in_use >= self.supported_instances:
+                    raise DBusError(
+                        "org.bluez.Error.Failed", "Maximum advertisements reached"
+                    )
+                reply: Message = await self._call(
+                    path, PROPERTIES, "GetAll", "s", ["org.bluez.LEAdvertisement1"],
+                    destination=message.sender,
+                )
+                self.advertisements[path] = {
+                    k: v.value for k, v in reply.body[0].items()
+                }
+                self.advertised_on[path] = message.path
+                self._instances_changed(message.path)
+            elif message.member == "UnregisterAdvertisement":
+                del self.advertisements[path]
+                del self.advertised_on[path]
+                self._instances_changed(message.path)
+        except DBusError as e:
+            self.bus.send(Message.new_error(message, e.type, e.text))
+        else:
+            self.bus.send(Message.new_method_return(message))
+
+    def _instances_changed(self, adapter_path: str):
+        in_use: int = len(self.advertisements_on(adapter_path))
+        self.advertising_managers[adapter_path].emit_properties_changed(
+            {
+                "ActiveInstances": in_use,
+                "SupportedInstances": self.supported_instances - in_use,
+            }
+        )
+
+    async def _register_application(self, sender: str, path: str):
+        assert self.bus is not None
+        self.owner = sender
+        await self._add_match(
+            "type='signal',sender='{}',interface='{}',"
+            "member='PropertiesChanged'".format(sender, PROPERTIES)
+        )
+        reply: Message = await self._call(
+            path, OBJECT_MANAGER, "GetManagedObjects", destination=sender
+        )
+        self.applications.update(reply.body[0])
+
+    async def _add_match(self, rule: str):
+        assert self.bus is not None
+        await self.bus.call(
+            Message(
+                destination="org.freedesktop.DBus",
+                path="/org/freedesktop/DBus",
+                interface="org.freedesktop.DBus",
+                member="AddMatch",
+                signature="s",
+                body=[rule],
+            )
+        )
+
+    async def _call(
+        self,
+        path: str,
+        interface: str,
+        member: str,
+        signature: str = "",
+        body: Optional[List[Any]] = None,
+        destination: Optional[str] = None,
+    ) -> Message:
+        assert self.bus is not None
+        target: Optional[str] = destination or self.owner
+        assert target is not None
+        reply: Optional[Message] = await self.bus.call(
+            Message(
+                destination=target,
+                path=path,
+                interface=interface,
+                member=member,
+                signature=signature,
+                body=body or [],
+            )
+        )
+        assert reply is not None
+        if reply.message_type == MessageType.ERROR:
+            raise DBusError(reply.error_name, reply.body[0] if reply.body else "")
+        return reply
+
+    @staticmethod
+    def _options(**options: int) -> Dict[str, Variant]:
+        result: Dict[str, Variant] = {
+            "device": Variant("o", ADAPTER_PATH + "/dev_AA_BB_CC_DD_EE_FF"),
+        }
+        for name, value in options.items():
+            result[name] = Variant("q", value)
+        return result
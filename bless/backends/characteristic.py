@@ -2,14 +2,17 @@ import abc
 
 from enum import Flag
 from uuid import UUID
-from typing import Union, Optional, cast, List, TYPE_CHECKING
+from functools import lru_cache
+from typing import Any, Union, Optional, cast, List, TYPE_CHECKING
 
 from bleak.backends.characteristic import (  # type: ignore
     BleakGATTCharacteristic,
     CharacteristicPropertyName,
 )
 
-from .attribute import GATTAttributePermissions
+from .attribute import GATTAttributePermissions, intern_uuid
+from .codec import CharacteristicCodec
+from bless.exceptions import BlessATTError, BlessError
 
 if TYPE_CHECKING:
     from bless.backends.service import BlessGATTService
@@ -46,9 +49,12 @@ _PROPERTY_FLAG_TO_NAME = [
 ]
 
 
+@lru_cache(maxsize=None)
 def _properties_to_bleak(
     properties: GATTCharacteristicProperties,
 ) -> List[CharacteristicPropertyName]:
+    # Characteristics with the same properties share the list, so it must not
+    # be changed in place
     result: List[CharacteristicPropertyName] = []
     for flag, name in _PROPERTY_FLAG_TO_NAME:
         if properties & flag:
@@ -56,11 +62,44 @@ def _properties_to_bleak(
     return result
 
 
+def default_max_write_without_response_size() -> int:
+    """
+    The write without response size reported to bleak when the backend does
+    not know the MTU. A plain function, so that characteristics need not each
+    hold a closure
+
+    Returns
+    -------
+    int
+        512 bytes, the largest attribute value
+    """
+    return 512
+
+
 class BlessGATTCharacteristic(BleakGATTCharacteristic):
     """
     Extension of the BleakGATTCharacteristic to allow for writeable values
+
+    Attributes
+    ----------
+    codec : Optional[CharacteristicCodec]
+        Converts between native values and the characteristic bytes. When
+        set, read handlers may return native values, write handlers receive
+        decoded values and update_value accepts a native value
+    read_deadline : Optional[float]
+        Seconds the read handler may take. A read that misses the deadline is
+        answered with read_error if set, otherwise with the last value the
+        handler returned, or the stored value if it never returned one
+    read_error : Optional[BlessATTError]
+        The error that answers a read that missed its deadline
     """
 
+    codec: Optional[CharacteristicCodec] = None
+    read_deadline: Optional[float] = None
+    read_error: Optional[BlessATTError] = None
+    # The last value returned by the read handler, encoded
+    _last_read: Optional[bytearray] = None
+
     def __init__(
         self,
         uuid: Union[str, UUID],
@@ -84,10 +123,7 @@ class BlessGATTCharacteristic(BleakGATTCharacteristic):
         value : Optional[bytearray]
             The binary value of the characteristic
         """
-        if type(uuid) is str:
-            uuid_str: str = cast(str, uuid)
-            uuid = UUID(uuid_str)
-        self._uuid: str = str(uuid)
+        self._uuid: str = intern_uuid(uuid)
         self._properties_flags: GATTCharacteristicProperties = properties
         self._properties: List[CharacteristicPropertyName] = _properties_to_bleak(
             properties
@@ -121,6 +157,26 @@ class BlessGATTCharacteristic(BleakGATTCharacteristic):
         """Set the value of this characteristic"""
         raise NotImplementedError()
 
+    @property
+    def typed_value(self) -> Any:
+        """The value of this characteristic decoded by its codec"""
+        if self.codec is None:
+            raise BlessError("Characteristic {} has no codec".format(self.uuid))
+        return self.codec.decode(bytes(self.value))
+
+    @typed_value.setter
+    def typed_value(self, value: Any):
+        """
+        Set the value of this characteristic from a native value. Bytes are
+        stored as is
+        """
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            self.value = bytearray(value)
+        elif self.codec is None:
+            raise BlessError("Characteristic {} has no codec".format(self.uuid))
+        else:
+            self.value = bytearray(self.codec.encode(value))
+
     def get_descriptor(
         self, specifier: Union[int, str, UUID]
     ) -> Optional["BlessGATTDescriptor"]:
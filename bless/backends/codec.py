@@ -0,0 +1,294 @@
+import struct
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, List, Sequence, Tuple, Union
+
+# struct format characters that hold integers and therefore need rounding
+# once scaled
+_INTEGER_FORMATS: str = "bBhHiIlLqQnN?"
+_BYTE_ORDERS: str = "@=<>!"
+
+# The MTU every connection starts with
+DEFAULT_MTU: int = 23
+
+
+@dataclass(frozen=True)
+class Field:
+    """
+    One field of a characteristic value
+
+    The physical value is raw * scale + offset, where raw is what is sent
+    over the air. E.g. a temperature in hundredths of a degree is
+    Field("temperature", "h", scale=0.01)
+
+    Attributes
+    ----------
+    name : str
+        The name of the field
+    format : str
+        A single struct format code, e.g. "h" or "f", optionally preceded by
+        pad bytes
+    scale : float
+        The size of one raw unit
+    offset : float
+        The physical value of raw 0
+    """
+
+    name: str
+    format: str
+    scale: float = 1.0
+    offset: float = 0.0
+
+
+class CharacteristicCodec:
+    """
+    Converts between native values and characteristic bytes
+
+    The layout is compiled once into a struct.Struct. Values with a single
+    field encode from and decode to a scalar, otherwise to a tuple. Encoding
+    also accepts a dict keyed by field name and numpy scalars, records and
+    arrays.
+    """
+
+    def __init__(self, fmt: Union[str, Sequence[Field]], byteorder: str = "<"):
+        """
+        Parameters
+        ----------
+        fmt : Union[str, Sequence[Field]]
+            A struct format string, e.g. "<hhh", or the fields of the value
+        byteorder : str
+            The struct byte order used for fields, and for a format string
+            that does not begin with one. Bluetooth SIG values are little
+            endian
+        """
+        if isinstance(fmt, str):
+            if fmt[:1] in _BYTE_ORDERS:
+                byteorder, fmt = fmt[0], fmt[1:]
+            codes: List[str] = _split_format(fmt)
+            fields: List[Field] = [
+                Field("field{}".format(i), code) for i, code in enumerate(codes)
+            ]
+        else:
+            fields = list(fmt)
+
+        self.fields: Tuple[Field, ...] = tuple(fields)
+        self.names: Tuple[str, ...] = tuple(f.name for f in self.fields)
+        self.struct: struct.Struct = struct.Struct(
+            byteorder + "".join(f.format for f in self.fields)
+        )
+        self._scaled: bool = any(f.scale != 1 or f.offset != 0 for f in fields)
+        self._integer: Tuple[bool, ...] = tuple(
+            f.format.rstrip("x0123456789")[-1:] in _INTEGER_FORMATS
+            for f in self.fields
+        )
+
+    @property
+    def size(self) -> int:
+        """The number of bytes in one encoded value"""
+        return self.struct.size
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Parameters
+        ----------
+        value : Any
+            The native value
+
+        Returns
+        -------
+        bytes
+            The characteristic bytes
+        """
+        return self.struct.pack(*self._raw(value))
+
+    def pack_into(self, buffer: Any, offset: int, value: Any):
+        """
+        Encode a value directly into a writable buffer
+
+        Parameters
+        ----------
+        buffer : Any
+            A writable buffer such as a bytearray
+        offset : int
+            The byte offset to write at
+        value : Any
+            The native value
+        """
+        self.struct.pack_into(buffer, offset, *self._raw(value))
+
+    def decode(self, data: Any) -> Any:
+        """
+        Parameters
+        ----------
+        data : Any
+            The characteristic bytes, of exactly size bytes
+
+        Returns
+        -------
+        Any
+            The native value
+        """
+        raw: Tuple[Any, ...] = self.struct.unpack(data)
+        if self._scaled:
+            raw = tuple(
+                r * f.scale + f.offset for r, f in zip(raw, self.fields)
+            )
+        return raw[0] if len(raw) == 1 else raw
+
+    def _raw(self, value: Any) -> Sequence[Any]:
+        if hasattr(value, "tolist"):
+            # numpy scalars, records and arrays
+            value = value.tolist()
+        if isinstance(value, dict):
+            values: Sequence[Any] = [value[name] for name in self.names]
+        elif isinstance(value, (tuple, list)):
+            values = value
+        else:
+            values = (value,)
+        if not self._scaled:
+            return values
+        return [
+            round((v - f.offset) / f.scale) if integer else (v - f.offset) / f.scale
+            for v, f, integer in zip(values, self.fields, self._integer)
+        ]
+
+
+class BatchEncoder:
+    """
+    Packs consecutive samples into notification sized payloads
+
+    Samples are written with pack_into into one buffer that is reused for
+    every payload, so each payload must be sent before the next one is
+    requested.
+    """
+
+    # The ATT notification header takes 3 bytes of the MTU
+    HEADER_SIZE: int = 3
+
+    def __init__(self, codec: CharacteristicCodec, mtu: int = DEFAULT_MTU):
+        """
+        Parameters
+        ----------
+        codec : CharacteristicCodec
+            The codec of one sample
+        mtu : int
+            The ATT MTU of the connection
+        """
+        self.codec: CharacteristicCodec = codec
+        self.mtu: int = mtu
+        self.capacity: int = self.samples_per_payload(codec, mtu)
+        self._buffer: bytearray = bytearray(self.capacity * codec.size)
+
+    @classmethod
+    def payload_size(cls, mtu: int) -> int:
+        """
+        The number of bytes one notification carries at an MTU
+
+        Parameters
+        ----------
+        mtu : int
+            The ATT MTU of the connection
+
+        Returns
+        -------
+        int
+            The MTU less the ATT notification header
+        """
+        return mtu - cls.HEADER_SIZE
+
+    @classmethod
+    def samples_per_payload(
+        cls, codec: CharacteristicCodec, mtu: int, reserved: int = 0
+    ) -> int:
+        """
+        The number of samples that fit in one notification, never less than
+        one
+
+        Parameters
+        ----------
+        codec : CharacteristicCodec
+            The codec of one sample
+        mtu : int
+            The ATT MTU of the connection
+        reserved : int
+            Bytes of the payload taken by a header of the caller's own
+
+        Returns
+        -------
+        int
+            The number of samples
+        """
+        return max((cls.payload_size(mtu) - reserved) // codec.size, 1)
+
+    def encode(self, samples: Iterable[Any]) -> memoryview:
+        """
+        Pack up to capacity samples into the buffer
+
+        Parameters
+        ----------
+        samples : Iterable[Any]
+            The native samples
+
+        Returns
+        -------
+        memoryview
+            A view of the packed bytes, valid until the next call
+        """
+        size: int = self.codec.size
+        count: int = 0
+        for sample in samples:
+            if count == self.capacity:
+                raise ValueError(
+                    "Only {} samples fit in an MTU of {}".format(
+                        self.capacity, self.mtu
+                    )
+                )
+            self.codec.pack_into(self._buffer, count * size, sample)
+            count += 1
+        return memoryview(self._buffer)[: count * size]
+
+    def packets(self, samples: Sequence[Any]) -> Iterator[memoryview]:
+        """
+        Split samples into as few payloads as possible
+
+        Parameters
+        ----------
+        samples : Sequence[Any]
+            The native samples
+
+        Returns
+        -------
+        Iterator[memoryview]
+            Views of each payload, each valid until the next is produced
+        """
+        for start in range(0, len(samples), self.capacity):
+            yield self.encode(samples[start:start + self.capacity])
+
+
+def _split_format(fmt: str) -> List[str]:
+    """
+    Split a struct format without byte order into one code per field, keeping
+    repeat counts on "s" and "p" which are a single field
+    """
+    codes: List[str] = []
+    count: str = ""
+    padding: str = ""
+    for char in fmt:
+        if char.isdigit():
+            count += char
+        elif char.isspace():
+            continue
+        elif char == "x":
+            # Pad bytes carry no value, so they travel with the next field
+            padding += count + char
+            count = ""
+        elif char in "sp":
+            codes.append(padding + count + char)
+            count = padding = ""
+        else:
+            codes.append(padding + char)
+            codes.extend([char] * ((int(count) if count else 1) - 1))
+            count = padding = ""
+    if padding:
+        codes[-1] += padding
+    return codes
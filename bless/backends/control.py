@@ -0,0 +1,244 @@
+import asyncio
+import logging
+import os
+import stat
+import struct
+
+from enum import IntEnum
+from uuid import UUID
+from typing import Any, Dict, Optional, Set, TYPE_CHECKING
+
+from bless.backends.characteristic import BlessGATTCharacteristic
+from bless.exceptions import BlessError
+
+if TYPE_CHECKING:
+    from bless.backends.server import BaseBlessServer
+
+logger = logging.getLogger(__name__)
+
+HEADER: struct.Struct = struct.Struct("<IBI")
+COUNT: struct.Struct = struct.Struct("<I")
+LENGTH: struct.Struct = struct.Struct("<H")
+UUID_SIZE: int = 16
+# Frames larger than this are treated as a protocol error
+MAX_BODY_SIZE: int = 1 << 20
+# Pause reading a connection while this much output is queued for it
+HIGH_WATER: int = 1 << 16
+
+
+class Opcode(IntEnum):
+    SET_VALUE = 0x01
+    NOTIFY = 0x02
+    BATCH_NOTIFY = 0x03
+    SUBSCRIBE_WRITES = 0x04
+    UNSUBSCRIBE_WRITES = 0x05
+    OK = 0x80
+    ERROR = 0x81
+    WRITE_EVENT = 0x82
+
+
+def frame(opcode: Opcode, request_id: int = 0, body: bytes = b"") -> bytes:
+    """
+    Build a frame
+
+    Parameters
+    ----------
+    opcode : Opcode
+        The request, reply or event
+    request_id : int
+        The id echoed in the reply, 0 for no reply
+    body : bytes
+        The body
+
+    Returns
+    -------
+    bytes
+        The header and body
+    """
+    return HEADER.pack(len(body), opcode, request_id) + body
+
+
+class ControlServer:
+    """
+    Serves the control protocol for one BaseBlessServer over a Unix domain
+    socket, so that other local programs can feed values and receive writes
+
+    Every frame, in both directions, is a 9 byte little endian header followed by
+    a body::
+
+        u32 body length | u8 opcode | u32 request id | body
+
+    Characteristics are addressed by their UUID as 16 raw bytes, big endian as in
+    RFC 4122. Requests with a non-zero id are answered with OK or ERROR carrying
+    the same id, requests with id 0 are not answered, so a producer can pipeline
+    any number of requests without waiting. Requests on one connection are
+    handled in order.
+
+    Requests:
+
+    - SET_VALUE (0x01): uuid | value. Store the value without notifying
+    - NOTIFY (0x02): uuid | value. Store the value and notify subscribers
+    - BATCH_NOTIFY (0x03): repeated uuid | u16 length | value. NOTIFY for each
+      entry, answered with OK carrying the u32 number of entries
+    - SUBSCRIBE_WRITES (0x04): empty. Forward central writes to this connection
+    - UNSUBSCRIBE_WRITES (0x05): empty
+
+    Replies and events:
+
+    - OK (0x80): empty, or a u32 count for BATCH_NOTIFY
+    - ERROR (0x81): a UTF-8 message
+    - WRITE_EVENT (0x82): uuid | value, with request id 0
+    """
+
+    def __init__(self, server: "BaseBlessServer", path: str):
+        """
+        Parameters
+        ----------
+        server : BaseBlessServer
+            The server to feed
+        path : str
+            The filesystem path of the socket
+        """
+        self.server: "BaseBlessServer" = server
+        self.path: str = path
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._write_subscribers: Set[asyncio.StreamWriter] = set()
+        # The task serving each open connection
+        self._connections: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+        self._characteristics: Dict[bytes, BlessGATTCharacteristic] = {}
+
+    async def start(self):
+        """
+        Listen on the socket, replacing a stale socket file. Any other file at
+        the path is left alone and the start fails
+        """
+        self._unlink_socket()
+        self._server = await asyncio.start_unix_server(self._serve, path=self.path)
+        self.server._write_listeners.append(self._on_write)
+
+    async def stop(self):
+        """
+        Close the socket and every connection
+        """
+        if self._on_write in self.server._write_listeners:
+            self.server._write_listeners.remove(self._on_write)
+        if self._server is not None:
+            self._server.close()
+        # wait_closed waits for the connections on Python 3.12 and later, so
+        # they are closed first
+        connections: Dict[asyncio.StreamWriter, asyncio.Task] = dict(
+            self._connections
+        )
+        for writer, task in connections.items():
+            writer.close()
+            task.cancel()
+        await asyncio.gather(*connections.values(), return_exceptions=True)
+        self._write_subscribers.clear()
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+        self._unlink_socket()
+
+    def _unlink_socket(self):
+        try:
+            mode: int = os.stat(self.path).st_mode
+        except FileNotFoundError:
+            return
+        if stat.S_ISSOCK(mode):
+            os.unlink(self.path)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task: Optional[asyncio.Task] = asyncio.current_task()
+        if task is not None:
+            self._connections[writer] = task
+        try:
+            while True:
+                try:
+                    header: bytes = await reader.readexactly(HEADER.size)
+                except asyncio.IncompleteReadError:
+                    break
+                length, opcode, request_id = HEADER.unpack(header)
+                if length > MAX_BODY_SIZE:
+                    writer.write(frame(Opcode.ERROR, request_id, b"Frame too large"))
+                    break
+                body: bytes = await reader.readexactly(length)
+                try:
+                    reply: bytes = self._handle(opcode, body, writer)
+                except Exception as e:
+                    logger.debug("Control request {} failed: {}".format(opcode, e))
+                    if request_id != 0:
+                        writer.write(frame(Opcode.ERROR, request_id, str(e).encode()))
+                else:
+                    if request_id != 0:
+                        writer.write(frame(Opcode.OK, request_id, reply))
+                if writer.transport.get_write_buffer_size() > HIGH_WATER:
+                    await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            self._write_subscribers.discard(writer)
+            writer.close()
+
+    def _handle(self, opcode: int, body: bytes, writer: asyncio.StreamWriter) -> bytes:
+        if opcode == Opcode.SET_VALUE:
+            characteristic = self._characteristic(body[:UUID_SIZE])
+            characteristic.typed_value = body[UUID_SIZE:]
+        elif opcode == Opcode.NOTIFY:
+            self._notify(body[:UUID_SIZE], body[UUID_SIZE:])
+        elif opcode == Opcode.BATCH_NOTIFY:
+            view: memoryview = memoryview(body)
+            offset: int = 0
+            count: int = 0
+            while offset < len(body):
+                key: bytes = bytes(view[offset:offset + UUID_SIZE])
+                offset += UUID_SIZE
+                (length,) = LENGTH.unpack_from(body, offset)
+                offset += LENGTH.size
+                self._notify(key, view[offset:offset + length])
+                offset += length
+                count += 1
+            return COUNT.pack(count)
+        elif opcode == Opcode.SUBSCRIBE_WRITES:
+            self._write_subscribers.add(writer)
+        elif opcode == Opcode.UNSUBSCRIBE_WRITES:
+            self._write_subscribers.discard(writer)
+        else:
+            raise BlessError("Unknown opcode {}".format(opcode))
+        return b""
+
+    def _notify(self, key: bytes, value: Any):
+        characteristic: BlessGATTCharacteristic = self._characteristic(key)
+        self.server.update_value(
+            characteristic.service_uuid, characteristic.uuid, bytes(value)
+        )
+
+    def _characteristic(self, key: bytes) -> BlessGATTCharacteristic:
+        characteristic: Optional[
+            BlessGATTCharacteristic
+        ] = self._characteristics.get(key)
+        if characteristic is None:
+            if len(key) != UUID_SIZE:
+                raise BlessError("Truncated UUID")
+            uuid: str = str(UUID(bytes=key))
+            characteristic = self.server.get_characteristic(uuid)
+            if characteristic is None:
+                raise BlessError("Invalid characteristic: {}".format(uuid))
+            self._characteristics[key] = characteristic
+        return characteristic
+
+    def _on_write(self, characteristic: BlessGATTCharacteristic, value: Any):
+        if not self._write_subscribers:
+            return
+        event: bytes = frame(
+            Opcode.WRITE_EVENT, 0, UUID(characteristic.uuid).bytes + bytes(value)
+        )
+        # Some backends deliver writes on their own thread
+        self.server.loop.call_soon_threadsafe(self._broadcast, event)
+
+    def _broadcast(self, event: bytes):
+        for writer in list(self._write_subscribers):
+            if writer.is_closing():
+                self._write_subscribers.discard(writer)
+                continue
+            writer.write(event)
@@ -15,6 +15,7 @@ from bless.backends.characteristic import (
     GATTCharacteristicProperties,
     GATTAttributePermissions,
     BlessGATTCharacteristic as BaseBlessGATTCharacteristic,
+    default_max_write_without_response_size,
 )
 
 
@@ -79,7 +80,9 @@ class BlessGATTCharacteristicCoreBluetooth(
         self.obj = cb_characteristic
         self._service_uuid = service.uuid
         self._handle = 0
-        self._max_write_without_response_size = lambda: 512
+        self._max_write_without_response_size = (
+            default_max_write_without_response_size
+        )
 
     @property
     def service_uuid(self) -> str:
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
         _advertisement_started_event: Any
         _services_added_events: Dict[str, Any]
         _central_subscriptions: Dict[str, Any]
+        _centrals: Dict[str, Any]
         server: Optional[Any]
         pyobjc_classMethods: Any
 
@@ -119,6 +120,7 @@ else:
             self._powered_on_event.wait()
 
             self._central_subscriptions: Dict = {}
+            self._centrals: Dict[str, CBCentral] = {}
 
             if not self.compliant():
                 LOGGER.warning("PeripheralManagerDelegate is not compliant")
@@ -365,6 +367,11 @@ else:
                     )
             else:
                 self._central_subscriptions[central_uuid] = [char_uuid]
+            self._centrals[central_uuid] = central
+            if self.server is not None:
+                self._call_soon_threadsafe(
+                    self.server.subscriptions.subscribe, char_uuid, central_uuid
+                )
 
         def peripheralManager_central_didUnsubscribeFromCharacteristic_(  # noqa: N802 E501
             self,
@@ -382,11 +389,18 @@ else:
             self._central_subscriptions[central_uuid].remove(char_uuid)
             if len(self._central_subscriptions[central_uuid]) < 1:
                 del self._central_subscriptions[central_uuid]
+                self._centrals.pop(central_uuid, None)
+            if self.server is not None:
+                self._call_soon_threadsafe(
+                    self.server.subscriptions.unsubscribe, char_uuid, central_uuid
+                )
 
         def peripheralManagerIsReadyToUpdateSubscribers_(  # noqa: N802
             self, peripheral_manager: CBPeripheralManager
         ):
             LOGGER.debug("Peripheral is ready to update subscribers")
+            if self.server is not None:
+                self._call_soon_threadsafe(self.server._ready_to_update.set)
 
         def peripheralManager_didReceiveReadRequest_(  # noqa: N802
             self, peripheral_manager: CBPeripheralManager, request: CBATTRequest
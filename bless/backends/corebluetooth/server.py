@@ -1,13 +1,15 @@
+import asyncio
 import logging
 
 from uuid import UUID
-from typing import Optional, List, cast
+from typing import Any, Dict, Optional, List, cast
 
 from asyncio import TimeoutError
 from asyncio.events import AbstractEventLoop
 
 from CoreBluetooth import (  # type: ignore
     CBService,
+    CBCentral,
     CBPeripheralManager,
     CBMutableCharacteristic,
     CBMutableDescriptor,
@@ -73,6 +75,12 @@ class BlessServerCoreBluetooth(BaseBlessServer):
         self.peripheral_manager_delegate.read_request_func = self.read_request
         self.peripheral_manager_delegate.write_request_func = self.write_request
 
+        self._advertisement_data: Optional[BlessAdvertisementData] = None
+        self._prioritize_local_name: bool = True
+
+        # Set by the delegate once a full transmit queue has drained
+        self._ready_to_update: asyncio.Event = asyncio.Event()
+
     async def start(
         self,
         advertisement_data: Optional[BlessAdvertisementData] = None,
@@ -104,6 +112,69 @@ class BlessServerCoreBluetooth(BaseBlessServer):
             logger.debug("Adding service: {}".format(bleak_service.uuid))
             await self.peripheral_manager_delegate.add_service(service_obj)
 
+        self._advertisement_data = advertisement_data
+        self._prioritize_local_name = prioritize_local_name
+        advertisement_payload = self._advertisement_payload(
+            advertisement_data, prioritize_local_name
+        )
+        logger.debug("Advertisement Data: {}".format(advertisement_payload))
+        try:
+            await self.peripheral_manager_delegate.start_advertising(
+                advertisement_payload
+            )
+        except TimeoutError:
+            # If advertising fails as a result of bluetooth module power
+            # cycling or advertisement failure, attempt to start again
+            await self.start()
+
+        logger.debug("Advertising...")
+        self._started()
+
+    async def update_advertisement(
+        self, advertisement_data: BlessAdvertisementData, **kwargs
+    ):
+        """
+        Change the advertised local name or service UUIDs. CoreBluetooth has no
+        way to mutate a running advertisement, so advertising is restarted with
+        the new payload
+
+        Parameters
+        ----------
+        advertisement_data : BlessAdvertisementData
+            The advertisement fields to change. Fields that are None are left
+            as they are
+        """
+        if self._advertisement_data is not None:
+            advertisement_data = self._advertisement_data.merge(advertisement_data)
+        self._advertisement_data = advertisement_data
+        advertisement_payload = self._advertisement_payload(
+            advertisement_data, self._prioritize_local_name
+        )
+        logger.debug("Updated Advertisement Data: {}".format(advertisement_payload))
+        await self.peripheral_manager_delegate.stop_advertising()
+        await self.peripheral_manager_delegate.start_advertising(advertisement_payload)
+
+    def _advertisement_payload(
+        self,
+        advertisement_data: Optional[BlessAdvertisementData],
+        prioritize_local_name: bool,
+    ) -> Dict[str, Any]:
+        """
+        Build the CoreBluetooth advertisement dictionary
+
+        Parameters
+        ----------
+        advertisement_data : Optional[BlessAdvertisementData]
+            Optional advertisement payload to customize the local name and
+            service UUIDs advertised
+        prioritize_local_name : bool
+            Whether to drop the service UUIDs in favor of long local names
+
+        Returns
+        -------
+        Dict[str, Any]
+            The payload to hand to startAdvertising
+        """
         local_name: str = self.name
         if advertisement_data and advertisement_data.local_name is not None:
             local_name = advertisement_data.local_name
@@ -121,27 +192,63 @@ class BlessServerCoreBluetooth(BaseBlessServer):
                 map(lambda x: self.services[x].obj.UUID(), self.services)
             )
 
-        advertisement_payload = {
+        return {
             CBAdvertisementDataLocalNameKey: local_name,
             CBAdvertisementDataServiceUUIDsKey: advertisement_uuids,
         }
-        logger.debug("Advertisement Data: {}".format(advertisement_payload))
-        try:
-            await self.peripheral_manager_delegate.start_advertising(
-                advertisement_payload
-            )
-        except TimeoutError:
-            # If advertising fails as a result of bluetooth module power
-            # cycling or advertisement failure, attempt to start again
-            await self.start()
-
-        logger.debug("Advertising...")
 
     async def stop(self):
         """
         Stop the server
         """
         await self.peripheral_manager_delegate.stop_advertising()
+        self._stopped()
+
+    async def _send_indication(
+        self, service_uuid: str, char_uuid: str, central: str
+    ) -> bool:
+        """
+        Indicate the characteristic value to one central. CoreBluetooth
+        handles the confirmation itself and does not report it, so an
+        indication counts as confirmed once CoreBluetooth accepts it into its
+        transmit queue
+
+        Parameters
+        ----------
+        service_uuid : str
+            The string representation of the UUID for the service
+        char_uuid : str
+            The string representation of the UUID for the characteristic
+        central : str
+            The identifier of the central
+
+        Returns
+        -------
+        bool
+            Whether the indication was sent
+        """
+        cb_central: Optional[CBCentral] = (
+            self.peripheral_manager_delegate._centrals.get(central)
+        )
+        if cb_central is None:
+            logger.debug("{} is no longer subscribed to {}".format(central, char_uuid))
+            return False
+        characteristic: BlessGATTCharacteristicCoreBluetooth = cast(
+            BlessGATTCharacteristicCoreBluetooth, self.get_characteristic(char_uuid)
+        )
+        value: bytes = bytes(characteristic.value or b"\x00")
+        peripheral_manager: CBPeripheralManager = (
+            self.peripheral_manager_delegate.peripheral_manager
+        )
+        while True:
+            self._ready_to_update.clear()
+            if peripheral_manager.updateValue_forCharacteristic_onSubscribedCentrals_(
+                value, characteristic.obj, [cb_central]
+            ):
+                break
+            await self._ready_to_update.wait()
+        self._indication_confirmed(char_uuid, central)
+        return True
 
     async def is_connected(self) -> bool:
         """
@@ -250,11 +357,13 @@ class BlessServerCoreBluetooth(BaseBlessServer):
         ]
         characteristic.obj.setDescriptors_(descriptors)
 
-    def update_value(self, service_uuid: str, char_uuid: str) -> bool:
+    def update_value(
+        self, service_uuid: str, char_uuid: str, value: Any = None
+    ) -> bool:
         """
         Update the characteristic value. This is different than using
         characteristic.set_value. This send notifications to subscribed
-        central devices.
+        central devices. Nothing is sent when no central is subscribed.
 
         Parameters
         ----------
@@ -264,6 +373,9 @@ class BlessServerCoreBluetooth(BaseBlessServer):
         char_uuid : str
             The string representation of the UUID for the characteristic to be
             added
+        value : Any
+            Optional new value, native if the characteristic has a codec,
+            stored before notifying
 
         Returns
         -------
@@ -275,8 +387,13 @@ class BlessServerCoreBluetooth(BaseBlessServer):
         characteristic: BlessGATTCharacteristicCoreBluetooth = cast(
             BlessGATTCharacteristicCoreBluetooth, self.get_characteristic(char_uuid)
         )
+        if value is not None:
+            characteristic.typed_value = value
+
+        if not self.subscriptions.is_subscribed(char_uuid):
+            return True
 
-        value: bytes = characteristic.value
+        value = characteristic.value
         value = value if value is not None else b"\x00"
         peripheral_manager: CBPeripheralManager = (
             self.peripheral_manager_delegate.peripheral_manager
@@ -2,11 +2,11 @@ import abc
 
 from enum import Flag
 from uuid import UUID
-from typing import Union, Optional, cast, TYPE_CHECKING
+from typing import Union, Optional, TYPE_CHECKING
 
 from bleak.backends.descriptor import BleakGATTDescriptor  # type: ignore
 
-from .attribute import GATTAttributePermissions
+from .attribute import GATTAttributePermissions, intern_uuid
 
 if TYPE_CHECKING:
     from bless.backends.characteristic import BlessGATTCharacteristic
@@ -52,10 +52,7 @@ class BlessGATTDescriptor(BleakGATTDescriptor):
         value : Optional[bytearray]
             The binary value of the descriptor
         """
-        if type(uuid) is str:
-            uuid_str: str = cast(str, uuid)
-            uuid = UUID(uuid_str)
-        self._uuid: str = str(uuid)
+        self._uuid: str = intern_uuid(uuid)
         self._properties: GATTDescriptorProperties = properties
         self._permissions: GATTAttributePermissions = permissions
         self._initial_value: Optional[bytearray] = value
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import time
+
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class IndicationTracker:
+    """
+    Tracks the indications awaiting confirmation, one per central
+
+    ATT allows a single outstanding indication on each connection, so
+    indications to the same central are serialised by a per-central lock
+    while indications to different centrals are in flight at the same time.
+    """
+
+    def __init__(self):
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._pending: Dict[str, Tuple[str, asyncio.Future, float]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """The number of indications awaiting confirmation"""
+        return len(self._pending)
+
+    def lock(self, central: str) -> asyncio.Lock:
+        """
+        Parameters
+        ----------
+        central : str
+            The identifier of the central
+
+        Returns
+        -------
+        asyncio.Lock
+            The lock to hold while an indication to the central is in flight
+        """
+        lock: Optional[asyncio.Lock] = self._locks.get(central)
+        if lock is None:
+            lock = self._locks[central] = asyncio.Lock()
+        return lock
+
+    def expect(self, char_uuid: str, central: str) -> asyncio.Future:
+        """
+        Record that an indication is about to be sent. Call this before
+        sending so that a fast confirmation cannot be missed
+
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the indicated characteristic
+        central : str
+            The identifier of the central
+
+        Returns
+        -------
+        asyncio.Future
+            Resolves with the round trip in seconds once confirmed
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[central] = (char_uuid, future, time.perf_counter())
+        return future
+
+    def confirm(self, char_uuid: str, central: str) -> Optional[float]:
+        """
+        Resolve the indication in flight to a central
+
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the confirmed characteristic
+        central : str
+            The identifier of the central
+
+        Returns
+        -------
+        Optional[float]
+            The round trip in seconds, None if no matching indication was in
+            flight
+        """
+        pending: Optional[Tuple[str, asyncio.Future, float]] = self._pending.get(
+            central
+        )
+        if pending is None or pending[0] != char_uuid:
+            logger.debug(
+                "Unexpected confirmation from {} for {}".format(central, char_uuid)
+            )
+            return None
+        del self._pending[central]
+        expected_uuid, future, started = pending
+        elapsed: float = time.perf_counter() - started
+        if not future.done():
+            future.set_result(elapsed)
+        return elapsed
+
+    def discard(self, central: str):
+        """
+        Forget the indication in flight to a central, e.g. after a timeout
+
+        Parameters
+        ----------
+        central : str
+            The identifier of the central
+        """
+        pending: Optional[Tuple[str, asyncio.Future, float]] = self._pending.pop(
+            central, None
+        )
+        if pending is not None and not pending[1].done():
+            pending[1].cancel()
@@ -0,0 +1,88 @@
+from uuid import UUID
+from typing import Optional, Union, cast, TYPE_CHECKING
+
+from bleak.backends.characteristic import BleakGATTCharacteristic  # type: ignore
+
+from bless.backends.attribute import GATTAttributePermissions
+from bless.backends.characteristic import (
+    BlessGATTCharacteristic,
+    GATTCharacteristicProperties,
+    default_max_write_without_response_size,
+)
+
+if TYPE_CHECKING:
+    from bless.backends.service import BlessGATTService
+    from bless.backends.loopback.server import BlessServerLoopback
+    from bless.backends.loopback.service import BlessGATTServiceLoopback
+
+
+class BlessGATTCharacteristicLoopback(BlessGATTCharacteristic):
+    """
+    Loopback implementation of the BlessGATTCharacteristic, which only holds
+    its value
+    """
+
+    server: "BlessServerLoopback"
+
+    def __init__(
+        self,
+        uuid: Union[str, UUID],
+        properties: GATTCharacteristicProperties,
+        permissions: GATTAttributePermissions,
+        value: Optional[bytearray],
+    ):
+        """
+        Instantiates a new GATT Characteristic but is not yet assigned to any
+        service or application
+
+        Parameters
+        ----------
+        uuid : Union[str, UUID]
+            The string representation of the universal unique identifier for
+            the characteristic or the actual UUID object
+        properties : GATTCharacteristicProperties
+            The properties that define the characteristics behavior
+        permissions : GATTAttributePermissions
+            Permissions that define the protection levels of the properties
+        value : Optional[bytearray]
+            The binary value of the characteristic
+        """
+        value = value if value is not None else bytearray(b"")
+        super().__init__(uuid, properties, permissions, value)
+        self._value: bytearray = value
+        self._descriptors = {}
+
+    async def init(self, service: "BlessGATTService"):
+        """
+        Give the characteristic a handle in the server's attribute table
+
+        Parameters
+        ----------
+        service : BlessGATTService
+            The service to assign the characteristic to
+        """
+        self.server = cast("BlessGATTServiceLoopback", service).server
+        BleakGATTCharacteristic.__init__(
+            self,
+            None,
+            self.server.new_handle(),
+            self._uuid,
+            self._properties,
+            default_max_write_without_response_size,
+            service,
+        )
+
+    @property
+    def value(self) -> bytearray:
+        """Get the value of the characteristic"""
+        return bytearray(self._value)
+
+    @value.setter
+    def value(self, val: bytearray):
+        """Set the value of the characteristic"""
+        self._value = val
+
+    @property
+    def description(self) -> str:
+        """Description of this characteristic"""
+        return f"Characteristic {self._uuid}"
@@ -0,0 +1,80 @@
+from uuid import UUID
+from typing import Optional, Union, cast, TYPE_CHECKING
+
+from bleak.backends.descriptor import BleakGATTDescriptor  # type: ignore
+
+from bless.backends.attribute import GATTAttributePermissions
+from bless.backends.descriptor import (
+    BlessGATTDescriptor,
+    GATTDescriptorProperties,
+)
+
+if TYPE_CHECKING:
+    from bless.backends.characteristic import BlessGATTCharacteristic
+    from bless.backends.loopback.characteristic import (
+        BlessGATTCharacteristicLoopback,
+    )
+
+
+class BlessGATTDescriptorLoopback(BlessGATTDescriptor):
+    """
+    Loopback implementation of the BlessGATTDescriptor, which only holds its
+    value
+    """
+
+    def __init__(
+        self,
+        uuid: Union[str, UUID],
+        properties: GATTDescriptorProperties,
+        permissions: GATTAttributePermissions,
+        value: Optional[bytearray],
+    ):
+        """
+        Instantiates a new GATT Descriptor but is not yet assigned to any
+        characteristic or application
+
+        Parameters
+        ----------
+        uuid : Union[str, UUID]
+            The string representation of the universal unique identifier for
+            the descriptor or the actual UUID object
+        properties : GATTDescriptorProperties
+            The properties that define the descriptors behavior
+        permissions : GATTAttributePermissions
+            Permissions that define the protection levels of the properties
+        value : Optional[bytearray]
+            The binary value of the descriptor
+        """
+        value = value if value is not None else bytearray(b"")
+        super().__init__(uuid, properties, permissions, value)
+        self._value: bytearray = value
+
+    async def init(self, characteristic: "BlessGATTCharacteristic"):
+        """
+        Give the descriptor a handle in the server's attribute table
+
+        Parameters
+        ----------
+        characteristic : BlessGATTCharacteristic
+            The characteristic to assign the descriptor to
+        """
+        loopback_characteristic: "BlessGATTCharacteristicLoopback" = cast(
+            "BlessGATTCharacteristicLoopback", characteristic
+        )
+        BleakGATTDescriptor.__init__(
+            self,
+            None,
+            loopback_characteristic.server.new_handle(),
+            self._uuid,
+            characteristic,
+        )
+
+    @property
+    def value(self) -> bytearray:
+        """Get the value of the descriptor"""
+        return bytearray(self._value)
+
+    @value.setter
+    def value(self, val: bytearray):
+        """Set the value of the descriptor"""
+        self._value = val
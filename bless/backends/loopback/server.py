@@ -0,0 +1,400 @@
+from uuid import UUID
+from asyncio import AbstractEventLoop
+from typing import Any, List, Optional, Set, Tuple, cast
+
+from bless.backends.server import BaseBlessServer
+from bless.backends.advertisement import BlessAdvertisementData
+from bless.backends.attribute import GATTAttributePermissions
+from bless.backends.characteristic import (
+    BlessGATTCharacteristic,
+    GATTCharacteristicProperties,
+)
+from bless.backends.descriptor import GATTDescriptorProperties
+from bless.backends.loopback.characteristic import BlessGATTCharacteristicLoopback
+from bless.backends.loopback.descriptor import BlessGATTDescriptorLoopback
+from bless.backends.loopback.service import BlessGATTServiceLoopback
+from bless.exceptions import BlessATTError, BlessError
+
+# The central the central-side methods act as when none is given
+CENTRAL: str = "loopback"
+
+
+class BlessServerLoopback(BaseBlessServer):
+    """
+    A server without a radio. The attribute table lives in memory and the
+    central-side methods, connect, read, write, subscribe and their
+    counterparts, play the part of a connected central. Useful for tests and
+    for running applications where no adapter is available
+
+    Attributes
+    ----------
+    name : str
+        The name of the server
+    advertisement_data : Optional[BlessAdvertisementData]
+        The advertisement the server would be sending
+    notifications : List[Tuple[str, str, bytes]]
+        The central, characteristic UUID and value of every notification and
+        indication sent, in order
+    """
+
+    def __init__(self, name: str, loop: Optional[AbstractEventLoop] = None, **kwargs):
+        super(BlessServerLoopback, self).__init__(loop=loop, **kwargs)
+        self.name: str = name
+        self.advertisement_data: Optional[BlessAdvertisementData] = None
+        self.notifications: List[Tuple[str, str, bytes]] = []
+        self._advertising: bool = False
+        self._centrals: Set[str] = set()
+        self._last_handle: int = 0
+
+    def new_handle(self) -> int:
+        """
+        Returns
+        -------
+        int
+            The next free attribute handle
+        """
+        self._last_handle += 1
+        return self._last_handle
+
+    async def start(
+        self, advertisement_data: Optional[BlessAdvertisementData] = None, **kwargs
+    ) -> bool:
+        """
+        Start advertising
+
+        Parameters
+        ----------
+        advertisement_data : Optional[BlessAdvertisementData]
+            Optional advertisement payload
+
+        Returns
+        -------
+        bool
+            Always True
+        """
+        self.advertisement_data = advertisement_data or BlessAdvertisementData()
+        self._advertising = True
+        self._started()
+        await self._start_advertising_policy()
+        return True
+
+    async def stop(self) -> bool:
+        """
+        Stop advertising and disconnect every central
+
+        Returns
+        -------
+        bool
+            Always True
+        """
+        self._stop_advertising_policy()
+        self._advertising = False
+        for central in sorted(self._centrals):
+            self.disconnect(central)
+        self._stopped()
+        return True
+
+    async def update_advertisement(
+        self, advertisement_data: BlessAdvertisementData, **kwargs
+    ):
+        """
+        Change the fields of the advertisement that are set
+
+        Parameters
+        ----------
+        advertisement_data : BlessAdvertisementData
+            The advertisement fields to change
+        """
+        current: BlessAdvertisementData = (
+            self.advertisement_data or BlessAdvertisementData()
+        )
+        self.advertisement_data = current.merge(advertisement_data)
+
+    async def set_advertising_interval(self, min_interval: int, max_interval: int):
+        """
+        Change the advertising interval
+
+        Parameters
+        ----------
+        min_interval : int
+            The minimum advertising interval in ms
+        max_interval : int
+            The maximum advertising interval in ms
+        """
+        await self.update_advertisement(
+            BlessAdvertisementData(min_interval=min_interval, max_interval=max_interval)
+        )
+
+    async def is_connected(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            Whether any central is connected
+        """
+        return len(self._centrals) > 0
+
+    async def is_advertising(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            Whether the server is started
+        """
+        return self._advertising
+
+    async def add_new_service(self, uuid: str):
+        """
+        Add a new GATT service to be hosted by the server
+
+        Parameters
+        ----------
+        uuid : str
+            The UUID for the service to add
+        """
+        service: BlessGATTServiceLoopback = BlessGATTServiceLoopback(uuid)
+        await service.init(self)
+        self.services[service.uuid] = service
+
+    async def add_new_characteristic(
+        self,
+        service_uuid: str,
+        char_uuid: str,
+        properties: GATTCharacteristicProperties,
+        value: Optional[bytearray],
+        permissions: GATTAttributePermissions,
+    ):
+        """
+        Add a new characteristic to be associated with the server
+
+        Parameters
+        ----------
+        service_uuid : str
+            The string representation of the UUID of the GATT service to which
+            this new characteristic should belong
+        char_uuid : str
+            The string representation of the UUID of the characteristic
+        properties : GATTCharacteristicProperties
+            GATT Characteristic Flags that define the characteristic
+        value : Optional[bytearray]
+            A byterray representation of the value to be associated with the
+            characteristic. Can be None if the characteristic is writable
+        permissions : GATTAttributePermissions
+            GATT flags that define the permissions for the characteristic
+        """
+        service: BlessGATTServiceLoopback = cast(
+            BlessGATTServiceLoopback, self.services[str(UUID(service_uuid))]
+        )
+        characteristic: BlessGATTCharacteristicLoopback = (
+            BlessGATTCharacteristicLoopback(char_uuid, properties, permissions, value)
+        )
+        await characteristic.init(service)
+        service.add_characteristic(characteristic)
+
+    async def add_new_descriptor(
+        self,
+        service_uuid: str,
+        char_uuid: str,
+        desc_uuid: str,
+        properties: GATTDescriptorProperties,
+        value: Optional[bytearray],
+        permissions: GATTAttributePermissions,
+    ):
+        """
+        Add a new descriptor to a characteristic of the server
+
+        Parameters
+        ----------
+        service_uuid : str
+            The string representation of the UUID of the GATT service to which
+            this existing characteristic belongs
+        char_uuid : str
+            The string representation of the UUID of the GATT characteristic
+            to which this new descriptor should belong
+        desc_uuid : str
+            The string representation of the UUID of the descriptor
+        properties : GATTDescriptorProperties
+            GATT Characteristic Flags that define the descriptor
+        value : Optional[bytearray]
+            A byterray representation of the value to be associated with the
+            descriptor. Can be None if the descriptor is writable
+        permissions : GATTAttributePermissions
+            GATT flags that define the permissions for the descriptor
+        """
+        service: BlessGATTServiceLoopback = cast(
+            BlessGATTServiceLoopback, self.services[str(UUID(service_uuid))]
+        )
+        characteristic: BlessGATTCharacteristic = service.get_characteristic(char_uuid)
+        descriptor: BlessGATTDescriptorLoopback = BlessGATTDescriptorLoopback(
+            desc_uuid, properties, permissions, value
+        )
+        await descriptor.init(characteristic)
+        characteristic.add_descriptor(descriptor)
+
+    def update_value(
+        self, service_uuid: str, char_uuid: str, value: Any = None
+    ) -> bool:
+        """
+        Update the characteristic value and notify the subscribed centrals
+
+        Parameters
+        ----------
+        service_uuid : str
+            The string representation of the UUID for the service associated
+            with the characteristic whose value is to be updated
+        char_uuid : str
+            The string representation of the UUID for the characteristic whose
+            value is to be updated
+        value : Any
+            Optional new value, native if the characteristic has a codec,
+            stored before notifying
+
+        Returns
+        -------
+        bool
+            Whether the characteristic value was successfully updated
+        """
+        service: Optional[BlessGATTServiceLoopback] = cast(
+            Optional[BlessGATTServiceLoopback], self.get_service(service_uuid)
+        )
+        if service is None:
+            return False
+        characteristic: BlessGATTCharacteristic = service.get_characteristic(char_uuid)
+        if value is not None:
+            characteristic.typed_value = value
+        for central in sorted(self.subscriptions.subscribers(char_uuid)):
+            self.notifications.append(
+                (central, characteristic.uuid, bytes(characteristic.value))
+            )
+        return True
+
+    async def _send_indication(
+        self, service_uuid: str, char_uuid: str, central: str
+    ) -> bool:
+        """
+        Record the indication, which the loopback central confirms at once
+        """
+        characteristic: BlessGATTCharacteristic = cast(
+            BlessGATTCharacteristic, self.get_characteristic(char_uuid)
+        )
+        self.notifications.append((central, char_uuid, bytes(characteristic.value)))
+        self._indication_confirmed(char_uuid, central)
+        return True
+
+    # Central side
+
+    def connect(self, central: str = CENTRAL):
+        """
+        Connect a central
+
+        Parameters
+        ----------
+        central : str
+            The identifier of the central
+        """
+        if central in self._centrals:
+            return
+        self._centrals.add(central)
+        self._central_connection_changed(central, True, True)
+
+    def disconnect(self, central: str = CENTRAL):
+        """
+        Disconnect a central, dropping its subscriptions
+
+        Parameters
+        ----------
+        central : str
+            The identifier of the central
+        """
+        if central not in self._centrals:
+            return
+        self._centrals.remove(central)
+        for service in self.services.values():
+            for characteristic in service.characteristics:
+                self.subscriptions.unsubscribe(characteristic.uuid, central)
+        self._central_connection_changed(central, False, len(self._centrals) > 0)
+
+    async def read(self, char_uuid: str, offset: int = 0) -> bytes:
+        """
+        Read a characteristic as a central would
+
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the characteristic
+        offset : int
+            The offset of a long read
+
+        Returns
+        -------
+        bytes
+            The value from the offset on
+        """
+        self._require(char_uuid, GATTCharacteristicProperties.read)
+        value: Any = await self.read_request_async(char_uuid, {"offset": offset})
+        return bytes(value)[offset:]
+
+    def write(self, char_uuid: str, value: bytes, central: str = CENTRAL):
+        """
+        Write a characteristic as a central would
+
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the characteristic
+        value : bytes
+            The value to write
+        central : str
+            The identifier of the central
+        """
+        self._require(
+            char_uuid,
+            GATTCharacteristicProperties.write
+            | GATTCharacteristicProperties.write_without_response,
+        )
+        self.write_request(char_uuid, bytearray(value), {"device": central})
+
+    def subscribe(self, char_uuid: str, central: str = CENTRAL):
+        """
+        Subscribe a central to the notifications or indications of a
+        characteristic
+
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the characteristic
+        central : str
+            The identifier of the central
+        """
+        characteristic: BlessGATTCharacteristic = self._require(
+            char_uuid,
+            GATTCharacteristicProperties.notify | GATTCharacteristicProperties.indicate,
+        )
+        self.connect(central)
+        self.subscriptions.subscribe(characteristic.uuid, central)
+
+    def unsubscribe(self, char_uuid: str, central: str = CENTRAL):
+        """
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the characteristic
+        central : str
+            The identifier of the central
+        """
+        self.subscriptions.unsubscribe(str(UUID(char_uuid)), central)
+
+    def _require(
+        self, char_uuid: str, properties: GATTCharacteristicProperties
+    ) -> BlessGATTCharacteristic:
+        characteristic: Optional[BlessGATTCharacteristic] = self.get_characteristic(
+            char_uuid
+        )
+        if characteristic is None:
+            raise BlessError("Invalid characteristic: {}".format(char_uuid))
+        if not characteristic._properties_flags & properties:
+            raise BlessATTError(
+                BlessATTError.REQUEST_NOT_SUPPORTED,
+                "{} does not support {}".format(char_uuid, properties),
+            )
+        return characteristic
@@ -0,0 +1,47 @@
+from uuid import UUID
+from typing import Union, TYPE_CHECKING
+
+from bleak.backends.service import BleakGATTService  # type: ignore
+
+from bless.backends.service import BlessGATTService as BaseBlessGATTService
+
+if TYPE_CHECKING:
+    from bless.backends.server import BaseBlessServer
+    from bless.backends.loopback.server import BlessServerLoopback
+
+
+class BlessGATTServiceLoopback(BaseBlessGATTService, BleakGATTService):
+    """
+    GATT service implementation for the loopback backend
+    """
+
+    server: "BlessServerLoopback"
+
+    def __init__(self, uuid: Union[str, UUID]):
+        """
+        Initialize the Bless GATT Service
+
+        Parameters
+        ----------
+        uuid : Union[str, UUID]
+            The UUID to assign to the service
+        """
+        BaseBlessGATTService.__init__(self, uuid)
+        self._characteristics = {}
+
+    async def init(self, server: "BaseBlessServer"):
+        """
+        Give the service a handle in the server's attribute table
+
+        Parameters
+        ----------
+        server: BaseBlessServer
+            The server to assign the service to
+        """
+        self.server = server  # type: ignore
+        BleakGATTService.__init__(self, None, self.server.new_handle(), self._uuid)
+
+    @property
+    def description(self) -> str:
+        """Description of this service"""
+        return f"Service {self._uuid}"
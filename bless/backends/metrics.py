@@ -0,0 +1,152 @@
+import math
+
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+class LatencyStats:
+    """
+    Running statistics for a latency measured in seconds
+
+    The count, total, minimum and maximum cover every sample since the last
+    reset. Percentiles are computed from a window of the most recent samples
+    so that memory stays bounded on long running servers.
+    """
+
+    def __init__(self, window: int = 1024):
+        """
+        Parameters
+        ----------
+        window : int
+            The number of recent samples kept for percentiles
+        """
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, seconds: float):
+        """
+        Add a sample
+
+        Parameters
+        ----------
+        seconds : float
+            The measured latency
+        """
+        self._samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> Optional[float]:
+        """The mean of every sample, None if there are none"""
+        return self.total / self.count if self.count > 0 else None
+
+    def percentile(self, p: float) -> Optional[float]:
+        """
+        Parameters
+        ----------
+        p : float
+            The percentile between 0 and 100
+
+        Returns
+        -------
+        Optional[float]
+            The nearest rank percentile of the recent samples, None if there
+            are none
+        """
+        if len(self._samples) == 0:
+            return None
+        ordered = sorted(self._samples)
+        rank: int = max(math.ceil(p / 100 * len(ordered)), 1)
+        return ordered[min(rank, len(ordered)) - 1]
+
+    def reset(self):
+        """
+        Discard every sample
+        """
+        self._samples.clear()
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        """
+        Returns
+        -------
+        Dict[str, Optional[float]]
+            A summary suitable for logging or exporting
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+        }
+
+
+class ServerMetrics:
+    """
+    Named latency statistics and event counts collected by a server
+    """
+
+    def __init__(self):
+        self._latencies: Dict[str, LatencyStats] = {}
+        self._counts: Dict[str, int] = {}
+
+    def latency(self, name: str) -> LatencyStats:
+        """
+        Parameters
+        ----------
+        name : str
+            The name of the measurement, e.g. "indication"
+
+        Returns
+        -------
+        LatencyStats
+            The statistics for the name, created on first use
+        """
+        stats: Optional[LatencyStats] = self._latencies.get(name)
+        if stats is None:
+            stats = self._latencies[name] = LatencyStats()
+        return stats
+
+    def as_dict(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Returns
+        -------
+        Dict[str, Dict[str, Optional[float]]]
+            A summary of every measurement
+        """
+        return {name: stats.as_dict() for name, stats in self._latencies.items()}
+
+    def count(self, name: str, n: int = 1):
+        """
+        Add to a counter
+
+        Parameters
+        ----------
+        name : str
+            The name of the event, e.g. "read_deadline_miss"
+        n : int
+            How many events to add
+        """
+        self._counts[name] = self._counts.get(name, 0) + n
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Returns
+        -------
+        Dict[str, int]
+            Every counter
+        """
+        return dict(self._counts)
@@ -0,0 +1,257 @@
+import asyncio
+import logging
+import os
+import struct
+import time
+import zlib
+
+from enum import Enum
+from uuid import UUID
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# characteristic UUID, descriptor UUID (zero for characteristics), length
+_RECORD: struct.Struct = struct.Struct("<16s16sI")
+_CRC: struct.Struct = struct.Struct("<I")
+_NO_DESCRIPTOR: bytes = bytes(16)
+
+ValueKey = Tuple[str, Optional[str]]
+
+
+class FsyncPolicy(Enum):
+    ALWAYS = "always"
+    INTERVAL = "interval"
+    NEVER = "never"
+
+
+class PersistentValueStore:
+    """
+    Keeps the latest value of selected characteristics and descriptors in an
+    append-only file so that they survive a restart
+
+    Each record holds the characteristic UUID, the descriptor UUID, the value
+    and a CRC, so a record torn by a crash is detected and dropped on load.
+    Tracked attributes are compared with their last stored value every
+    flush_interval seconds and only changes are appended, in one write. The
+    file is rewritten with just the live values once it grows past
+    compact_ratio times their size.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fsync: FsyncPolicy = FsyncPolicy.INTERVAL,
+        flush_interval: float = 1.0,
+        fsync_interval: float = 5.0,
+        compact_ratio: float = 4.0,
+    ):
+        """
+        Parameters
+        ----------
+        path : str
+            The file to store values in. It is created if needed
+        fsync : FsyncPolicy
+            ALWAYS syncs after every flush, INTERVAL at most every
+            fsync_interval seconds and NEVER leaves it to the OS
+        flush_interval : float
+            Seconds between snapshots of the tracked attributes
+        fsync_interval : float
+            Seconds between syncs under the INTERVAL policy
+        compact_ratio : float
+            How much larger than the live values the file may grow
+        """
+        self.path: str = path
+        self.fsync: FsyncPolicy = FsyncPolicy(fsync)
+        self.flush_interval: float = flush_interval
+        self.fsync_interval: float = fsync_interval
+        self.compact_ratio: float = compact_ratio
+
+        self._values: Dict[ValueKey, bytes] = {}
+        self._tracked: Dict[ValueKey, Any] = {}
+        self._pending: bytearray = bytearray()
+        self._last_fsync: float = time.monotonic()
+        self._task: Optional[asyncio.Task] = None
+
+        self._load()
+        self._file = open(self.path, "ab")
+
+    def get(self, char_uuid: str, desc_uuid: Optional[str] = None) -> Optional[bytes]:
+        """
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the characteristic
+        desc_uuid : Optional[str]
+            The UUID of the descriptor, None for the characteristic's value
+
+        Returns
+        -------
+        Optional[bytes]
+            The stored value, None if there is none
+        """
+        return self._values.get(self._key(char_uuid, desc_uuid))
+
+    def put(self, char_uuid: str, value: bytes, desc_uuid: Optional[str] = None):
+        """
+        Queue a value to be written on the next flush
+
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the characteristic
+        value : bytes
+            The value
+        desc_uuid : Optional[str]
+            The UUID of the descriptor, None for the characteristic's value
+        """
+        key: ValueKey = self._key(char_uuid, desc_uuid)
+        value = bytes(value)
+        if self._values.get(key) == value:
+            return
+        self._values[key] = value
+        self._pending += self._encode(key, value)
+
+    def track(self, attribute: Any, char_uuid: str, desc_uuid: Optional[str] = None):
+        """
+        Snapshot an attribute's value on every flush
+
+        Parameters
+        ----------
+        attribute : Any
+            A characteristic or descriptor with a value
+        char_uuid : str
+            The UUID of the characteristic
+        desc_uuid : Optional[str]
+            The UUID of the descriptor, if attribute is one
+        """
+        self._tracked[self._key(char_uuid, desc_uuid)] = attribute
+
+    def snapshot(self):
+        """
+        Queue the value of every tracked attribute that changed
+        """
+        for (char_uuid, desc_uuid), attribute in self._tracked.items():
+            value: Any = attribute.value
+            if value is not None:
+                self.put(char_uuid, value, desc_uuid)
+
+    def flush(self):
+        """
+        Snapshot the tracked attributes and write what changed
+        """
+        self.snapshot()
+        if self._pending:
+            self._file.write(self._pending)
+            self._pending.clear()
+            self._file.flush()
+            now: float = time.monotonic()
+            if self.fsync == FsyncPolicy.ALWAYS or (
+                self.fsync == FsyncPolicy.INTERVAL
+                and now - self._last_fsync >= self.fsync_interval
+            ):
+                os.fsync(self._file.fileno())
+                self._last_fsync = now
+        if self._file.tell() > self.compact_ratio * max(self._live_size(), 4096):
+            self.compact()
+
+    def compact(self):
+        """
+        Rewrite the file with only the latest values
+        """
+        temporary: str = self.path + ".tmp"
+        with open(temporary, "wb") as f:
+            for key, value in self._values.items():
+                f.write(self._encode(key, value))
+            f.flush()
+            os.fsync(f.fileno())
+        self._file.close()
+        os.replace(temporary, self.path)
+        self._file = open(self.path, "ab")
+
+    def start(self):
+        """
+        Flush every flush_interval seconds on the running event loop
+        """
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._flush_forever())
+
+    def stop(self):
+        """
+        Stop flushing periodically and write what changed since the last
+        flush. The file stays open, so start can resume
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if not self._file.closed:
+            self.flush()
+
+    def close(self):
+        """
+        Flush, sync and close the file
+        """
+        if self._file.closed:
+            return
+        self.stop()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            data: bytes = f.read()
+        offset: int = 0
+        while offset + _RECORD.size <= len(data):
+            char_bytes, desc_bytes, length = _RECORD.unpack_from(data, offset)
+            end: int = offset + _RECORD.size + length
+            if end + _CRC.size > len(data):
+                break
+            (crc,) = _CRC.unpack_from(data, end)
+            if zlib.crc32(data[offset:end]) != crc:
+                break
+            key: ValueKey = (
+                str(UUID(bytes=char_bytes)),
+                None if desc_bytes == _NO_DESCRIPTOR else str(UUID(bytes=desc_bytes)),
+            )
+            self._values[key] = data[offset + _RECORD.size:end]
+            offset = end + _CRC.size
+        if offset < len(data):
+            logger.warning(
+                "Discarding {} corrupt bytes at the end of {}".format(
+                    len(data) - offset, self.path
+                )
+            )
+            with open(self.path, "r+b") as f:
+                f.truncate(offset)
+
+    def _live_size(self) -> int:
+        return sum(
+            _RECORD.size + len(value) + _CRC.size for value in self._values.values()
+        )
+
+    @staticmethod
+    def _key(char_uuid: str, desc_uuid: Optional[str]) -> ValueKey:
+        return (
+            str(UUID(char_uuid)),
+            str(UUID(desc_uuid)) if desc_uuid is not None else None,
+        )
+
+    @staticmethod
+    def _encode(key: ValueKey, value: bytes) -> bytes:
+        char_uuid, desc_uuid = key
+        record: bytes = _RECORD.pack(
+            UUID(char_uuid).bytes,
+            UUID(desc_uuid).bytes if desc_uuid is not None else _NO_DESCRIPTOR,
+            len(value),
+        ) + value
+        return record + _CRC.pack(zlib.crc32(record))
+
+    async def _flush_forever(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to persist characteristic values")
@@ -0,0 +1,168 @@
+import asyncio
+import logging
+
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AdvertisingIntervalTier:
+    """
+    An advertising interval range and how long to hold it
+
+    Attributes
+    ----------
+    min_interval : int
+        The minimum advertising interval in ms
+    max_interval : int
+        The maximum advertising interval in ms
+    duration : Optional[float]
+        Seconds to stay in this tier before moving to the next one. None
+        keeps the tier until the next connection event
+    """
+
+    min_interval: int
+    max_interval: int
+    duration: Optional[float] = None
+
+
+# Fast discovery for the first 30 s, then a low duty cycle. The values follow
+# the intervals recommended for accessories in Apple's Bluetooth design
+# guidelines.
+DEFAULT_TIERS: List[AdvertisingIntervalTier] = [
+    AdvertisingIntervalTier(20, 30, 30.0),
+    AdvertisingIntervalTier(1022, 1285),
+]
+
+ApplyInterval = Callable[[int, int], Awaitable[None]]
+
+
+class AdvertisingIntervalPolicy:
+    """
+    Steps the advertising interval through a list of tiers
+
+    The first tier is applied when the server starts advertising and every
+    time the last central disconnects. Each tier with a duration hands over
+    to the next one once its time is up. While a central is connected the
+    connected tier is used, or the last tier if none is given, so that
+    advertising continues at a low duty cycle.
+    """
+
+    def __init__(
+        self,
+        tiers: Optional[List[AdvertisingIntervalTier]] = None,
+        connected_tier: Optional[AdvertisingIntervalTier] = None,
+    ):
+        """
+        Parameters
+        ----------
+        tiers : Optional[List[AdvertisingIntervalTier]]
+            The tiers to step through. Defaults to DEFAULT_TIERS
+        connected_tier : Optional[AdvertisingIntervalTier]
+            The tier to use while a central is connected
+        """
+        self.tiers: List[AdvertisingIntervalTier] = list(
+            tiers if tiers is not None else DEFAULT_TIERS
+        )
+        if len(self.tiers) == 0:
+            raise ValueError("An advertising policy needs at least one tier")
+        self.connected_tier: AdvertisingIntervalTier = (
+            connected_tier if connected_tier is not None else self.tiers[-1]
+        )
+
+        self.current_tier: Optional[AdvertisingIntervalTier] = None
+        self._apply: Optional[ApplyInterval] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._task: Optional[asyncio.Future] = None
+        self._connected: bool = False
+
+    @property
+    def first_tier(self) -> AdvertisingIntervalTier:
+        """The tier applied when advertising (re)starts"""
+        return self.tiers[0]
+
+    async def start(self, apply: ApplyInterval):
+        """
+        Begin stepping through the tiers
+
+        Parameters
+        ----------
+        apply : Callable[[int, int], Awaitable[None]]
+            Coroutine function that applies a (min, max) interval in ms to the
+            live advertisement
+        """
+        self._apply = apply
+        self._connected = False
+        await self._enter(0)
+
+    def stop(self):
+        """
+        Stop reacting to timers and connection events
+        """
+        self._cancel_timer()
+        self._cancel_task()
+        self._apply = None
+        self.current_tier = None
+
+    def on_connection_changed(self, connected: bool):
+        """
+        Switch tiers in response to a central connecting or disconnecting
+
+        Parameters
+        ----------
+        connected : bool
+            Whether any central is connected
+        """
+        if self._apply is None or connected == self._connected:
+            return
+        self._connected = connected
+        if connected:
+            self._cancel_timer()
+            self._schedule(self._apply_tier(self.connected_tier))
+        else:
+            self._schedule(self._enter(0))
+
+    async def _enter(self, index: int):
+        self._cancel_timer()
+        tier: AdvertisingIntervalTier = self.tiers[index]
+        await self._apply_tier(tier)
+        if self._connected or self._apply is None:
+            return
+        if tier.duration is not None and index + 1 < len(self.tiers):
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(
+                tier.duration, lambda: self._schedule(self._enter(index + 1))
+            )
+
+    async def _apply_tier(self, tier: AdvertisingIntervalTier):
+        if self._apply is None or tier == self.current_tier:
+            return
+        try:
+            await self._apply(tier.min_interval, tier.max_interval)
+        except Exception:
+            logger.exception("Failed to apply the advertising interval")
+            return
+        self.current_tier = tier
+        logger.debug(
+            "Advertising interval set to {}-{} ms".format(
+                tier.min_interval, tier.max_interval
+            )
+        )
+
+    def _schedule(self, coro: Awaitable[None]):
+        # The newest connection event wins, an older change still applying
+        # would otherwise finish last and leave the wrong tier
+        self._cancel_task()
+        self._task = asyncio.ensure_future(coro)
+
+    def _cancel_task(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
@@ -0,0 +1,134 @@
+import os
+import sys
+import importlib
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from bless.exceptions import BlessError
+
+
+@dataclass(frozen=True)
+class BlessBackend:
+    """
+    Where the classes of a backend live, as "module:Class" paths. Nothing is
+    imported until a class is loaded
+
+    Attributes
+    ----------
+    name : str
+        The name to select the backend with, e.g. in BLESS_BACKEND
+    server : str
+        The BlessServer implementation
+    service : str
+        The BlessGATTService implementation
+    characteristic : str
+        The BlessGATTCharacteristic implementation
+    descriptor : str
+        The BlessGATTDescriptor implementation
+    """
+
+    name: str
+    server: str
+    service: str
+    characteristic: str
+    descriptor: str
+
+    def load(self, attribute: str) -> Any:
+        """
+        Import one of the backend's classes
+
+        Parameters
+        ----------
+        attribute : str
+            "server", "service", "characteristic" or "descriptor"
+
+        Returns
+        -------
+        Any
+            The class
+        """
+        module, _, name = getattr(self, attribute).partition(":")
+        return getattr(importlib.import_module(module), name)
+
+
+_backends: Dict[str, BlessBackend] = {}
+
+# The backend used when neither BLESS_BACKEND nor the backend argument is set
+PLATFORM_BACKENDS: Dict[str, str] = {
+    "linux": "bluezdbus",
+    "darwin": "corebluetooth",
+    "win32": "winrt",
+}
+
+
+def register_backend(backend: BlessBackend):
+    """
+    Make a backend available by name, replacing any backend of that name
+
+    Parameters
+    ----------
+    backend : BlessBackend
+        The backend
+    """
+    _backends[backend.name] = backend
+
+
+def backend_names() -> List[str]:
+    """
+    Returns
+    -------
+    List[str]
+        The names of the registered backends
+    """
+    return sorted(_backends)
+
+
+def get_backend(name: Optional[str] = None) -> BlessBackend:
+    """
+    Parameters
+    ----------
+    name : Optional[str]
+        The name of a registered backend. If None, the BLESS_BACKEND
+        environment variable, or the platform's backend if it is not set
+
+    Returns
+    -------
+    BlessBackend
+        The backend
+    """
+    if name is None:
+        name = os.environ.get("BLESS_BACKEND") or PLATFORM_BACKENDS.get(sys.platform)
+        if name is None:
+            raise BlessError("No backend for platform {}".format(sys.platform))
+    backend: Optional[BlessBackend] = _backends.get(name)
+    if backend is None:
+        raise BlessError(
+            "Unknown backend {}, choose one of {}".format(name, backend_names())
+        )
+    return backend
+
+
+for _name, _module, _suffix in [
+    ("bluezdbus", "bluezdbus", "BlueZDBus"),
+    ("corebluetooth", "corebluetooth", "CoreBluetooth"),
+    ("winrt", "winrt", "WinRT"),
+    ("loopback", "loopback", "Loopback"),
+]:
+    register_backend(
+        BlessBackend(
+            name=_name,
+            server="bless.backends.{}.server:BlessServer{}".format(_module, _suffix),
+            service="bless.backends.{}.service:BlessGATTService{}".format(
+                _module, _suffix
+            ),
+            characteristic=(
+                "bless.backends.{}.characteristic:BlessGATTCharacteristic{}".format(
+                    _module, _suffix
+                )
+            ),
+            descriptor="bless.backends.{}.descriptor:BlessGATTDescriptor{}".format(
+                _module, _suffix
+            ),
+        )
+    )
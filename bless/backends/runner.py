@@ -0,0 +1,285 @@
+import asyncio
+import concurrent.futures
+import logging
+import threading
+
+from asyncio import AbstractEventLoop
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    TYPE_CHECKING,
+)
+
+from bless.backends.advertisement import BlessAdvertisementData
+from bless.exceptions import BlessError
+
+if TYPE_CHECKING:
+    from bless.backends.server import BaseBlessServer
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BlessServerThread:
+    """
+    Runs a server on an event loop in a dedicated thread, so that synchronous
+    code can use it from any thread
+
+    update_value, set_value and notify only queue the call and return. The
+    first call queued after the loop drained the queue wakes the loop up with
+    call_soon_threadsafe, later calls join the same batch, so a producer
+    pushing thousands of values per second causes far fewer wakeups. Queued
+    calls run in the order they were made. Anything else can be run on the
+    loop with call or submit.
+    """
+
+    def __init__(
+        self,
+        server_class: Optional[Type["BaseBlessServer"]] = None,
+        read_request_func: Optional[Callable] = None,
+        write_request_func: Optional[Callable] = None,
+        **kwargs
+    ):
+        """
+        Parameters
+        ----------
+        server_class : Optional[Type[BaseBlessServer]]
+            The server to run, the platform's BlessServer if None
+        read_request_func : Optional[Callable]
+            Installed as the server's read_request_func before it starts. It
+            is called on the loop thread, except that a synchronous handler
+            of a characteristic with a read deadline runs on a bless-read
+            thread
+        write_request_func : Optional[Callable]
+            Installed as the server's write_request_func before it starts. It
+            is called on the loop thread
+        **kwargs
+            Passed to the server, e.g. name
+        """
+        if server_class is None:
+            from bless import BlessServer  # type: ignore
+
+            server_class = BlessServer
+        self.server_class: Type["BaseBlessServer"] = server_class
+        self.kwargs: Dict[str, Any] = kwargs
+        self.read_request_func: Optional[Callable] = read_request_func
+        self.write_request_func: Optional[Callable] = write_request_func
+        self.server: Optional["BaseBlessServer"] = None
+        self.loop: Optional[AbstractEventLoop] = None
+        # Number of times the loop was woken up to run queued calls
+        self.wakeups: int = 0
+
+        self._thread: Optional[threading.Thread] = None
+        self._lock: threading.Lock = threading.Lock()
+        self._queue: List[Tuple[Callable[..., Any], Tuple[Any, ...]]] = []
+        self._scheduled: bool = False
+
+    def __enter__(self) -> "BlessServerThread":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(
+        self,
+        gatt: Optional[Dict] = None,
+        advertisement_data: Optional[BlessAdvertisementData] = None,
+        timeout: Optional[float] = None,
+    ) -> "BaseBlessServer":
+        """
+        Start the loop thread, create the server and start it
+
+        Parameters
+        ----------
+        gatt : Optional[Dict]
+            Passed to add_gatt before the server starts
+        advertisement_data : Optional[BlessAdvertisementData]
+            Passed to the server's start
+        timeout : Optional[float]
+            Seconds to wait for the server to start
+
+        Returns
+        -------
+        BaseBlessServer
+            The running server. Its methods must only be called on the loop
+        """
+        if self._thread is not None:
+            raise BlessError("The server thread is already running")
+        ready: threading.Event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(ready,), name="bless", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+        try:
+            return self.call(self._start(gatt, advertisement_data), timeout)
+        except BaseException:
+            self.stop(timeout)
+            raise
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Run the queued calls, stop the server and end the loop thread
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            Seconds to wait for the server to stop
+        """
+        if self._thread is None or self.loop is None:
+            return
+        try:
+            self.call(self._stop(), timeout)
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, coroutine: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """
+        Schedule a coroutine on the loop
+
+        Parameters
+        ----------
+        coroutine : Awaitable[T]
+            E.g. server.indicate(...)
+
+        Returns
+        -------
+        concurrent.futures.Future[T]
+            Its result
+        """
+        if self.loop is None:
+            raise BlessError("The server thread is not running")
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)  # type: ignore
+
+    def call(self, coroutine: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the loop and wait for its result
+
+        Parameters
+        ----------
+        coroutine : Awaitable[T]
+            E.g. server.wait_for_subscribers(...)
+        timeout : Optional[float]
+            Seconds to wait
+
+        Returns
+        -------
+        T
+            Its result
+        """
+        return self.submit(coroutine).result(timeout)
+
+    def update_value(self, service_uuid: str, char_uuid: str, value: Any = None):
+        """
+        Queue BaseBlessServer.update_value
+
+        Parameters
+        ----------
+        service_uuid : str
+            The UUID of the service the characteristic belongs to
+        char_uuid : str
+            The UUID of the characteristic
+        value : Any
+            Optional new value, native if the characteristic has a codec
+        """
+        self._queue_call(self._update_value, service_uuid, char_uuid, value)
+
+    def set_value(self, char_uuid: str, value: Any):
+        """
+        Queue storing a value without notifying
+
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the characteristic
+        value : Any
+            The new value, native if the characteristic has a codec
+        """
+        self._queue_call(self._set_value, char_uuid, value)
+
+    def notify(self, service_uuid: str, char_uuid: str):
+        """
+        Queue notifying subscribers of the current value
+
+        Parameters
+        ----------
+        service_uuid : str
+            The UUID of the service the characteristic belongs to
+        char_uuid : str
+            The UUID of the characteristic
+        """
+        self._queue_call(self._update_value, service_uuid, char_uuid, None)
+
+    def _queue_call(self, func: Callable[..., Any], *args: Any):
+        if self.loop is None:
+            raise BlessError("The server thread is not running")
+        with self._lock:
+            self._queue.append((func, args))
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self.loop.call_soon_threadsafe(self._drain)
+
+    def _drain(self):
+        with self._lock:
+            queue = self._queue
+            self._queue = []
+            self._scheduled = False
+        if not queue:
+            return
+        self.wakeups += 1
+        for func, args in queue:
+            try:
+                func(*args)
+            except Exception:
+                logger.exception("Queued server call failed")
+
+    def _update_value(self, service_uuid: str, char_uuid: str, value: Any):
+        assert self.server is not None
+        self.server.update_value(service_uuid, char_uuid, value)
+
+    def _set_value(self, char_uuid: str, value: Any):
+        assert self.server is not None
+        characteristic = self.server.get_characteristic(char_uuid)
+        if characteristic is None:
+            raise BlessError("Invalid characteristic: {}".format(char_uuid))
+        characteristic.typed_value = value
+
+    def _run(self, ready: threading.Event):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+            self.loop = None
+
+    async def _start(
+        self, gatt: Optional[Dict], advertisement_data: Optional[BlessAdvertisementData]
+    ) -> "BaseBlessServer":
+        self.server = self.server_class(loop=self.loop, **self.kwargs)
+        # Before advertising, so that no central finds the server without them
+        if self.read_request_func is not None:
+            self.server.read_request_func = self.read_request_func
+        if self.write_request_func is not None:
+            self.server.write_request_func = self.write_request_func
+        if gatt is not None:
+            await self.server.add_gatt(gatt)
+        await self.server.start(advertisement_data=advertisement_data)
+        return self.server
+
+    async def _stop(self):
+        self._drain()
+        if self.server is not None:
+            await self.server.__aexit__(None, None, None)
@@ -1,21 +1,44 @@
 import abc
 import asyncio
+import concurrent.futures
 import logging
+import time
 
 from uuid import UUID
 from asyncio import AbstractEventLoop
-from typing import Any, Optional, Dict, Callable, List
+from typing import (
+    Any,
+    Optional,
+    Dict,
+    Callable,
+    Coroutine,
+    List,
+    Sequence,
+    Union,
+    TYPE_CHECKING,
+)
 
 from bless.backends.service import BlessGATTService
 from bless.backends.advertisement import BlessAdvertisementData
+from bless.backends.codec import CharacteristicCodec, Field
+from bless.backends.indication import IndicationTracker
+from bless.backends.metrics import ServerMetrics
+from bless.backends.policy import AdvertisingIntervalPolicy
+from bless.backends.subscription import SubscriptionState
 from bless.backends.attribute import GATTAttributePermissions  # type: ignore
 from bless.backends.characteristic import (  # type: ignore
     BlessGATTCharacteristic,
     GATTCharacteristicProperties,
 )
 from bless.backends.descriptor import GATTDescriptorProperties  # type: ignore
+from bless.backends.registry import get_backend
+
+from bless.exceptions import BlessATTError, BlessError
 
-from bless.exceptions import BlessError
+if TYPE_CHECKING:
+    from bless.backends.control import ControlServer
+    from bless.backends.persistence import PersistentValueStore
+    from bless.backends.table import CharacteristicTable
 
 LOGGER = logging.getLogger(__name__)
 
@@ -28,16 +51,62 @@ class BaseBlessServer(abc.ABC):
     ----------
     services : Optional[BleakGATTServiceCollection]
         Used to manage services and characteristics that this server advertises
+    advertising_policy : Optional[AdvertisingIntervalPolicy]
+        Optional policy that adapts the advertising interval to the connection
+        state. Passed as the `advertising_policy` keyword argument
+    subscriptions : SubscriptionState
+        The centrals subscribed to each characteristic, as reported by the
+        backend
+    indications : IndicationTracker
+        The indications awaiting confirmation from each central
+    metrics : ServerMetrics
+        Latencies measured by the server, e.g. the indication round trip
+    value_store : Optional[PersistentValueStore]
+        Optional store that keeps the values of characteristics and
+        descriptors marked "Persist" in add_gatt across restarts. Passed as
+        the `value_store` keyword argument
     """
 
+    def __new__(cls, *args, **kwargs):
+        # The `backend` keyword argument picks the implementation by name,
+        # e.g. BlessServer(name, backend="loopback")
+        backend: Optional[str] = kwargs.get("backend", None)
+        if backend is None:
+            return super(BaseBlessServer, cls).__new__(cls)
+        server_class: type = get_backend(backend).load("server")
+        if issubclass(server_class, cls):
+            return super(BaseBlessServer, cls).__new__(server_class)
+        # Python only initializes instances of cls itself
+        return server_class(*args, **kwargs)
+
     def __init__(self, loop: Optional[AbstractEventLoop] = None, **kwargs):
         self.loop: AbstractEventLoop = loop if loop else asyncio.get_event_loop()
 
-        self._callbacks: Dict[str, Callable[[Any], Any]] = {}
+        self._callbacks: Dict[str, Callable[..., Any]] = {}
 
         self.services: Dict[str, BlessGATTService] = {}
         self._mtu: Optional[int] = None
 
+        self.advertising_policy: Optional[AdvertisingIntervalPolicy] = kwargs.get(
+            "advertising_policy", None
+        )
+        self._connected: bool = False
+
+        self.subscriptions: SubscriptionState = SubscriptionState(
+            self._subscription_changed
+        )
+        self.indications: IndicationTracker = IndicationTracker()
+        self.metrics: ServerMetrics = ServerMetrics()
+
+        # Called with every central write, before the write callback
+        self._write_listeners: List[Callable[[BlessGATTCharacteristic, Any], None]] = []
+        self.control: Optional["ControlServer"] = None
+        self.value_store: Optional["PersistentValueStore"] = kwargs.get(
+            "value_store", None
+        )
+        # Runs synchronous read handlers of characteristics with a deadline
+        self._read_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
     # Async Context managers
 
     async def __aenter__(self):
@@ -46,6 +115,8 @@ class BaseBlessServer(abc.ABC):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.stop()
+        if self.value_store is not None:
+            self.value_store.close()
 
     # Abstract Methods
 
@@ -80,6 +151,34 @@ class BaseBlessServer(abc.ABC):
         """
         raise NotImplementedError()
 
+    async def update_advertisement(
+        self, advertisement_data: BlessAdvertisementData, **kwargs
+    ):
+        """
+        Change the payload of the running advertisement without stopping the
+        server. Only the fields that are not None are changed
+
+        Parameters
+        ----------
+        advertisement_data : BlessAdvertisementData
+            The advertisement fields to change
+        """
+        raise NotImplementedError()
+
+    async def set_advertising_interval(self, min_interval: int, max_interval: int):
+        """
+        Change the advertising interval of the running advertisement. Backends
+        that do not expose the advertising interval ignore the request
+
+        Parameters
+        ----------
+        min_interval : int
+            The minimum advertising interval in ms
+        max_interval : int
+            The maximum advertising interval in ms
+        """
+        LOGGER.debug("Advertising intervals are not supported by this backend")
+
     @abc.abstractmethod
     async def is_connected(self) -> bool:
         """
@@ -179,12 +278,14 @@ class BaseBlessServer(abc.ABC):
         raise NotImplementedError()
 
     @abc.abstractmethod
-    def update_value(self, service_uuid: str, char_uuid: str) -> bool:
+    def update_value(
+        self, service_uuid: str, char_uuid: str, value: Any = None
+    ) -> bool:
         """
         Update the characteristic value. This is different than using
         characteristic.set_value. This method ensures that subscribed devices
         receive notifications, assuming the characteristic in question is
-        notifyable
+        notifyable. When no central is subscribed nothing is sent
 
         Parameters
         ----------
@@ -194,6 +295,9 @@ class BaseBlessServer(abc.ABC):
         char_uuid : str
             The string representation of the UUID for the characteristic whose
             value is to be updated
+        value : Any
+            Optional new value, native if the characteristic has a codec,
+            stored before notifying
 
         Returns
         -------
@@ -202,6 +306,269 @@ class BaseBlessServer(abc.ABC):
         """
         raise NotImplementedError()
 
+    async def indicate(
+        self, service_uuid: str, char_uuid: str, timeout: float = 5.0
+    ) -> Dict[str, Optional[float]]:
+        """
+        Send the current value of a characteristic as an indication to every
+        subscribed central and wait for them to confirm it. Indications to
+        different centrals are in flight concurrently while indications to the
+        same central wait for the previous one to be confirmed
+
+        Parameters
+        ----------
+        service_uuid : str
+            The string representation of the UUID for the service associated
+            with the characteristic
+        char_uuid : str
+            The string representation of the UUID for the characteristic,
+            which must have the indicate property
+        timeout : float
+            Seconds to wait for each central's confirmation
+
+        Returns
+        -------
+        Dict[str, Optional[float]]
+            The round trip in seconds for each central, None for the centrals
+            that did not confirm within the timeout
+        """
+        characteristic: Optional[BlessGATTCharacteristic] = self.get_characteristic(
+            char_uuid
+        )
+        if characteristic is None:
+            raise BlessError("Invalid characteristic: {}".format(char_uuid))
+        if not (
+            characteristic._properties_flags & GATTCharacteristicProperties.indicate
+        ):
+            raise BlessError(
+                "Characteristic {} does not support indications".format(char_uuid)
+            )
+
+        key: str = self.subscriptions.key(char_uuid)
+        centrals: List[str] = sorted(self.subscriptions.subscribers(key))
+        latencies: List[Optional[float]] = await asyncio.gather(
+            *[
+                self._indicate_central(service_uuid, key, central, timeout)
+                for central in centrals
+            ]
+        )
+        return dict(zip(centrals, latencies))
+
+    async def _indicate_central(
+        self, service_uuid: str, char_uuid: str, central: str, timeout: float
+    ) -> Optional[float]:
+        async with self.indications.lock(central):
+            confirmation: asyncio.Future = self.indications.expect(char_uuid, central)
+            try:
+                if not await self._send_indication(service_uuid, char_uuid, central):
+                    # Nothing was sent, so no confirmation will come
+                    return None
+                latency: float = await asyncio.wait_for(confirmation, timeout)
+            except asyncio.TimeoutError:
+                LOGGER.warning(
+                    "Central {} did not confirm {} within {} s".format(
+                        central, char_uuid, timeout
+                    )
+                )
+                return None
+            finally:
+                self.indications.discard(central)
+        self.metrics.latency("indication").record(latency)
+        return latency
+
+    async def _send_indication(
+        self, service_uuid: str, char_uuid: str, central: str
+    ) -> bool:
+        """
+        Send the current value of a characteristic as an indication to one
+        central. Backends report the confirmation through
+        _indication_confirmed
+
+        Parameters
+        ----------
+        service_uuid : str
+            The string representation of the UUID for the service
+        char_uuid : str
+            The string representation of the UUID for the characteristic
+        central : str
+            The identifier of the central, as reported to subscriptions
+
+        Returns
+        -------
+        bool
+            Whether the indication was sent. No confirmation is waited for
+            when it was not, e.g. because the central went away
+        """
+        raise NotImplementedError()
+
+    def _indication_confirmed(self, char_uuid: str, central: str):
+        """
+        Called by backends when a central confirms an indication. Must be
+        called from the event loop's thread
+
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the confirmed characteristic
+        central : str
+            The identifier of the central
+        """
+        self.indications.confirm(self.subscriptions.key(char_uuid), central)
+
+    async def _start_advertising_policy(self):
+        """
+        Start the advertising policy, if any. Backends call this once
+        advertising has begun
+        """
+        self._connected = False
+        if self.advertising_policy is not None:
+            await self.advertising_policy.start(self.set_advertising_interval)
+
+    def _stop_advertising_policy(self):
+        """
+        Stop the advertising policy, if any
+        """
+        if self.advertising_policy is not None:
+            self.advertising_policy.stop()
+
+    def _started(self):
+        """
+        Resume what _stopped released. Backends call this once advertising
+        has begun
+        """
+        if self.value_store is not None:
+            self.value_store.start()
+
+    def _stopped(self):
+        """
+        Release what the server only needs while it runs. Backends call this
+        at the end of stop
+        """
+        if self.value_store is not None:
+            # Values written while the server ran must not wait for __aexit__
+            self.value_store.stop()
+        if self._read_executor is not None:
+            # Handlers that missed their deadline may still be running
+            self._read_executor.shutdown(wait=False)
+            self._read_executor = None
+
+    def _central_connection_changed(
+        self, central: str, connected: bool, any_connected: bool
+    ):
+        """
+        Dispatch a central connecting or disconnecting to the user callbacks
+        and the advertising policy
+
+        Parameters
+        ----------
+        central : str
+            The identifier of the central, e.g. its Bluetooth address
+        connected : bool
+            Whether the central connected or disconnected
+        any_connected : bool
+            Whether any central remains connected
+        """
+        callback: Optional[Callable[[str], Any]] = self._callbacks.get(
+            "connect" if connected else "disconnect"
+        )
+        if callback is not None:
+            try:
+                callback(central)
+            except Exception:
+                LOGGER.exception("Connection callback failed")
+        self._set_connected(any_connected)
+
+    def _set_connected(self, connected: bool):
+        """
+        Record whether any central is connected and propagate transitions to
+        the advertising policy
+
+        Parameters
+        ----------
+        connected : bool
+            Whether any central is connected
+        """
+        if connected == self._connected:
+            return
+        self._connected = connected
+        if self.advertising_policy is not None:
+            self.advertising_policy.on_connection_changed(connected)
+
+    async def wait_for_subscribers(
+        self,
+        characteristic: Union[str, BlessGATTCharacteristic],
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Wait until a central subscribes to a characteristic. Producers can
+        await this before generating values so that they sleep while nobody
+        is listening
+
+        Parameters
+        ----------
+        characteristic : Union[str, BlessGATTCharacteristic]
+            The characteristic or its UUID
+        timeout : Optional[float]
+            Seconds to wait before giving up. None waits forever
+
+        Returns
+        -------
+        bool
+            True once a central is subscribed, False if the timeout expired
+        """
+        return await self.subscriptions.wait_for_subscribers(
+            self._char_uuid(characteristic), timeout
+        )
+
+    def is_subscribed(
+        self, characteristic: Union[str, BlessGATTCharacteristic]
+    ) -> bool:
+        """
+        Determine whether any central is subscribed to a characteristic
+
+        Parameters
+        ----------
+        characteristic : Union[str, BlessGATTCharacteristic]
+            The characteristic or its UUID
+
+        Returns
+        -------
+        bool
+            Whether notifications for the characteristic would reach anybody
+        """
+        return self.subscriptions.is_subscribed(self._char_uuid(characteristic))
+
+    @staticmethod
+    def _char_uuid(characteristic: Union[str, BlessGATTCharacteristic]) -> str:
+        if isinstance(characteristic, str):
+            return characteristic
+        return characteristic.uuid
+
+    def _subscription_changed(self, char_uuid: str, central: str, subscribed: bool):
+        """
+        Dispatch a subscription change to the user callbacks
+
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the characteristic
+        central : str
+            The identifier of the central
+        subscribed : bool
+            Whether the central subscribed or unsubscribed
+        """
+        callback: Optional[Callable[..., Any]] = self._callbacks.get(
+            "subscribe" if subscribed else "unsubscribe"
+        )
+        if callback is None:
+            return
+        characteristic: Optional[BlessGATTCharacteristic] = self.get_characteristic(
+            char_uuid
+        )
+        if characteristic is None:
+            return
+        callback(characteristic, central)
+
     def get_service(self, uuid: str) -> Optional[BlessGATTService]:
         """
         Retrieves the service whose UUID matches the string given
@@ -248,9 +615,67 @@ class BaseBlessServer(abc.ABC):
         ]
         try:
             return potentials[0]
-        except KeyError:
+        except IndexError:
             return None
 
+    def set_codec(
+        self, char_uuid: str, codec: Union[str, Sequence[Field], CharacteristicCodec]
+    ) -> CharacteristicCodec:
+        """
+        Declare the type of a characteristic's value
+
+        Parameters
+        ----------
+        char_uuid : str
+            The string representation of the UUID for the characteristic
+        codec : Union[str, Sequence[Field], CharacteristicCodec]
+            A struct format string, the fields of the value, or a codec
+
+        Returns
+        -------
+        CharacteristicCodec
+            The compiled codec
+        """
+        characteristic: Optional[BlessGATTCharacteristic] = self.get_characteristic(
+            char_uuid
+        )
+        if characteristic is None:
+            raise BlessError("Invalid characteristic: {}".format(char_uuid))
+        if not isinstance(codec, CharacteristicCodec):
+            codec = CharacteristicCodec(codec)
+        characteristic.codec = codec
+        return codec
+
+    async def start_control_endpoint(self, path: str) -> "ControlServer":
+        """
+        Listen on a Unix domain socket for values from other local programs.
+        See ControlServer for the protocol
+
+        Parameters
+        ----------
+        path : str
+            The filesystem path of the socket
+
+        Returns
+        -------
+        ControlServer
+            The running endpoint
+        """
+        from bless.backends.control import ControlServer
+
+        await self.stop_control_endpoint()
+        self.control = ControlServer(self, path)
+        await self.control.start()
+        return self.control
+
+    async def stop_control_endpoint(self):
+        """
+        Close the control endpoint, if any
+        """
+        if self.control is not None:
+            await self.control.stop()
+            self.control = None
+
     async def add_gatt(self, gatt_tree: Dict):
         """
         Uses the provided dictionary add all the services and characteristics
@@ -259,7 +684,11 @@ class BaseBlessServer(abc.ABC):
         ----------
         gatt_tree : Dict
             A dictionary of services and characteristics where the keys are the
-            uuids and the attributes are the properties
+            uuids and the attributes are the properties. A characteristic's
+            optional "Format" is passed to set_codec and its optional
+            "ReadDeadline" to set_read_deadline. Characteristics and
+            descriptors with "Persist" set to True start with the value saved
+            in the value_store, if any, and have their value saved to it
         """
         for service_uuid, service_info in gatt_tree.items():
             await self.add_new_service(service_uuid)
@@ -268,9 +697,18 @@ class BaseBlessServer(abc.ABC):
                     service_uuid,
                     char_uuid,
                     char_info.get("Properties"),
-                    char_info.get("Value"),
+                    self._restored_value(char_info, char_uuid),
                     char_info.get("Permissions"),
                 )
+                char_format: Any = char_info.get("Format")
+                if char_format is not None:
+                    self.set_codec(char_uuid, char_format)
+                read_deadline: Optional[float] = char_info.get("ReadDeadline")
+                if read_deadline is not None:
+                    self.set_read_deadline(char_uuid, read_deadline)
+                characteristic = self.get_characteristic(char_uuid)
+                if char_info.get("Persist") and characteristic is not None:
+                    self._persist(characteristic, char_uuid)
                 descriptors = char_info.get("Descriptors")
                 if isinstance(descriptors, dict):
                     for desc_uuid, desc_info in descriptors.items():
@@ -279,9 +717,100 @@ class BaseBlessServer(abc.ABC):
                             char_uuid,
                             desc_uuid,
                             desc_info.get("Properties"),
-                            desc_info.get("Value"),
+                            self._restored_value(desc_info, char_uuid, desc_uuid),
                             desc_info.get("Permissions"),
                         )
+                        if desc_info.get("Persist") and characteristic is not None:
+                            descriptor = characteristic.get_descriptor(desc_uuid)
+                            if descriptor is not None:
+                                self._persist(descriptor, char_uuid, desc_uuid)
+
+    def _restored_value(
+        self, info: Dict, char_uuid: str, desc_uuid: Optional[str] = None
+    ) -> Optional[bytearray]:
+        if not info.get("Persist"):
+            return info.get("Value")
+        if self.value_store is None:
+            raise BlessError("Persist requires a value_store")
+        stored: Optional[bytes] = self.value_store.get(char_uuid, desc_uuid)
+        if stored is None:
+            return info.get("Value")
+        return bytearray(stored)
+
+    def _persist(self, attribute: Any, char_uuid: str, desc_uuid: Optional[str] = None):
+        assert self.value_store is not None
+        self.value_store.track(attribute, char_uuid, desc_uuid)
+        self.value_store.start()
+
+    async def add_characteristic_table(
+        self,
+        service_uuid: str,
+        char_uuids: List[str],
+        dtype: Any,
+        properties: GATTCharacteristicProperties,
+        permissions: GATTAttributePermissions,
+    ) -> "CharacteristicTable":
+        """
+        Add a group of characteristics whose values live in one numpy array.
+        Requires numpy
+
+        Parameters
+        ----------
+        service_uuid : str
+            The string representation of the UUID of the GATT service to which
+            the characteristics should belong
+        char_uuids : List[str]
+            The UUIDs of the characteristics to add, one per row
+        dtype : numpy.dtype
+            The type of one characteristic value
+        properties : GATTCharacteristicProperties
+            GATT Characteristic Flags shared by the characteristics
+        permissions : GATTAttributePermissions
+            GATT flags that define the permissions for the characteristics
+
+        Returns
+        -------
+        CharacteristicTable
+            The table holding the values
+        """
+        from bless.backends.table import CharacteristicTable
+
+        for char_uuid in char_uuids:
+            await self.add_new_characteristic(
+                service_uuid, char_uuid, properties, None, permissions
+            )
+        return CharacteristicTable(self, service_uuid, char_uuids, dtype)
+
+    def set_read_deadline(
+        self,
+        char_uuid: str,
+        deadline: Optional[float],
+        error: Optional[BlessATTError] = None,
+    ):
+        """
+        Bound the time a central waits for a read of a characteristic. The
+        read handler runs in a thread, or on the server's loop if it is a
+        coroutine function, and a read that misses the deadline is answered
+        with error
+        if given, otherwise with the last value the handler returned. Misses
+        are counted as "read_deadline_miss" in metrics
+
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the characteristic
+        deadline : Optional[float]
+            Seconds the read handler may take, None to remove the deadline
+        error : Optional[BlessATTError]
+            The error that answers a late read instead of the last value
+        """
+        characteristic: Optional[BlessGATTCharacteristic] = self.get_characteristic(
+            char_uuid
+        )
+        if characteristic is None:
+            raise BlessError("Invalid characteristic: {}".format(char_uuid))
+        characteristic.read_deadline = deadline
+        characteristic.read_error = error
 
     def read_request(self, uuid: str, options: Optional[Dict] = None) -> bytearray:
         """
@@ -305,6 +834,81 @@ class BaseBlessServer(abc.ABC):
             A bytearray value that represents the value for the characteristic
             requested
         """
+        characteristic: BlessGATTCharacteristic = self._read_characteristic(
+            uuid, options
+        )
+        deadline: Optional[float] = characteristic.read_deadline
+        if deadline is None:
+            return self._read_value(
+                characteristic, self.read_request_func(characteristic)
+            )
+
+        started: float = time.monotonic()
+        future: concurrent.futures.Future
+        if asyncio.iscoroutinefunction(self.read_request_func):
+            future = self._run_on_loop(self.read_request_func(characteristic))
+        else:
+            future = self._read_handler_executor().submit(
+                self.read_request_func, characteristic
+            )
+        try:
+            value: Any = future.result(deadline)
+        except concurrent.futures.TimeoutError:
+            return self._read_deadline_missed(characteristic, future)
+        self.metrics.latency("read").record(time.monotonic() - started)
+        return self._read_value(characteristic, value)
+
+    async def read_request_async(
+        self, uuid: str, options: Optional[Dict] = None
+    ) -> bytearray:
+        """
+        Like read_request, for backends that can answer reads asynchronously.
+        The read handler may be a coroutine function, and the characteristic's
+        read deadline is enforced without blocking the loop
+
+        Parameters
+        ----------
+        uuid : str
+            The string representation of the UUID for the characteristic whose
+            value is to be read
+        options : Optional[Dict]
+            The options of the request
+
+        Returns
+        -------
+        bytearray
+            A bytearray value that represents the value for the characteristic
+            requested
+        """
+        characteristic: BlessGATTCharacteristic = self._read_characteristic(
+            uuid, options
+        )
+        func: Callable[[Any], Any] = self.read_request_func
+        deadline: Optional[float] = characteristic.read_deadline
+        if deadline is None and not asyncio.iscoroutinefunction(func):
+            return self._read_value(characteristic, func(characteristic))
+
+        started: float = time.monotonic()
+        future: asyncio.Future
+        if asyncio.iscoroutinefunction(func):
+            future = asyncio.ensure_future(func(characteristic))
+        else:
+            future = asyncio.get_running_loop().run_in_executor(
+                self._read_handler_executor(), func, characteristic
+            )
+        if deadline is None:
+            value: Any = await future
+        else:
+            try:
+                value = await asyncio.wait_for(asyncio.shield(future), deadline)
+            except asyncio.TimeoutError:
+                return self._read_deadline_missed(characteristic, future)
+        self.metrics.latency("read").record(time.monotonic() - started)
+        return self._read_value(characteristic, value)
+
+    def _read_characteristic(
+        self, uuid: str, options: Optional[Dict]
+    ) -> BlessGATTCharacteristic:
         if options is not None:
             self._update_mtu_from_options(options)
         characteristic: Optional[BlessGATTCharacteristic] = self.get_characteristic(
@@ -313,13 +917,96 @@ class BaseBlessServer(abc.ABC):
 
         if not characteristic:
             raise BlessError("Invalid characteristic: {}".format(uuid))
+        return characteristic
+
+    def _read_value(self, characteristic: BlessGATTCharacteristic, value: Any) -> Any:
+        """
+        Encode a value returned by the read handler and remember it for reads
+        that miss their deadline
+        """
+        if characteristic.codec is not None and not isinstance(
+            value, (bytes, bytearray, memoryview)
+        ):
+            value = bytearray(characteristic.codec.encode(value))
+        if characteristic.read_deadline is not None and value is not None:
+            characteristic._last_read = bytearray(value)
+        return value
+
+    def _read_deadline_missed(
+        self, characteristic: BlessGATTCharacteristic, future: Any
+    ) -> bytearray:
+        """
+        Answer a read whose handler is still running
 
-        return self.read_request_func(characteristic)
+        Parameters
+        ----------
+        characteristic : BlessGATTCharacteristic
+            The characteristic being read
+        future : Any
+            The asyncio or concurrent future of the handler, whose result is
+            remembered for later reads once it completes
+
+        Returns
+        -------
+        bytearray
+            The last known value
+        """
+        self.metrics.count("read_deadline_miss")
+        LOGGER.warning(
+            "Read handler for {} missed its {}s deadline".format(
+                characteristic.uuid, characteristic.read_deadline
+            )
+        )
+
+        def completed(f: Any):
+            if not f.cancelled() and f.exception() is None:
+                self._read_value(characteristic, f.result())
+
+        future.add_done_callback(completed)
+        if characteristic.read_error is not None:
+            raise characteristic.read_error
+        if characteristic._last_read is not None:
+            return characteristic._last_read
+        return characteristic.value
+
+    def _run_on_loop(self, coroutine: Coroutine) -> concurrent.futures.Future:
+        """
+        Run a coroutine on the server's loop from another thread
+
+        Parameters
+        ----------
+        coroutine : Coroutine
+            The coroutine
+
+        Returns
+        -------
+        concurrent.futures.Future
+            The future of its result
+        """
+        try:
+            running: Optional[AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            coroutine.close()
+            raise BlessError(
+                "A coroutine read handler cannot be waited for on the server's "
+                "loop, use read_request_async"
+            )
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def _read_handler_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        if self._read_executor is None:
+            self._read_executor = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix="bless-read"
+            )
+        return self._read_executor
 
     def write_request(self, uuid: str, value: Any, options: Optional[Dict] = None):
         """
         Obtain the characteristic to write and pass on to the user-defined
-        write_request_func
+        write_request_func. The value is decoded for characteristics with a
+        codec
 
         Note: write_request_func must be defined on the child class
         """
@@ -328,6 +1015,13 @@ class BaseBlessServer(abc.ABC):
         characteristic: Optional[BlessGATTCharacteristic] = self.get_characteristic(
             uuid
         )
+        if characteristic is not None:
+            for listener in self._write_listeners:
+                listener(characteristic, value)
+            if self._write_listeners and "write" not in self._callbacks:
+                return
+        if characteristic is not None and characteristic.codec is not None:
+            value = characteristic.codec.decode(bytes(value))
 
         self.write_request_func(characteristic, value)
 
@@ -411,6 +1105,72 @@ class BaseBlessServer(abc.ABC):
         """
         self._callbacks["write"] = func
 
+    @property
+    def on_connect(self) -> Optional[Callable[[str], Any]]:
+        """
+        Function called with the identifier of a central when it connects, on
+        backends that report connections
+        """
+        return self._callbacks.get("connect")
+
+    @on_connect.setter
+    def on_connect(self, func: Optional[Callable[[str], Any]]):
+        """
+        Set the function to call when a central connects
+        """
+        self._callbacks["connect"] = func  # type: ignore
+
+    @property
+    def on_disconnect(self) -> Optional[Callable[[str], Any]]:
+        """
+        Function called with the identifier of a central when it disconnects,
+        on backends that report connections
+        """
+        return self._callbacks.get("disconnect")
+
+    @on_disconnect.setter
+    def on_disconnect(self, func: Optional[Callable[[str], Any]]):
+        """
+        Set the function to call when a central disconnects
+        """
+        self._callbacks["disconnect"] = func  # type: ignore
+
+    @property
+    def on_subscribe(self) -> Optional[Callable[[BlessGATTCharacteristic, str], Any]]:
+        """
+        Function called with the characteristic and the identifier of the
+        central when a central subscribes to notifications or indications
+        """
+        return self._callbacks.get("subscribe")
+
+    @on_subscribe.setter
+    def on_subscribe(
+        self, func: Optional[Callable[[BlessGATTCharacteristic, str], Any]]
+    ):
+        """
+        Set the function to call when a central subscribes
+        """
+        self._callbacks["subscribe"] = func  # type: ignore
+
+    @property
+    def on_unsubscribe(
+        self,
+    ) -> Optional[Callable[[BlessGATTCharacteristic, str], Any]]:
+        """
+        Function called with the characteristic and the identifier of the
+        central when a central unsubscribes
+        """
+        return self._callbacks.get("unsubscribe")
+
+    @on_unsubscribe.setter
+    def on_unsubscribe(
+        self, func: Optional[Callable[[BlessGATTCharacteristic, str], Any]]
+    ):
+        """
+        Set the function to call when a central unsubscribes
+        """
+        self._callbacks["unsubscribe"] = func  # type: ignore
+
     @property
     def mtu(self) -> Optional[int]:
         """
@@ -4,6 +4,8 @@ from uuid import UUID
 from typing import Union, cast, TYPE_CHECKING
 from bleak.backends.service import BleakGATTService  # type: ignore
 
+from bless.backends.attribute import intern_uuid
+
 if TYPE_CHECKING:
     from bless.backends.server import BaseBlessServer
     from bless.backends.characteristic import BlessGATTCharacteristic
@@ -24,10 +26,7 @@ class BlessGATTService(BleakGATTService):
         uuid : Union[str, UUID]
             The uuid of the service
         """
-        if type(uuid) is str:
-            uuid_str: str = cast(str, uuid)
-            uuid = UUID(uuid_str)
-        self._uuid: str = str(uuid)
+        self._uuid: str = intern_uuid(uuid)
 
     @abc.abstractmethod
     async def init(self, server: "BaseBlessServer"):
@@ -0,0 +1,288 @@
+import asyncio
+import logging
+import os
+import struct
+import sys
+
+from multiprocessing import shared_memory
+from typing import List, Optional, Set, Tuple, cast, TYPE_CHECKING
+
+from bless.exceptions import BlessError
+
+if TYPE_CHECKING:
+    from bless.backends.server import BaseBlessServer
+
+logger = logging.getLogger(__name__)
+
+_MAGIC: bytes = b"BLSV"
+# magic, number of slots, bytes per slot
+_HEADER: struct.Struct = struct.Struct("<4sII4x")
+# sequence, value length
+_SLOT_HEADER: struct.Struct = struct.Struct("<QI4x")
+_SEQUENCE: struct.Struct = struct.Struct("<Q")
+
+# Blocks created by this process, or by the parent it was forked from, which
+# share its resource tracker registration
+_created: Set[str] = set()
+
+
+class SharedValueStore:
+    """
+    Characteristic values in shared memory, written by other processes
+
+    Each slot holds one value guarded by a sequence counter (a seqlock): the
+    writer makes the counter odd, writes the value and makes it even again,
+    and readers retry until they see the same even counter before and after
+    copying. Neither side takes a lock and values are never serialised. Each
+    slot must have a single writer.
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool):
+        """
+        Use SharedValueStore.create or SharedValueStore.attach instead
+
+        Parameters
+        ----------
+        memory : shared_memory.SharedMemory
+            The mapped block
+        owner : bool
+            Whether this process created the block and should unlink it
+        """
+        self.memory: shared_memory.SharedMemory = memory
+        self.owner: bool = owner
+        self._buf: memoryview = cast(memoryview, memory.buf)
+        magic, self.slots, self.slot_size = _HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC:
+            raise BlessError("{} is not a bless value store".format(memory.name))
+        self._stride: int = _SLOT_HEADER.size + (self.slot_size + 7) // 8 * 8
+
+    @classmethod
+    def create(
+        cls, slots: int, slot_size: int, name: Optional[str] = None
+    ) -> "SharedValueStore":
+        """
+        Allocate a new store
+
+        Parameters
+        ----------
+        slots : int
+            The number of values
+        slot_size : int
+            The largest value in bytes
+        name : Optional[str]
+            The name of the block. A unique name is chosen if None
+
+        Returns
+        -------
+        SharedValueStore
+            The store, which unlinks the block when closed
+        """
+        stride: int = _SLOT_HEADER.size + (slot_size + 7) // 8 * 8
+        memory = shared_memory.SharedMemory(
+            name=name, create=True, size=_HEADER.size + slots * stride
+        )
+        _HEADER.pack_into(cast(memoryview, memory.buf), 0, _MAGIC, slots, slot_size)
+        _created.add(memory._name)  # type: ignore
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedValueStore":
+        """
+        Map a store created by another process
+
+        Parameters
+        ----------
+        name : str
+            The name of the block, see SharedValueStore.name
+
+        Returns
+        -------
+        SharedValueStore
+            The store
+        """
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            memory = shared_memory.SharedMemory(name=name)
+            # Older versions register attached blocks with the resource
+            # tracker, which unlinks them when this process exits. The
+            # creator's registration must stay if it shares our tracker
+            if os.name == "posix" and memory._name not in _created:  # type: ignore
+                from multiprocessing import resource_tracker
+
+                resource_tracker.unregister(
+                    memory._name, "shared_memory"  # type: ignore
+                )
+        return cls(memory, owner=False)
+
+    @property
+    def name(self) -> str:
+        """The name other processes attach with"""
+        return self.memory.name
+
+    def write(self, slot: int, value: bytes):
+        """
+        Publish a value
+
+        Parameters
+        ----------
+        slot : int
+            The slot to write
+        value : bytes
+            The value, at most slot_size bytes
+        """
+        if len(value) > self.slot_size:
+            raise ValueError(
+                "{} bytes do not fit in a slot of {}".format(
+                    len(value), self.slot_size
+                )
+            )
+        buf: memoryview = self._buf
+        offset: int = self._offset(slot)
+        sequence: int = _SEQUENCE.unpack_from(buf, offset)[0]
+        _SEQUENCE.pack_into(buf, offset, sequence + 1)
+        start: int = offset + _SLOT_HEADER.size
+        buf[start:start + len(value)] = value
+        _SLOT_HEADER.pack_into(buf, offset, sequence + 2, len(value))
+
+    def sequence(self, slot: int) -> int:
+        """
+        Parameters
+        ----------
+        slot : int
+            The slot to inspect
+
+        Returns
+        -------
+        int
+            The slot's counter, which changes on every write
+        """
+        return _SEQUENCE.unpack_from(self._buf, self._offset(slot))[0]
+
+    def read(self, slot: int, retries: int = 100) -> Optional[Tuple[int, bytes]]:
+        """
+        Copy a consistent value out of a slot
+
+        Parameters
+        ----------
+        slot : int
+            The slot to read
+        retries : int
+            How often to retry while a writer is active
+
+        Returns
+        -------
+        Optional[Tuple[int, bytes]]
+            The sequence and value, None if every attempt overlapped a write
+        """
+        buf: memoryview = self._buf
+        offset: int = self._offset(slot)
+        start: int = offset + _SLOT_HEADER.size
+        for _ in range(retries):
+            sequence, length = _SLOT_HEADER.unpack_from(buf, offset)
+            if sequence & 1 or length > self.slot_size:
+                continue
+            value: bytes = bytes(buf[start:start + length])
+            if _SEQUENCE.unpack_from(buf, offset)[0] == sequence:
+                return sequence, value
+        return None
+
+    def close(self):
+        """
+        Unmap the store, and unlink it if this process created it
+        """
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+            _created.discard(self.memory._name)  # type: ignore
+
+    def _offset(self, slot: int) -> int:
+        if not 0 <= slot < self.slots:
+            raise IndexError("Slot {} is out of range".format(slot))
+        return _HEADER.size + slot * self._stride
+
+
+class SharedValueFeed:
+    """
+    Notifies the characteristics whose slots in a SharedValueStore changed
+
+    Slot i feeds characteristic i. The feed polls the sequence counters every
+    poll_interval seconds and calls update_value with the new bytes.
+    """
+
+    def __init__(
+        self,
+        server: "BaseBlessServer",
+        store: SharedValueStore,
+        characteristics: List[Tuple[str, str]],
+        poll_interval: float = 0.01,
+    ):
+        """
+        Parameters
+        ----------
+        server : BaseBlessServer
+            The server that hosts the characteristics
+        store : SharedValueStore
+            The store written by the producers
+        characteristics : List[Tuple[str, str]]
+            The (service UUID, characteristic UUID) fed by each slot
+        poll_interval : float
+            Seconds between polls
+        """
+        if len(characteristics) > store.slots:
+            raise BlessError(
+                "The store has {} slots for {} characteristics".format(
+                    store.slots, len(characteristics)
+                )
+            )
+        self.server: "BaseBlessServer" = server
+        self.store: SharedValueStore = store
+        self.characteristics: List[Tuple[str, str]] = list(characteristics)
+        self.poll_interval: float = poll_interval
+        self._seen: List[int] = [0] * len(self.characteristics)
+        self._task: Optional[asyncio.Task] = None
+
+    def poll(self) -> int:
+        """
+        Forward every slot that changed since the last poll
+
+        Returns
+        -------
+        int
+            The number of characteristics updated
+        """
+        updated: int = 0
+        for slot, (service_uuid, char_uuid) in enumerate(self.characteristics):
+            if self.store.sequence(slot) == self._seen[slot]:
+                continue
+            snapshot: Optional[Tuple[int, bytes]] = self.store.read(slot)
+            if snapshot is None:
+                # A writer is busy, pick the value up on the next poll
+                continue
+            self._seen[slot], value = snapshot
+            self.server.update_value(service_uuid, char_uuid, value)
+            updated += 1
+        return updated
+
+    def start(self):
+        """
+        Begin polling on the running event loop
+        """
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._poll_forever())
+
+    def stop(self):
+        """
+        Stop polling
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _poll_forever(self):
+        while True:
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Failed to forward shared values")
+            await asyncio.sleep(self.poll_interval)
@@ -0,0 +1,184 @@
+import asyncio
+import struct
+import time
+
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple, TYPE_CHECKING
+
+from bless.backends.codec import BatchEncoder, CharacteristicCodec, DEFAULT_MTU
+
+if TYPE_CHECKING:
+    from bless.backends.server import BaseBlessServer
+
+
+class TimeSeriesStream:
+    """
+    Streams samples through one notifying characteristic, packing as many
+    samples as the MTU allows into each notification
+
+    Every packet starts with a header holding a 16 bit sequence number, which
+    wraps, and the 32 bit time in ms of its first sample since the stream was
+    created, both little endian, followed by the samples. A packet is sent
+    once it is full or once its oldest sample has waited max_latency seconds.
+    Samples appended while nobody is subscribed are discarded when flushed.
+    Must be used from the thread running the server's event loop.
+    """
+
+    HEADER: struct.Struct = struct.Struct("<HI")
+
+    def __init__(
+        self,
+        server: "BaseBlessServer",
+        service_uuid: str,
+        char_uuid: str,
+        codec: CharacteristicCodec,
+        max_latency: float = 0.1,
+        capacity: int = 4096,
+    ):
+        """
+        Parameters
+        ----------
+        server : BaseBlessServer
+            The server that hosts the characteristic
+        service_uuid : str
+            The UUID of the service the characteristic belongs to
+        char_uuid : str
+            The UUID of a characteristic with the notify property
+        codec : CharacteristicCodec
+            The codec of one sample
+        max_latency : float
+            The longest a sample waits before its packet is sent, in seconds
+        capacity : int
+            The number of samples the ring buffer holds. The oldest samples are
+            dropped when producers outpace the link
+        """
+        self.server: "BaseBlessServer" = server
+        self.service_uuid: str = service_uuid
+        self.char_uuid: str = char_uuid
+        self.codec: CharacteristicCodec = codec
+        self.max_latency: float = max_latency
+
+        self._samples: Deque[Tuple[float, Any]] = deque(maxlen=capacity)
+        self._buffer: bytearray = bytearray()
+        self._sequence: int = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flush_scheduled: bool = False
+        self._started: float = time.monotonic()
+
+        self.packets_sent: int = 0
+        self.samples_sent: int = 0
+        self.bytes_sent: int = 0
+        self.dropped: int = 0
+
+    @property
+    def samples_per_packet(self) -> int:
+        """The number of samples that fit in one packet at the current MTU"""
+        return BatchEncoder.samples_per_payload(
+            self.codec, self.server.mtu or DEFAULT_MTU, self.HEADER.size
+        )
+
+    def append(self, sample: Any):
+        """
+        Queue a sample
+
+        Parameters
+        ----------
+        sample : Any
+            A native value accepted by the codec
+        """
+        if len(self._samples) == self._samples.maxlen:
+            self.dropped += 1
+        self._samples.append((time.monotonic(), sample))
+        if len(self._samples) >= self.samples_per_packet:
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                asyncio.get_running_loop().call_soon(self._flush_full)
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.max_latency, self.flush
+            )
+
+    def flush(self):
+        """
+        Send every queued sample now
+        """
+        self._cancel_timer()
+        while self._samples:
+            self._send(self.samples_per_packet)
+
+    def close(self):
+        """
+        Send the queued samples and stop the deadline timer
+        """
+        self.flush()
+
+    def throughput(self) -> Dict[str, float]:
+        """
+        Returns
+        -------
+        Dict[str, float]
+            Samples and bytes sent per second since the stream was created,
+            and the share of each packet's payload carrying samples
+        """
+        elapsed: float = max(time.monotonic() - self._started, 1e-9)
+        capacity: int = self.packets_sent * BatchEncoder.payload_size(
+            self.server.mtu or DEFAULT_MTU
+        )
+        return {
+            "samples_per_second": self.samples_sent / elapsed,
+            "bytes_per_second": self.bytes_sent / elapsed,
+            "efficiency": (
+                self.samples_sent * self.codec.size / capacity if capacity else 0.0
+            ),
+        }
+
+    def _flush_full(self):
+        self._flush_scheduled = False
+        per_packet: int = self.samples_per_packet
+        while len(self._samples) >= per_packet:
+            self._send(per_packet)
+        self._cancel_timer()
+        if self._samples:
+            # The remainder waits for the deadline of its oldest sample
+            delay: float = self._samples[0][0] + self.max_latency - time.monotonic()
+            self._timer = asyncio.get_running_loop().call_later(
+                max(delay, 0), self.flush
+            )
+
+    def _send(self, per_packet: int):
+        count: int = min(per_packet, len(self._samples))
+        if not self.server.is_subscribed(self.char_uuid):
+            for _ in range(count):
+                self._samples.popleft()
+            return
+
+        size: int = self.HEADER.size + count * self.codec.size
+        if len(self._buffer) < size:
+            self._buffer = bytearray(size)
+
+        first: float = self._samples[0][0]
+        self.HEADER.pack_into(
+            self._buffer,
+            0,
+            self._sequence,
+            int((first - self._started) * 1000) & 0xFFFFFFFF,
+        )
+        offset: int = self.HEADER.size
+        for _ in range(count):
+            timestamp, sample = self._samples.popleft()
+            self.codec.pack_into(self._buffer, offset, sample)
+            offset += self.codec.size
+
+        self.server.update_value(
+            self.service_uuid, self.char_uuid, memoryview(self._buffer)[:size]
+        )
+        self.server.metrics.latency("stream").record(time.monotonic() - first)
+        self._sequence = (self._sequence + 1) & 0xFFFF
+        self.packets_sent += 1
+        self.samples_sent += count
+        self.bytes_sent += size
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
@@ -0,0 +1,205 @@
+import asyncio
+import logging
+
+from typing import Callable, Dict, FrozenSet, Iterable, Optional, Set
+
+from bleak.uuids import normalize_uuid_str  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+SubscriptionCallback = Callable[[str, str, bool], None]
+
+
+class SubscriptionState:
+    """
+    The centrals subscribed to each characteristic of a server
+
+    Every backend reports subscriptions here so that producers can ask
+    whether anybody is listening, or sleep until somebody is, without knowing
+    how the platform tracks them. Methods must be called from the thread that
+    runs the server's event loop.
+    """
+
+    def __init__(self, on_change: Optional[SubscriptionCallback] = None):
+        """
+        Parameters
+        ----------
+        on_change : Optional[Callable[[str, str, bool], None]]
+            Called with the characteristic UUID, the central identifier and
+            whether the central subscribed or unsubscribed
+        """
+        self.on_change: Optional[SubscriptionCallback] = on_change
+        self._subscribers: Dict[str, Set[str]] = {}
+        self._events: Dict[str, asyncio.Event] = {}
+
+    @staticmethod
+    def key(char_uuid: str) -> str:
+        """
+        Normalize a characteristic UUID so that every backend agrees on it
+
+        Parameters
+        ----------
+        char_uuid : str
+            A 16, 32 or 128 bit UUID string in any case
+
+        Returns
+        -------
+        str
+            The lower case 128 bit UUID string
+        """
+        return normalize_uuid_str(char_uuid)
+
+    @property
+    def any_subscribed(self) -> bool:
+        """Whether any characteristic has a subscriber"""
+        return len(self._subscribers) > 0
+
+    def subscribers(self, char_uuid: str) -> FrozenSet[str]:
+        """
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the characteristic
+
+        Returns
+        -------
+        FrozenSet[str]
+            The identifiers of the centrals subscribed to the characteristic
+        """
+        return frozenset(self._subscribers.get(self.key(char_uuid), ()))
+
+    def is_subscribed(self, char_uuid: str) -> bool:
+        """
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the characteristic
+
+        Returns
+        -------
+        bool
+            Whether at least one central is subscribed to the characteristic
+        """
+        return self.key(char_uuid) in self._subscribers
+
+    def subscribe(self, char_uuid: str, central: str) -> bool:
+        """
+        Record that a central subscribed to a characteristic
+
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the characteristic
+        central : str
+            The identifier of the central
+
+        Returns
+        -------
+        bool
+            False if the central was already subscribed
+        """
+        key: str = self.key(char_uuid)
+        centrals: Set[str] = self._subscribers.setdefault(key, set())
+        if central in centrals:
+            return False
+        centrals.add(central)
+        event: Optional[asyncio.Event] = self._events.get(key)
+        if event is not None:
+            event.set()
+        self._notify(key, central, True)
+        return True
+
+    def unsubscribe(self, char_uuid: str, central: str) -> bool:
+        """
+        Record that a central unsubscribed from a characteristic
+
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the characteristic
+        central : str
+            The identifier of the central
+
+        Returns
+        -------
+        bool
+            False if the central was not subscribed
+        """
+        key: str = self.key(char_uuid)
+        centrals: Optional[Set[str]] = self._subscribers.get(key)
+        if centrals is None or central not in centrals:
+            return False
+        centrals.remove(central)
+        if len(centrals) == 0:
+            del self._subscribers[key]
+            event: Optional[asyncio.Event] = self._events.get(key)
+            if event is not None:
+                event.clear()
+        self._notify(key, central, False)
+        return True
+
+    def set_subscribers(self, char_uuid: str, centrals: Iterable[str]):
+        """
+        Replace the subscribers of a characteristic, for platforms that report
+        the full list on every change
+
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the characteristic
+        centrals : Iterable[str]
+            The identifiers of every central now subscribed
+        """
+        new: Set[str] = set(centrals)
+        old: FrozenSet[str] = self.subscribers(char_uuid)
+        for central in sorted(old - new):
+            self.unsubscribe(char_uuid, central)
+        for central in sorted(new - old):
+            self.subscribe(char_uuid, central)
+
+    def clear(self):
+        """
+        Unsubscribe every central, e.g. when the server stops
+        """
+        for key in list(self._subscribers):
+            self.set_subscribers(key, ())
+
+    async def wait_for_subscribers(
+        self, char_uuid: str, timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Wait until at least one central is subscribed to a characteristic
+
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of the characteristic
+        timeout : Optional[float]
+            Seconds to wait before giving up. None waits forever
+
+        Returns
+        -------
+        bool
+            True once a central is subscribed, False if the timeout expired
+        """
+        key: str = self.key(char_uuid)
+        if key in self._subscribers:
+            return True
+        event: asyncio.Event = self._events.setdefault(key, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def _notify(self, key: str, central: str, subscribed: bool):
+        logger.debug(
+            "Central {} {} {}".format(
+                central, "subscribed to" if subscribed else "unsubscribed from", key
+            )
+        )
+        if self.on_change is not None:
+            try:
+                self.on_change(key, central, subscribed)
+            except Exception:
+                logger.exception("Subscription callback failed")
@@ -0,0 +1,156 @@
+from uuid import UUID
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from bless.backends.characteristic import BlessGATTCharacteristic
+from bless.exceptions import BlessError
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+if TYPE_CHECKING:
+    from bless.backends.server import BaseBlessServer
+
+
+class CharacteristicTable:
+    """
+    The values of many characteristics of the same type held in one numpy
+    array
+
+    Each characteristic's value is a zero-copy view of its row, so writing to
+    the array changes what centrals read. flush compares the array with the
+    rows last sent and notifies only the characteristics that changed, which
+    turns refreshing hundreds of channels into a few array operations.
+    Requires numpy.
+    """
+
+    def __init__(
+        self,
+        server: "BaseBlessServer",
+        service_uuid: str,
+        char_uuids: List[str],
+        dtype: Any,
+    ):
+        """
+        Parameters
+        ----------
+        server : BaseBlessServer
+            The server that hosts the characteristics
+        service_uuid : str
+            The UUID of the service the characteristics belong to
+        char_uuids : List[str]
+            The UUIDs of the existing characteristics, one per row
+        dtype : numpy.dtype
+            The type of one value, e.g. "<f4" or a structured dtype. Its
+            bytes are the characteristic value
+        """
+        if np is None:
+            raise BlessError("CharacteristicTable requires numpy")
+
+        self.server: "BaseBlessServer" = server
+        self.service_uuid: str = service_uuid
+        self.char_uuids: List[str] = [str(UUID(uuid)) for uuid in char_uuids]
+        self._index: Dict[str, int] = {
+            uuid: i for i, uuid in enumerate(self.char_uuids)
+        }
+
+        self._values = np.zeros(len(self.char_uuids), dtype=dtype)
+        self._rows = self._values.view(np.uint8).reshape(
+            len(self.char_uuids), self._values.dtype.itemsize
+        )
+        self._sent = self._rows.copy()
+        self._views: List[memoryview] = [
+            memoryview(row) for row in self._rows  # type: ignore
+        ]
+
+        self._characteristics: List[BlessGATTCharacteristic] = []
+        for uuid, view in zip(self.char_uuids, self._views):
+            characteristic: Optional[
+                BlessGATTCharacteristic
+            ] = server.get_characteristic(uuid)
+            if characteristic is None:
+                raise BlessError("Invalid characteristic: {}".format(uuid))
+            characteristic.value = view  # type: ignore
+            self._characteristics.append(characteristic)
+
+    def __len__(self) -> int:
+        return len(self.char_uuids)
+
+    @property
+    def values(self) -> "np.ndarray":
+        """The array of values, one row per characteristic. Write to it in place"""
+        return self._values
+
+    def index(self, char_uuid: str) -> int:
+        """
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of a characteristic in the table
+
+        Returns
+        -------
+        int
+            The row that holds the characteristic's value
+        """
+        return self._index[str(UUID(char_uuid))]
+
+    def read(self, char_uuid: str) -> memoryview:
+        """
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of a characteristic in the table
+
+        Returns
+        -------
+        memoryview
+            The bytes of the characteristic's value, without copying
+        """
+        return self._views[self.index(char_uuid)]
+
+    def set(self, char_uuid: str, value: Any):
+        """
+        Set the value of one characteristic
+
+        Parameters
+        ----------
+        char_uuid : str
+            The UUID of a characteristic in the table
+        value : Any
+            A value convertible to the table's dtype
+        """
+        self._values[self.index(char_uuid)] = value
+
+    def changed(self) -> "np.ndarray":
+        """
+        Returns
+        -------
+        numpy.ndarray
+            The rows whose bytes differ from what was last flushed
+        """
+        return np.flatnonzero((self._rows != self._sent).any(axis=1))
+
+    def flush(self) -> List[str]:
+        """
+        Notify the subscribers of every characteristic that changed since the
+        last flush
+
+        Returns
+        -------
+        List[str]
+            The UUIDs of the characteristics that were notified
+        """
+        rows = self.changed()
+        notified: List[str] = []
+        for i in rows:
+            characteristic: BlessGATTCharacteristic = self._characteristics[i]
+            # Backends that copy values (CoreBluetooth) need the new bytes
+            characteristic.value = self._views[i]  # type: ignore
+            uuid: str = self.char_uuids[i]
+            if self.server.subscriptions.is_subscribed(uuid):
+                self.server.update_value(self.service_uuid, uuid)
+                notified.append(uuid)
+        self._sent[rows] = self._rows[rows]
+        return notified
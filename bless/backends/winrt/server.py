@@ -46,6 +46,7 @@ if sys.version_info >= (3, 12):
         GattWriteRequestedEventArgs,
         GattWriteRequest,
         GattSubscribedClient,
+        GattCommunicationStatus,
     )
 else:
     from bleak_winrt.windows.foundation import Deferral  # type: ignore
@@ -66,6 +67,7 @@ else:
         GattWriteRequestedEventArgs,
         GattWriteRequest,
         GattSubscribedClient,
+        GattCommunicationStatus,
     )
 
 logger = logging.getLogger(__name__)
@@ -120,6 +122,7 @@ class BlessServerWinRT(BaseBlessServer):
 
         self._advertising: bool = False
         self._advertising_started: Event = Event()
+        self._advertisement_data: Optional[BlessAdvertisementData] = None
         self._adapter: BLEAdapter = BLEAdapter()
         self._name_overwrite: bool = name_overwrite
 
@@ -141,6 +144,43 @@ class BlessServerWinRT(BaseBlessServer):
             connectable/discoverable settings
         """
 
+        self._advertisement_data = advertisement_data
+        self._start_advertising(advertisement_data)
+
+    async def update_advertisement(
+        self, advertisement_data: BlessAdvertisementData, **kwargs
+    ):
+        """
+        Change the advertised local name or the connectable and discoverable
+        flags. The service providers cannot change the parameters of a running
+        advertisement, so advertising is restarted with the new payload
+
+        Parameters
+        ----------
+        advertisement_data : BlessAdvertisementData
+            The advertisement fields to change. Fields that are None are left
+            as they are
+        """
+        if self._advertisement_data is not None:
+            advertisement_data = self._advertisement_data.merge(advertisement_data)
+        self._advertisement_data = advertisement_data
+        logger.debug("Updated Advertisement Data: {}".format(advertisement_data))
+        await self.stop()
+        self._start_advertising(advertisement_data)
+
+    def _start_advertising(
+        self, advertisement_data: Optional[BlessAdvertisementData]
+    ) -> None:
+        """
+        Start advertising every service and wait for the first one to report
+        that it started
+
+        Parameters
+        ----------
+        advertisement_data : Optional[BlessAdvertisementData]
+            Optional advertisement payload to customize local name and
+            connectable/discoverable settings
+        """
         if advertisement_data and advertisement_data.local_name is not None:
             self._adapter.set_local_name(advertisement_data.local_name)
         elif self._name_overwrite:
@@ -158,6 +198,8 @@ class BlessServerWinRT(BaseBlessServer):
         else:
             adv_parameters.is_connectable = True
 
+        # Wait for this start rather than a previous one
+        self._advertising_started.clear()
         for uuid, service in self.services.items():
             winrt_service: BlessGATTServiceWinRT = cast(BlessGATTServiceWinRT, service)
             service_provider = winrt_service.service_provider
@@ -165,6 +207,7 @@ class BlessServerWinRT(BaseBlessServer):
             service_provider.start_advertising(adv_parameters)
         self._advertising = True
         self._advertising_started.wait()
+        self._started()
 
     async def stop(self: "BlessServerWinRT"):
         """
@@ -176,6 +219,7 @@ class BlessServerWinRT(BaseBlessServer):
             assert service_provider is not None
             service_provider.stop_advertising()
         self._advertising = False
+        self._stopped()
 
     async def is_connected(self) -> bool:
         """
@@ -313,11 +357,13 @@ class BlessServerWinRT(BaseBlessServer):
         )
         await descriptor.init(characteristic)
 
-    def update_value(self, service_uuid: str, char_uuid: str) -> bool:
+    def update_value(
+        self, service_uuid: str, char_uuid: str, value: Any = None
+    ) -> bool:
         """
         Update the characteristic value. This is different than using
         characteristic.set_value. This send notifications to subscribed
-        central devices.
+        central devices. Nothing is sent when no central is subscribed.
 
         Parameters
         ----------
@@ -327,6 +373,9 @@ class BlessServerWinRT(BaseBlessServer):
         char_uuid : str
             The string representation of the UUID for the characteristic to be
             added
+        value : Any
+            Optional new value, native if the characteristic has a codec,
+            stored before notifying
 
         Returns
         -------
@@ -343,7 +392,11 @@ class BlessServerWinRT(BaseBlessServer):
         characteristic: BlessGATTCharacteristicWinRT = cast(
             BlessGATTCharacteristicWinRT, service.get_characteristic(char_uuid)
         )
-        value: bytes = characteristic.value
+        if value is not None:
+            characteristic.typed_value = value
+        if not self.subscriptions.is_subscribed(char_uuid):
+            return True
+        value = characteristic.value
         value = value if value is not None else b"\x00"
         writer: DataWriter = DataWriter()
         writer.write_bytes(value)
@@ -351,6 +404,53 @@ class BlessServerWinRT(BaseBlessServer):
 
         return True
 
+    async def _send_indication(
+        self, service_uuid: str, char_uuid: str, central: str
+    ) -> bool:
+        """
+        Indicate the characteristic value to one subscribed client. For
+        indications the WinRT operation completes once the client confirms
+
+        Parameters
+        ----------
+        service_uuid : str
+            The string representation of the UUID for the service
+        char_uuid : str
+            The string representation of the UUID for the characteristic
+        central : str
+            The device id of the subscribed client
+
+        Returns
+        -------
+        bool
+            Whether the indication was sent
+        """
+        characteristic: BlessGATTCharacteristicWinRT = cast(
+            BlessGATTCharacteristicWinRT, self.get_characteristic(char_uuid)
+        )
+        clients: List[GattSubscribedClient] = [
+            client
+            for client in (characteristic.obj.subscribed_clients or [])
+            if client.session.device_id.id == central
+        ]
+        if len(clients) == 0:
+            logger.debug("{} is no longer subscribed to {}".format(central, char_uuid))
+            return False
+        writer: DataWriter = DataWriter()
+        writer.write_bytes(bytes(characteristic.value or b"\x00"))
+        result = await characteristic.obj.notify_value_async(
+            writer.detach_buffer(), clients[0]
+        )
+        if result.status != GattCommunicationStatus.SUCCESS:
+            logger.debug(
+                "Indicating {} to {} failed: {}".format(
+                    char_uuid, central, result.status
+                )
+            )
+            return False
+        self._indication_confirmed(char_uuid, central)
+        return True
+
     def read_characteristic(
         self, sender: GattLocalCharacteristic, args: GattReadRequestedEventArgs
     ):
@@ -452,4 +552,10 @@ class BlessServerWinRT(BaseBlessServer):
             ]
             if mtu_values:
                 self._mtu = max(mtu_values)
+        # WinRT raises this event on its own thread
+        self.loop.call_soon_threadsafe(
+            self.subscriptions.set_subscribers,
+            str(sender.uuid),
+            [client.session.device_id.id for client in self._subscribed_clients],
+        )
         logger.info("New device subscribed")
@@ -2,3 +2,29 @@ class BlessError(Exception):
     """
     Base Exception for Bless
     """
+
+
+class BlessATTError(BlessError):
+    """
+    Answers a request with an ATT error instead of a value
+    """
+
+    READ_NOT_PERMITTED: int = 0x02
+    WRITE_NOT_PERMITTED: int = 0x03
+    REQUEST_NOT_SUPPORTED: int = 0x06
+    INVALID_OFFSET: int = 0x07
+    INSUFFICIENT_AUTHORIZATION: int = 0x08
+    INVALID_ATTRIBUTE_VALUE_LENGTH: int = 0x0D
+    UNLIKELY_ERROR: int = 0x0E
+
+    def __init__(self, code: int, message: str = ""):
+        """
+        Parameters
+        ----------
+        code : int
+            The ATT error code, e.g. BlessATTError.UNLIKELY_ERROR
+        message : str
+            A description for logs
+        """
+        super(BlessATTError, self).__init__(message or "ATT error {:#04x}".format(code))
+        self.code: int = code
@@ -0,0 +1,54 @@
+"""
+Example for a BLE 4.0 Server driven from synchronous code. The server runs on
+its own thread and values are pushed to it from the main thread.
+"""
+import time
+import logging
+
+from typing import Dict
+
+from bless import (  # type: ignore
+    BlessGATTCharacteristic,
+    BlessServerThread,
+    GATTCharacteristicProperties,
+    GATTAttributePermissions,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(name=__name__)
+
+SERVICE: str = "A07498CA-AD5B-474E-940D-16F1FBE7E8CD"
+CHARACTERISTIC: str = "51FF12BB-3ED8-46E5-B4F9-D64E2FEC021B"
+
+gatt: Dict = {
+    SERVICE: {
+        CHARACTERISTIC: {
+            "Properties": (
+                GATTCharacteristicProperties.read
+                | GATTCharacteristicProperties.notify
+            ),
+            "Permissions": GATTAttributePermissions.readable,
+            "Value": bytearray(b"\x00"),
+        }
+    }
+}
+
+
+def read_request(characteristic: BlessGATTCharacteristic, **kwargs) -> bytearray:
+    # Called on the server's thread
+    return characteristic.value
+
+
+with BlessServerThread(name="Thread Service", read_request_func=read_request) as runner:
+    runner.start(gatt=gatt)
+    logger.info("Advertising, press Ctrl-C to stop")
+    counter: int = 0
+    try:
+        while True:
+            # Safe to call from any thread, the value is sent from the server's
+            # loop
+            runner.update_value(SERVICE, CHARACTERISTIC, bytearray([counter]))
+            counter = (counter + 1) % 256
+            time.sleep(0.1)
+    except KeyboardInterrupt:
+        pass
@@ -56,6 +56,10 @@ setuptools.setup(
             'platform_system=="Windows" and python_version>="3.12"'
         ),
     ],
+    extras_require={
+        "numpy": ["numpy"],
+        "dbus_fast": ["dbus-fast;platform_system=='Linux'"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -0,0 +1,74 @@
+import sys
+import pytest
+
+from typing import Any, Dict, List, Tuple
+
+if sys.platform.lower() == "linux":
+    from dbus_next.signature import Variant
+
+
+class FakeInterface:
+    """
+    Stand-in for the adapter interfaces used by the application: Properties
+    and LEAdvertisingManager1
+    """
+
+    def __init__(self, adapter: "FakeAdapter"):
+        self.adapter = adapter
+
+    async def call_get(self, interface: str, name: str) -> "Variant":
+        if name == "SupportedInstances":
+            return Variant("y", self.adapter.supported_instances)
+        if name == "ActiveInstances":
+            return Variant("y", len(self.adapter.registered))
+        raise KeyError(name)
+
+    async def call_set(self, interface: str, name: str, value: "Variant"):
+        self.adapter.calls.append(("set", (name, value.value)))
+
+    async def call_register_advertisement(self, path: str, options: Dict):
+        if len(self.adapter.registered) >= self.adapter.supported_instances:
+            raise RuntimeError("Maximum advertisements reached")
+        self.adapter.registered.append(path)
+        self.adapter.calls.append(("register", path))
+
+    async def call_unregister_advertisement(self, path: str):
+        self.adapter.registered.remove(path)
+        self.adapter.calls.append(("unregister", path))
+
+
+class FakeAdapter:
+    def __init__(self, supported_instances: int = 5, path: str = "/org/bluez/hci0"):
+        self.path: str = path
+        self.supported_instances: int = supported_instances
+        self.registered: List[str] = []
+        self.calls: List[Tuple[str, Any]] = []
+
+    def get_interface(self, name: str) -> FakeInterface:
+        return FakeInterface(self)
+
+
+class FakeBus:
+    def __init__(self):
+        self.exported: Dict[str, Any] = {}
+
+    def export(self, path: str, interface: Any):
+        self.exported[path] = interface
+
+    def unexport(self, path: str, interface: Any = None):
+        del self.exported[path]
+
+
+@pytest.fixture
+def fake_adapter() -> FakeAdapter:
+    return FakeAdapter()
+
+
+@pytest.fixture
+def fake_bus() -> FakeBus:
+    return FakeBus()
+
+
+@pytest.fixture
+def fake_adapters() -> List[FakeAdapter]:
+    return [FakeAdapter(path="/org/bluez/hci0"), FakeAdapter(path="/org/bluez/hci1")]
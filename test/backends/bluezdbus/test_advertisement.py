@@ -0,0 +1,61 @@
+import sys
+import pytest
+
+from typing import Any, Dict, List
+
+if sys.platform.lower() != "linux":
+    pytest.skip("Only for linux", allow_module_level=True)
+
+from dbus_next.signature import Variant  # noqa: E402
+
+from bless.backends.advertisement import BlessAdvertisementData  # noqa: E402
+from bless.backends.bluezdbus.dbus.application import BlueZGattApplication  # type: ignore # noqa: E402 E501
+
+
+def payload(value: int) -> BlessAdvertisementData:
+    return BlessAdvertisementData(manufacturer_data={0xFFFF: bytes([value])})
+
+
+@pytest.mark.asyncio
+async def test_update_advertising_in_place(fake_adapter, fake_bus):
+    adapter = fake_adapter
+    app: BlueZGattApplication = BlueZGattApplication("ble", "org.bluez", fake_bus)
+    await app.start_advertising(adapter, advertisement_data=payload(1))
+
+    advertisement = app.advertisements[0]
+    assert advertisement._manufacturer_data == {0xFFFF: Variant("ay", b"\x01")}
+
+    emitted: List[Dict[str, Any]] = []
+    advertisement.emit_properties_changed = (  # type: ignore
+        lambda changed_properties: emitted.append(changed_properties)
+    )
+    adapter.calls.clear()
+
+    await app.update_advertising(adapter, payload(2))
+    await app.update_advertising(adapter, payload(2))
+
+    # No D-Bus round trips and only the changed property is signalled
+    assert adapter.calls == []
+    assert emitted == [{"ManufacturerData": {0xFFFF: Variant("ay", b"\x02")}}]
+    assert app.advertisements == [advertisement]
+
+
+@pytest.mark.asyncio
+async def test_update_advertising_swap(fake_adapter, fake_bus):
+    adapter = fake_adapter
+    bus = fake_bus
+    app: BlueZGattApplication = BlueZGattApplication("ble", "org.bluez", bus)
+    await app.start_advertising(adapter, advertisement_data=payload(1))
+    old_path: str = app.advertisements[0].path
+    adapter.calls.clear()
+
+    await app.update_advertising(adapter, payload(2), swap=True)
+
+    new_path: str = app.advertisements[0].path
+    assert new_path != old_path
+    # The replacement is registered before the old advertisement is released
+    assert adapter.calls == [("register", new_path), ("unregister", old_path)]
+    assert list(bus.exported) == [new_path]
+    assert app.advertisements[0]._manufacturer_data == {
+        0xFFFF: Variant("ay", b"\x02")
+    }
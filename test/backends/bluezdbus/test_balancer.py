@@ -0,0 +1,63 @@
+import sys
+import pytest
+
+from typing import Dict
+
+if sys.platform.lower() != "linux":
+    pytest.skip("Only for linux", allow_module_level=True)
+
+from bless.backends.advertisement import BlessAdvertisementData  # noqa: E402
+from bless.backends.bluezdbus.dbus.application import BlueZGattApplication  # type: ignore # noqa: E402 E501
+from bless.backends.bluezdbus.dbus.balancer import (  # type: ignore # noqa: E402
+    BlueZAdapterBalancer,
+)
+
+
+@pytest.mark.asyncio
+async def test_balancer_advertises_on_least_loaded(fake_adapters, fake_bus):
+    hci0, hci1 = fake_adapters
+    connections: Dict[str, int] = {hci0.path: 0, hci1.path: 0}
+    app: BlueZGattApplication = BlueZGattApplication("ble", "org.bluez", fake_bus)
+    balancer = BlueZAdapterBalancer(
+        app, [hci0, hci1], lambda adapter: connections[adapter.path]
+    )
+
+    await balancer.start(BlessAdvertisementData(local_name="ble"))
+    assert balancer.advertising_adapters == [hci0, hci1]
+    assert len(hci0.registered) == 1 and len(hci1.registered) == 1
+
+    # A central on hci0 sends the next one to hci1
+    connections[hci0.path] = 1
+    hci0.calls.clear()
+    await balancer.balance()
+    assert balancer.advertising_adapters == [hci1]
+    assert hci0.registered == []
+    # The connected central still sees the name
+    assert ("set", ("Alias", "")) not in hci0.calls
+    assert app.advertisements_on(hci0) == []
+
+    # Payload changes reach the adapters that advertise later
+    await balancer.update(
+        BlessAdvertisementData(manufacturer_data={0xFFFF: b"\x01"}), swap=False
+    )
+    connections[hci1.path] = 1
+    await balancer.balance()
+    assert balancer.advertising_adapters == [hci0, hci1]
+    (advertisement,) = app.advertisements_on(hci0)
+    assert advertisement._local_name == "ble"
+    assert advertisement._manufacturer_data[0xFFFF].value == b"\x01"
+
+    await balancer.stop()
+    assert balancer.advertising_adapters == []
+    assert hci0.registered == [] and hci1.registered == []
+    assert app.advertisements == []
+
+
+@pytest.mark.asyncio
+async def test_balancer_single_adapter(fake_adapter, fake_bus):
+    app: BlueZGattApplication = BlueZGattApplication("ble", "org.bluez", fake_bus)
+    balancer = BlueZAdapterBalancer(app, [fake_adapter], lambda adapter: 3)
+    await balancer.start(None)
+    await balancer.balance()
+    assert balancer.advertising_adapters == [fake_adapter]
+    assert len(fake_adapter.registered) == 1
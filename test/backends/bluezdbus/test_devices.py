@@ -0,0 +1,80 @@
+import sys
+import pytest
+
+from typing import List, Tuple
+
+if sys.platform.lower() != "linux":
+    pytest.skip("Only for linux", allow_module_level=True)
+
+from dbus_next.message import Message  # noqa: E402
+from dbus_next.signature import Variant  # noqa: E402
+
+from bless.backends.bluezdbus.dbus.devices import (  # type: ignore # noqa: E402
+    BlueZDeviceTracker,
+    device_address,
+)
+
+DEVICE: str = "/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF"
+OTHER_ADAPTER_DEVICE: str = "/org/bluez/hci1/dev_11_22_33_44_55_66"
+
+
+def connected_changed(path: str, connected: bool) -> Message:
+    return Message.new_signal(
+        path,
+        "org.freedesktop.DBus.Properties",
+        "PropertiesChanged",
+        "sa{sv}as",
+        ["org.bluez.Device1", {"Connected": Variant("b", connected)}, []],
+    )
+
+
+def test_device_tracker():
+    events: List[Tuple[str, bool]] = []
+    tracker = BlueZDeviceTracker(
+        None, "/org/bluez/hci0", lambda path, state: events.append((path, state))
+    )
+    tracker.load(
+        {
+            DEVICE: {"org.bluez.Device1": {"Connected": Variant("b", True)}},
+            OTHER_ADAPTER_DEVICE: {
+                "org.bluez.Device1": {"Connected": Variant("b", True)}
+            },
+        }
+    )
+    assert tracker.is_connected
+    assert tracker.connected_devices == {DEVICE}
+
+    tracker._on_message(connected_changed(DEVICE, False))
+    tracker._on_message(connected_changed(OTHER_ADAPTER_DEVICE, True))
+    assert not tracker.is_connected
+
+    tracker._on_message(connected_changed(DEVICE, True))
+    tracker._on_message(connected_changed(DEVICE, True))
+    assert tracker.is_connected
+
+    # Removing the device object implies it disconnected
+    tracker._on_message(
+        Message.new_signal(
+            "/",
+            "org.freedesktop.DBus.ObjectManager",
+            "InterfacesRemoved",
+            "oas",
+            [DEVICE, ["org.bluez.Device1"]],
+        )
+    )
+    assert not tracker.is_connected
+    assert events == [(DEVICE, True), (DEVICE, False), (DEVICE, True), (DEVICE, False)]
+    assert device_address(DEVICE) == "AA:BB:CC:DD:EE:FF"
+
+
+def test_device_tracker_reset():
+    events: List[Tuple[str, bool]] = []
+    tracker = BlueZDeviceTracker(None, "/org/bluez/hci0")
+    tracker.add_listener(lambda path, state: events.append((path, state)))
+    tracker._on_message(connected_changed(DEVICE, True))
+
+    # bluetoothd exited without removing the device
+    tracker.reset()
+    tracker.reset()
+    assert not tracker.is_connected
+    assert events == [(DEVICE, True), (DEVICE, False)]
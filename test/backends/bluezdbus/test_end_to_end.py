@@ -0,0 +1,554 @@
+import gc
+import sys
+import asyncio
+import weakref
+import pytest
+
+from typing import Any, Dict, List, Tuple
+
+if sys.platform.lower() != "linux":
+    pytest.skip("Only for linux", allow_module_level=True)
+
+from dbus_next.aio import MessageBus  # type: ignore # noqa: E402
+from dbus_next.constants import BusType  # type: ignore # noqa: E402
+from dbus_next.errors import DBusError  # type: ignore # noqa: E402
+
+from bless.backends.attribute import GATTAttributePermissions  # noqa: E402
+from bless.backends.characteristic import (  # noqa: E402
+    BlessGATTCharacteristic,
+    GATTCharacteristicProperties,
+)
+from bless.backends.bluezdbus.server import BlessServerBlueZDBus  # noqa: E402
+from bless.backends.bluezdbus.dbus.engine import get_engine  # noqa: E402
+from bless.backends.bluezdbus.dbus.adapter import ADAPTER_INTERFACE  # noqa: E402
+from bless.backends.bluezdbus.dbus.pool import BlueZBusPool  # noqa: E402
+from bless.backends.bluezdbus.dbus.utils import (  # noqa: E402
+    find_adapter,
+    get_adapter,
+    list_adapters,
+)
+from bless.exceptions import BlessError  # noqa: E402
+
+from bless.backends.bluezdbus.testing import (  # noqa: E402
+    ADAPTER_PATH,
+    FakeBlueZ,
+    PrivateBus,
+)
+
+SERVICE: str = "a07498ca-ad5b-474e-940d-16f1fbe7e8cd"
+CHAR: str = "51ff12bb-3ed8-46e5-b4f9-d64e2fec021b"
+LONG_CHAR: str = "bfc0c92f-317d-4ba9-976b-cc11ce77b4ca"
+LONG_VALUE: bytes = bytes(range(100))
+
+
+@pytest.fixture
+async def bluez(request, monkeypatch):
+    """
+    A fake bluetoothd on a private bus, with one adapter unless the test
+    parametrizes the fixture indirectly with another count
+    """
+    if not PrivateBus.available():
+        pytest.skip("dbus-daemon is not installed")
+    bus = PrivateBus()
+    address: str = bus.start()
+    monkeypatch.setenv("DBUS_SYSTEM_BUS_ADDRESS", address)
+    fake = FakeBlueZ(adapters=getattr(request, "param", 1))
+    await fake.start(address)
+    yield fake
+    fake.stop()
+    bus.stop()
+
+
+@pytest.mark.parametrize("io_thread", [False, True])
+@pytest.mark.parametrize("dbus_engine", ["dbus_next", "dbus_fast"])
+@pytest.mark.parametrize("fast_path", [True, False])
+async def test_server(
+    bluez: FakeBlueZ, io_thread: bool, dbus_engine: str, fast_path: bool, monkeypatch
+):
+    try:
+        engine = get_engine(dbus_engine)
+    except BlessError:
+        pytest.skip("{} is not installed".format(dbus_engine))
+    # Without the library internals the public API is used instead
+    monkeypatch.setattr(engine, "fast_path", fast_path)
+    gatt: Dict = {
+        SERVICE: {
+            CHAR: {
+                "Properties": (
+                    GATTCharacteristicProperties.read
+                    | GATTCharacteristicProperties.write
+                    | GATTCharacteristicProperties.notify
+                ),
+                "Permissions": (
+                    GATTAttributePermissions.readable
+                    | GATTAttributePermissions.writeable
+                ),
+                "Value": bytearray(b"\x01"),
+            },
+            LONG_CHAR: {
+                "Properties": GATTCharacteristicProperties.read,
+                "Permissions": GATTAttributePermissions.readable,
+                "Value": bytearray(LONG_VALUE),
+            },
+        }
+    }
+    writes: List[bytes] = []
+    connections: List[str] = []
+
+    def read(characteristic: BlessGATTCharacteristic, **kwargs) -> bytearray:
+        return characteristic.value
+
+    def write(characteristic: BlessGATTCharacteristic, value: Any, **kwargs):
+        characteristic.value = value
+        writes.append(bytes(value))
+
+    server = BlessServerBlueZDBus(
+        "Fake", io_thread=io_thread, dbus_engine=dbus_engine
+    )
+    server.read_request_func = read
+    server.write_request_func = write
+    server.on_connect = connections.append
+    await server.add_gatt(gatt)
+    await server.start()
+    try:
+        assert bluez.owner is not None
+        assert type(server.bus).__module__.startswith(dbus_engine)
+        assert await server.is_advertising()
+        (advertisement,) = bluez.advertisements.values()
+        assert advertisement["LocalName"] == "Fake"
+
+        assert await bluez.read(CHAR) == b"\x01"
+        assert await bluez.read_long(LONG_CHAR) == LONG_VALUE
+        assert await bluez.read(LONG_CHAR, offset=90) == LONG_VALUE[90:]
+
+        await bluez.write(CHAR, b"\x02")
+        await bluez.write(CHAR, b"\x03", command=True)
+        assert writes == [b"\x02", b"\x03"]
+        assert server.mtu == 23
+
+        # Write sockets are not offered
+        with pytest.raises(DBusError):
+            await bluez.acquire_write(CHAR)
+
+        await bluez.start_notify(CHAR)
+        await asyncio.sleep(0.05)
+        assert server.is_subscribed(CHAR)
+        for i in range(10):
+            server.update_value(SERVICE, CHAR, bytearray([i]))
+        await bluez.wait_for_notifications(10)
+        assert [value for _, value in bluez.notifications] == [
+            bytes([i]) for i in range(10)
+        ]
+        await bluez.stop_notify(CHAR)
+        await asyncio.sleep(0.05)
+        assert not server.is_subscribed(CHAR)
+
+        bluez.connect_device("AA:BB:CC:DD:EE:FF")
+        await asyncio.sleep(0.05)
+        assert connections == ["AA:BB:CC:DD:EE:FF"]
+        assert await server.is_connected()
+    finally:
+        await server.stop()
+        if server.io_thread is not None:
+            server.io_thread.stop()
+
+    assert bluez.owner is None
+    assert bluez.advertisements == {}
+
+
+@pytest.mark.parametrize("bluez", [2], indirect=True)
+async def test_multiple_adapters(bluez: FakeBlueZ):
+    hci0, hci1 = bluez.adapter_paths
+    gatt: Dict = {
+        SERVICE: {
+            CHAR: {
+                "Properties": (
+                    GATTCharacteristicProperties.read
+                    | GATTCharacteristicProperties.notify
+                ),
+                "Permissions": GATTAttributePermissions.readable,
+                "Value": bytearray(b"\x01"),
+            },
+        }
+    }
+    server = BlessServerBlueZDBus("Fake", adapters=["hci0", "hci1"])
+    server.read_request_func = lambda characteristic, **kwargs: characteristic.value
+    await server.add_gatt(gatt)
+    await server.start()
+    try:
+        assert [a.path for a in server.adapters] == [hci0, hci1]
+        assert server.adapter.path == hci0
+        assert bluez.registered == {hci0, hci1}
+        assert len(bluez.advertisements_on(hci0)) == 1
+        assert len(bluez.advertisements_on(hci1)) == 1
+        assert await bluez.read(CHAR) == b"\x01"
+
+        # The next central is steered to the adapter without one
+        bluez.connect_device("AA:BB:CC:DD:EE:FF", adapter_path=hci0)
+        await asyncio.sleep(0.1)
+        assert await server.is_connected()
+        assert bluez.advertisements_on(hci0) == []
+        assert len(bluez.advertisements_on(hci1)) == 1
+        assert await server.is_advertising()
+
+        bluez.connect_device("AA:BB:CC:DD:EE:FF", False, adapter_path=hci0)
+        await asyncio.sleep(0.1)
+        assert not await server.is_connected()
+        assert len(bluez.advertisements_on(hci0)) == 1
+
+        # Each adapter starts notifying for its own first subscriber
+        await bluez.start_notify(CHAR)
+        await bluez.start_notify(CHAR)
+        await bluez.stop_notify(CHAR)
+        await asyncio.sleep(0.05)
+        assert server.is_subscribed(CHAR)
+        await bluez.stop_notify(CHAR)
+        await asyncio.sleep(0.05)
+        assert not server.is_subscribed(CHAR)
+    finally:
+        await server.stop()
+
+    assert bluez.registered == set()
+    assert bluez.advertisements == {}
+
+
+async def test_shared_bus(bluez: FakeBlueZ):
+    pool = BlueZBusPool()
+    connections: List[str] = []
+    servers: List[BlessServerBlueZDBus] = []
+    for uuid in (CHAR, LONG_CHAR):
+        server = BlessServerBlueZDBus("Fake", bus_pool=pool)
+        server.read_request_func = lambda characteristic, **kwargs: (
+            characteristic.value
+        )
+        server.on_connect = connections.append
+        await server.add_gatt(
+            {
+                SERVICE: {
+                    uuid: {
+                        "Properties": GATTCharacteristicProperties.read,
+                        "Permissions": GATTAttributePermissions.readable,
+                        "Value": bytearray(uuid.encode()),
+                    }
+                }
+            }
+        )
+        await server.start()
+        servers.append(server)
+    first, second = servers
+    try:
+        assert first.bus is second.bus
+        assert first.adapter is second.adapter
+        assert first.device_tracker is second.device_tracker
+        assert first.app.path == "/org/bluez/Fake"
+        assert second.app.path == "/org/bluez/Fake_2"
+        assert {path for _, path in bluez.registrations} == {
+            first.app.path,
+            second.app.path,
+        }
+        assert len(bluez.advertisements) == 2
+        assert await bluez.read(CHAR) == CHAR.encode()
+        assert await bluez.read(LONG_CHAR) == LONG_CHAR.encode()
+
+        bluez.connect_device("AA:BB:CC:DD:EE:FF")
+        await asyncio.sleep(0.05)
+        assert connections == ["AA:BB:CC:DD:EE:FF"] * 2
+
+        # Stopping one server leaves the other registered
+        await first.stop()
+        assert await bluez.read(LONG_CHAR) == LONG_CHAR.encode()
+        with pytest.raises(KeyError):
+            bluez.characteristic(CHAR)
+    finally:
+        await second.stop()
+
+    assert bluez.owner is None
+    assert bluez.applications == {}
+
+
+async def test_shared_bus_reuse(bluez: FakeBlueZ):
+    pool = BlueZBusPool()
+    connections: List[str] = []
+    stopped: List[weakref.ref] = []
+    for _ in range(5):
+        server = BlessServerBlueZDBus("Fake", bus_pool=pool)
+        server.on_connect = connections.append
+        await server.start()
+        assert server.app.path == "/org/bluez/Fake"
+        await server.stop()
+        stopped.append(weakref.ref(server))
+    del server
+    gc.collect()
+    assert [ref() for ref in stopped] == [None] * 5
+
+    # Nothing is left listening on the shared objects
+    watcher = await pool.service_watcher()
+    tracker = await pool.device_tracker(ADAPTER_PATH)
+    properties = await pool.adapter_properties(ADAPTER_PATH)
+    assert watcher.listeners == []
+    assert tracker.listeners == []
+    assert properties.listeners == []
+    bluez.connect_device("AA:BB:CC:DD:EE:FF")
+    await asyncio.sleep(0.05)
+    assert connections == []
+
+    # A stopped server can start again under its path
+    server = BlessServerBlueZDBus("Fake", bus_pool=pool)
+    await server.start()
+    await server.stop()
+    await server.start()
+    try:
+        assert server.app.path == "/org/bluez/Fake"
+        assert len(tracker.listeners) == 1
+    finally:
+        await server.stop()
+
+
+@pytest.mark.parametrize("io_thread", [False, True])
+async def test_private_pool_closed(bluez: FakeBlueZ, io_thread: bool):
+    async with BlessServerBlueZDBus("Fake", io_thread=io_thread) as server:
+        assert await server.is_advertising()
+        thread: Any = server.io_thread._thread if io_thread else None
+    assert not server.bus.connected
+    assert server.bus_pool.io_thread is None
+    if io_thread:
+        assert not thread.is_alive()
+
+    # A shared pool outlives its servers
+    pool = BlueZBusPool(io_thread=io_thread)
+    async with BlessServerBlueZDBus("Fake", bus_pool=pool) as server:
+        pass
+    try:
+        assert server.bus.connected
+    finally:
+        await pool.close()
+    assert not server.bus.connected
+
+
+@pytest.mark.parametrize("bluez", [2], indirect=True)
+async def test_adapter_discovery(bluez: FakeBlueZ):
+    hci0, hci1 = bluez.adapter_paths
+    bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+    try:
+        assert await list_adapters(bus) == [hci0, hci1]
+        assert await find_adapter(bus, "hci1") == hci1
+        assert await find_adapter(bus, hci1) == hci1
+        assert (await get_adapter(bus)).path == hci0
+        # Names are matched exactly
+        with pytest.raises(Exception, match="No adapter named hci"):
+            await find_adapter(bus, "hci")
+        with pytest.raises(Exception, match="No adapter named hci2"):
+            await find_adapter(bus, "hci2")
+        # The device tree is never downloaded
+        assert not [c for c in bluez.calls if c[2] == "GetManagedObjects"]
+    finally:
+        bus.disconnect()
+
+
+async def test_adapter_properties(bluez: FakeBlueZ):
+    server = BlessServerBlueZDBus("Fake")
+    await server.start()
+    try:
+        properties = server.app.adapter_properties[server.adapter.path]
+        assert bluez.adapters[server.adapter.path]._alias == "Fake"
+
+        bluez.calls.clear()
+        for _ in range(3):
+            assert await server.is_advertising()
+        await server.app.set_name(server.adapter, "Fake")
+        # One Get, then the cache
+        assert [c[2] for c in bluez.calls] == ["Get"]
+
+        # Changes made by others arrive as signals
+        other = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        try:
+            await other.call(
+                bluez.alias_message(server.adapter.path, "Renamed")
+            )
+        finally:
+            other.disconnect()
+        await asyncio.sleep(0.05)
+        bluez.calls.clear()
+        assert await properties.get(ADAPTER_INTERFACE, "Alias") == "Renamed"
+        assert bluez.calls == []
+
+        await server.app.set_name(server.adapter, "Fake")
+        assert bluez.adapters[server.adapter.path]._alias == "Fake"
+    finally:
+        await server.stop()
+
+    assert not await server.is_advertising()
+    bluez.calls.clear()
+    assert not await server.is_advertising()
+    assert bluez.calls == []
+
+
+async def test_connected_devices_loaded_late(bluez: FakeBlueZ):
+    # bluetoothd exports every device it remembers, connected or not
+    for i in range(200):
+        bluez.add_device("AA:BB:CC:DD:{:02X}:{:02X}".format(i // 256, i % 256))
+        # dbus_next drops the connection when its InterfacesAdded pile up
+        await asyncio.sleep(0.001)
+    bluez.add_device("11:22:33:44:55:66", connected=True)
+
+    server = BlessServerBlueZDBus("Fake")
+    await server.start()
+    try:
+        members: List[str] = [c[2] for c in bluez.calls]
+        # The tree is only downloaded once the server advertises
+        assert "GetManagedObjects" not in members[
+            : members.index("RegisterAdvertisement")
+        ]
+        assert await server.is_connected()
+        assert [c[2] for c in bluez.calls].count("GetManagedObjects") == 1
+        await wait_for(lambda: "load_devices" in server.timings)
+    finally:
+        await server.stop()
+
+
+async def test_start_timings(monkeypatch):
+    if not PrivateBus.available():
+        pytest.skip("dbus-daemon is not installed")
+    bus = PrivateBus()
+    address: str = bus.start()
+    monkeypatch.setenv("DBUS_SYSTEM_BUS_ADDRESS", address)
+    # Each call to bluetoothd takes 100 ms: registering the application,
+    # setting the alias and registering the advertisement would take 300 ms
+    # one after the other
+    bluez = FakeBlueZ(latency=0.1)
+    await bluez.start(address)
+    server = BlessServerBlueZDBus("Fake")
+    try:
+        await server.start()
+        try:
+            # The connected devices load in the background
+            assert set(server.timings) - {"load_devices"} == {
+                "setup",
+                "register",
+                "prepare_advertisement",
+                "advertise",
+                "first_advertisement",
+            }
+            assert server.timings["register"] >= 0.1
+            assert server.timings["prepare_advertisement"] >= 0.1
+            assert server.timings["first_advertisement"] < 0.28
+            assert bluez.adapters[server.adapter.path]._alias == "Fake"
+            assert len(bluez.advertisements) == 1
+        finally:
+            await server.stop()
+        assert server.timings["stop"] > 0
+        assert bluez.advertisements == {}
+    finally:
+        bluez.stop()
+        bus.stop()
+
+
+async def wait_for(condition, timeout: float = 5.0):
+    async def wait():
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(wait(), timeout)
+
+
+async def test_recovery_after_restart(bluez: FakeBlueZ):
+    disconnections: List[str] = []
+    subscriptions: List[Tuple[str, bool]] = []
+    server = BlessServerBlueZDBus("Fake")
+    server.on_disconnect = disconnections.append
+    server.on_subscribe = lambda c, central: subscriptions.append((c.uuid, True))
+    server.on_unsubscribe = lambda c, central: subscriptions.append((c.uuid, False))
+    server.read_request_func = lambda characteristic, **kwargs: characteristic.value
+    await server.add_gatt(
+        {
+            SERVICE: {
+                CHAR: {
+                    "Properties": (
+                        GATTCharacteristicProperties.read
+                        | GATTCharacteristicProperties.notify
+                    ),
+                    "Permissions": GATTAttributePermissions.readable,
+                    "Value": bytearray(b"\x01"),
+                }
+            }
+        }
+    )
+    await server.start()
+    try:
+        app = server.app
+        (advertisement,) = bluez.advertisements
+        bluez.connect_device("AA:BB:CC:DD:EE:FF")
+        await wait_for(lambda: server.device_tracker.is_connected)
+        await bluez.start_notify(CHAR)
+        await wait_for(lambda: server.is_subscribed(CHAR))
+
+        # bluetoothd exports its adapters a little after claiming its name
+        bluez.adapter_delay = 0.2
+        await bluez.restart(downtime=0.1)
+        await wait_for(lambda: "recovery" in server.timings)
+
+        assert 0.2 <= server.timings["recovery"] < 2.0
+        assert disconnections == ["AA:BB:CC:DD:EE:FF"]
+        assert not await server.is_connected()
+        # No StopNotify comes for the subscriptions bluetoothd forgot
+        assert not server.is_subscribed(CHAR)
+        assert app.subscribed_characteristics == []
+        # The same objects are registered again
+        assert server.app is app
+        assert bluez.registered == {server.adapter.path}
+        assert list(bluez.advertisements) == [advertisement]
+        assert bluez.adapters[server.adapter.path]._alias == "Fake"
+        assert await server.is_advertising()
+        assert await bluez.read(CHAR) == b"\x01"
+
+        await bluez.start_notify(CHAR)
+        await wait_for(lambda: server.is_subscribed(CHAR))
+        await bluez.stop_notify(CHAR)
+        await wait_for(lambda: not server.is_subscribed(CHAR))
+        assert app.subscribed_characteristics == []
+        assert subscriptions == [(CHAR, True), (CHAR, False)] * 2
+    finally:
+        await server.stop()
+    assert bluez.registrations == set()
+    assert bluez.advertisements == {}
+
+
+async def test_recovery_after_power_cycle(bluez: FakeBlueZ):
+    server = BlessServerBlueZDBus("Fake")
+    await server.add_gatt(
+        {
+            SERVICE: {
+                CHAR: {
+                    "Properties": GATTCharacteristicProperties.notify,
+                    "Permissions": GATTAttributePermissions.readable,
+                    "Value": bytearray(b"\x01"),
+                }
+            }
+        }
+    )
+    await server.start()
+    try:
+        (advertisement,) = bluez.advertisements
+        await bluez.start_notify(CHAR)
+        await wait_for(lambda: server.is_subscribed(CHAR))
+
+        bluez.set_powered(server.adapter.path, False)
+        assert bluez.advertisements == {}
+        await wait_for(lambda: not server.is_subscribed(CHAR))
+        assert server.app.subscribed_characteristics == []
+        assert "recovery" not in server.timings
+
+        bluez.calls.clear()
+        bluez.set_powered(server.adapter.path, True)
+        await wait_for(lambda: "recovery" in server.timings)
+
+        assert server.timings["recovery"] < 2.0
+        # The application survived, only the advertisement is registered anew
+        assert bluez.registered == {server.adapter.path}
+        assert list(bluez.advertisements) == [advertisement]
+        assert [c[2] for c in bluez.calls if c[1].startswith("org.bluez")] == [
+            "RegisterApplication",
+            "RegisterAdvertisement",
+        ]
+    finally:
+        await server.stop()
@@ -0,0 +1,102 @@
+import sys
+import pytest
+
+if sys.platform.lower() != "linux":
+    pytest.skip("Only for linux", allow_module_level=True)
+
+from bless.backends.bluezdbus.dbus.engine import (  # noqa: E402
+    ENGINES,
+    DBusInterface,
+    PropertyAccess,
+    dbus_property,
+    get_engine,
+    method,
+)
+from bless.exceptions import BlessError  # noqa: E402
+
+
+class Counter(DBusInterface):
+    def __init__(self):
+        self._count: int = 0
+        super(Counter, self).__init__("org.bless.Counter1")
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Count(self) -> "u":  # type: ignore # noqa: F821 N802
+        return self._count
+
+    @dbus_property()
+    def Step(self) -> "u":  # type: ignore # noqa: F821 N802
+        return 1
+
+    @Step.setter  # type: ignore
+    def Step(self, value: "u"):  # type: ignore # noqa: F821 N802
+        pass
+
+    @method()
+    def Increment(self) -> "u":  # type: ignore # noqa: F821 N802
+        self._count += 1
+        return self._count
+
+
+@pytest.mark.parametrize("name", ENGINES)
+def test_interface(name: str):
+    try:
+        engine = get_engine(name)
+    except BlessError:
+        pytest.skip("{} is not installed".format(name))
+    assert get_engine(name) is engine
+
+    ported = engine.interface(Counter)
+    assert engine.interface(Counter) is ported
+    counter = ported()
+    assert isinstance(counter, Counter)
+    assert isinstance(counter, engine.ServiceInterface)
+    assert counter.engine is engine
+
+    introspection = counter.introspect()
+    assert [m.name for m in introspection.methods] == ["Increment"]
+    access = {p.name: p.access.value for p in introspection.properties}
+    assert access == {"Count": "read", "Step": "readwrite"}
+
+
+def test_default_engine():
+    assert isinstance(Counter(), get_engine().ServiceInterface)
+    with pytest.raises(BlessError):
+        get_engine("dbus_python")
+
+
+class Flag(DBusInterface):
+    __slots__ = ()
+    _slots = ("_raised",)
+
+    def __init__(self):
+        self._raised: bool = False
+        super(Flag, self).__init__("org.bless.Flag1")
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Raised(self) -> "b":  # type: ignore # noqa: F821 N802
+        return self._raised
+
+
+class Pennant(Flag):
+    pass
+
+
+@pytest.mark.parametrize("name", ENGINES)
+def test_slots(name: str):
+    try:
+        engine = get_engine(name)
+    except BlessError:
+        pytest.skip("{} is not installed".format(name))
+
+    flag = engine.interface(Flag)()
+    assert type(flag).__slots__ == ("_raised",)
+    flag._raised = True
+    assert flag.Raised is True
+    if name == "dbus_fast":
+        # Nothing in the hierarchy has an instance dict left
+        assert not hasattr(flag, "__dict__")
+
+    # A subclass without __slots__ keeps its instance dict
+    assert "__slots__" not in vars(engine.interface(Pennant))
+    assert hasattr(engine.interface(Pennant)(), "__dict__")
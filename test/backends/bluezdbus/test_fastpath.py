@@ -0,0 +1,60 @@
+import sys
+import pytest
+
+if sys.platform.lower() != "linux":
+    pytest.skip("Only for linux", allow_module_level=True)
+
+from bless.backends.bluezdbus.dbus.engine import ENGINES, get_engine  # noqa: E402
+from bless.backends.bluezdbus.dbus.fastpath import (  # noqa: E402
+    ValueChangedSignal,
+    value_reply,
+)
+from bless.exceptions import BlessError  # noqa: E402
+
+PATH: str = "/org/bluez/ble/service0001/char0001"
+
+
+@pytest.mark.parametrize("name", ENGINES)
+def test_matches_marshaller(name: str):
+    try:
+        engine = get_engine(name)
+    except BlessError:
+        pytest.skip("{} is not installed".format(name))
+
+    signal = ValueChangedSignal(PATH)
+    call = engine.Message(
+        destination=":1.5",
+        path=PATH,
+        interface="org.bluez.GattCharacteristic1",
+        member="ReadValue",
+        serial=99,
+        sender=":1.42",
+    )
+    # Every alignment of the trailing padding
+    for length in range(9):
+        value: bytes = bytes(range(length))
+
+        expected = engine.Message.new_signal(
+            PATH,
+            "org.freedesktop.DBus.Properties",
+            "PropertiesChanged",
+            "sa{sv}as",
+            [
+                "org.bluez.GattCharacteristic1",
+                {"Value": engine.Variant("ay", value)},
+                [],
+            ],
+        )
+        expected.serial = 7
+        assert signal.marshall(7, value) == bytes(expected._marshall(False))
+
+        reply = engine.Message.new_method_return(call, "ay", [value])
+        reply.serial = 8
+        assert value_reply(8, 99, ":1.42", value) == bytes(reply._marshall(False))
+
+
+def test_signals_share_the_body_layout():
+    first = ValueChangedSignal(PATH)
+    second = ValueChangedSignal(PATH.replace("char0001", "char0002"))
+    assert first._body is second._body
+    assert not hasattr(first, "__dict__")
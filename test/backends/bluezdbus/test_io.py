@@ -0,0 +1,44 @@
+import sys
+import asyncio
+import threading
+import pytest
+
+if sys.platform.lower() != "linux":
+    pytest.skip("Only for linux", allow_module_level=True)
+
+from bless.backends.bluezdbus.dbus.io import (  # type: ignore # noqa: E402
+    BlueZIOThread,
+    call_on_loop,
+)
+
+
+@pytest.mark.asyncio
+async def test_io_thread():
+    io = BlueZIOThread()
+    io.start()
+    try:
+        app_loop = asyncio.get_running_loop()
+        app_thread: int = threading.get_ident()
+
+        async def on_bus() -> int:
+            assert asyncio.get_running_loop() is io.loop
+            # A handler called by the bus runs back on the application loop
+            return await call_on_loop(app_loop, threading.get_ident)
+
+        assert await io.run(on_bus()) == app_thread
+
+        def fail():
+            raise ValueError("boom")
+
+        async def on_bus_failing():
+            await call_on_loop(app_loop, fail)
+
+        with pytest.raises(ValueError):
+            await io.run(on_bus_failing())
+
+        called: asyncio.Event = asyncio.Event()
+        io.call_soon(app_loop.call_soon_threadsafe, called.set)
+        await asyncio.wait_for(called.wait(), 1)
+    finally:
+        io.stop()
+    assert io.loop is None
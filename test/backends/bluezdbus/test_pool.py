@@ -0,0 +1,45 @@
+import sys
+import asyncio
+import pytest
+
+from typing import List
+
+if sys.platform.lower() != "linux":
+    pytest.skip("Only for linux", allow_module_level=True)
+
+from bless.backends.bluezdbus.dbus.pool import BlueZBusPool  # type: ignore # noqa: E402 E501
+
+
+def test_base_paths():
+    pool = BlueZBusPool()
+    assert pool.base_path("Sensor") == "/org/bluez/Sensor"
+    assert pool.base_path("Sensor") == "/org/bluez/Sensor_2"
+    assert pool.base_path("Sen-sor") == "/org/bluez/Sensor_3"
+    assert pool.base_path("Other") == "/org/bluez/Other"
+
+
+@pytest.mark.asyncio
+async def test_shared_once():
+    pool = BlueZBusPool()
+    calls: List[int] = []
+
+    async def connect() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise ConnectionError()
+        return len(calls)
+
+    # Concurrent callers share the one attempt, and its failure
+    results = await asyncio.gather(
+        *[pool._once("bus", connect) for _ in range(3)], return_exceptions=True
+    )
+    assert len(calls) == 1
+    assert all(isinstance(r, ConnectionError) for r in results)
+
+    # The next caller tries again, and the result is kept
+    assert await asyncio.gather(*[pool._once("bus", connect) for _ in range(3)]) == [
+        2, 2, 2
+    ]
+    assert await pool._once("bus", connect) == 2
+    assert len(calls) == 2
@@ -0,0 +1,62 @@
+import sys
+import pytest
+
+from typing import List
+
+if sys.platform.lower() != "linux":
+    pytest.skip("Only for linux", allow_module_level=True)
+
+from bless.backends.advertisement import BlessAdvertisementData  # noqa: E402
+from bless.backends.bluezdbus.dbus.application import BlueZGattApplication  # type: ignore # noqa: E402 E501
+from bless.backends.bluezdbus.dbus.scheduler import (  # type: ignore # noqa: E402
+    AdvertisementSet,
+    BlueZAdvertisementScheduler,
+)
+
+
+def beacon(value: int) -> BlessAdvertisementData:
+    return BlessAdvertisementData(manufacturer_data={0x004C: bytes([value])})
+
+
+@pytest.mark.asyncio
+async def test_scheduler_priority_and_rotation(fake_adapter, fake_bus):
+    fake_adapter.supported_instances = 3
+    app: BlueZGattApplication = BlueZGattApplication("ble", "org.bluez", fake_bus)
+    await app.start_advertising(fake_adapter)
+
+    scheduler = BlueZAdvertisementScheduler(app, fake_adapter)
+    pinned: AdvertisementSet = await scheduler.add_set(
+        beacon(0), min_interval=20, max_interval=30, priority=1
+    )
+    rotating: List[AdvertisementSet] = [
+        await scheduler.add_set(beacon(i)) for i in range(1, 4)
+    ]
+    assert pinned.min_interval == 20 and pinned.max_interval == 30
+
+    await scheduler.start()
+    try:
+        # One instance is held by the main advertisement
+        assert await scheduler.supported_instances() == 3
+        assert scheduler.instances_in_use == [pinned, rotating[0]]
+        assert len(fake_adapter.registered) == 3
+
+        seen: List[AdvertisementSet] = []
+        for _ in range(3):
+            await scheduler.rotate()
+            in_use = scheduler.instances_in_use
+            assert pinned in in_use and len(in_use) == 2
+            seen.extend(s for s in in_use if s is not pinned)
+        assert seen == [rotating[1], rotating[2], rotating[0]]
+    finally:
+        await scheduler.stop()
+
+    assert scheduler.instances_in_use == []
+    assert fake_adapter.registered == [app.advertisements[0].path]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_rejects_invalid_interval(fake_adapter, fake_bus):
+    app: BlueZGattApplication = BlueZGattApplication("ble", "org.bluez", fake_bus)
+    scheduler = BlueZAdvertisementScheduler(app, fake_adapter)
+    with pytest.raises(ValueError):
+        await scheduler.add_set(beacon(0), min_interval=10, max_interval=5)
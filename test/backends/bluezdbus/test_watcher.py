@@ -0,0 +1,44 @@
+import sys
+import pytest
+
+from typing import List, Optional
+
+if sys.platform.lower() != "linux":
+    pytest.skip("Only for linux", allow_module_level=True)
+
+from dbus_next.message import Message  # noqa: E402
+
+from bless.backends.bluezdbus.dbus.watcher import (  # type: ignore # noqa: E402
+    BlueZServiceWatcher,
+)
+
+
+def name_owner_changed(name: str, old_owner: str, new_owner: str) -> Message:
+    return Message.new_signal(
+        "/org/freedesktop/DBus",
+        "org.freedesktop.DBus",
+        "NameOwnerChanged",
+        "sss",
+        [name, old_owner, new_owner],
+    )
+
+
+def test_service_watcher():
+    owners: List[Optional[str]] = []
+    watcher = BlueZServiceWatcher(None)
+    watcher.owner = ":1.5"
+    watcher.add_listener(owners.append)
+
+    watcher._on_message(name_owner_changed("org.example", "", ":1.6"))
+    assert owners == []
+
+    # bluetoothd restarts
+    watcher._on_message(name_owner_changed("org.bluez", ":1.5", ""))
+    assert watcher.owner is None
+    watcher._on_message(name_owner_changed("org.bluez", "", ":1.7"))
+    assert watcher.owner == ":1.7"
+    assert owners == [None, ":1.7"]
+
+    watcher.remove_listener(owners.append)
+    watcher._on_message(name_owner_changed("org.bluez", ":1.7", ""))
+    assert owners == [None, ":1.7"]
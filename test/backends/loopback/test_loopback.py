@@ -0,0 +1,159 @@
+import time
+import pytest
+
+from typing import Any, List
+
+from bless.backends.attribute import GATTAttributePermissions  # type: ignore
+from bless.backends.characteristic import (  # type: ignore
+    BlessGATTCharacteristic,
+    GATTCharacteristicProperties,
+)
+from bless.backends.descriptor import GATTDescriptorProperties  # type: ignore
+from bless.backends.loopback.server import BlessServerLoopback  # type: ignore
+from bless.exceptions import BlessATTError  # type: ignore
+
+SERVICE: str = "a07498ca-ad5b-474e-940d-16f1fbe7e8cd"
+CHAR: str = "51ff12bb-3ed8-46e5-b4f9-d64e2fec021b"
+READ_ONLY: str = "bfc0c92f-317d-4ba9-976b-cc11ce77b4ca"
+DESC: str = "00002901-0000-1000-8000-00805f9b34fb"
+
+
+async def make_server() -> BlessServerLoopback:
+    server = BlessServerLoopback("Loopback")
+    await server.add_new_service(SERVICE)
+    await server.add_new_characteristic(
+        SERVICE,
+        CHAR,
+        GATTCharacteristicProperties.read
+        | GATTCharacteristicProperties.write
+        | GATTCharacteristicProperties.notify
+        | GATTCharacteristicProperties.indicate,
+        bytearray(b"hello"),
+        GATTAttributePermissions.readable | GATTAttributePermissions.writeable,
+    )
+    await server.add_new_characteristic(
+        SERVICE,
+        READ_ONLY,
+        GATTCharacteristicProperties.read,
+        bytearray(b"\x01"),
+        GATTAttributePermissions.readable,
+    )
+    await server.add_new_descriptor(
+        SERVICE,
+        CHAR,
+        DESC,
+        GATTDescriptorProperties.read,
+        bytearray(b"greeting"),
+        GATTAttributePermissions.readable,
+    )
+
+    def read(characteristic: BlessGATTCharacteristic) -> bytearray:
+        return characteristic.value
+
+    def write(characteristic: BlessGATTCharacteristic, value: Any, **kwargs):
+        characteristic.value = value
+
+    server.read_request_func = read
+    server.write_request_func = write
+    return server
+
+
+@pytest.mark.asyncio
+async def test_attribute_table():
+    server = await make_server()
+    characteristic = server.get_characteristic(CHAR)
+    assert characteristic is not None
+    assert characteristic.service_uuid == SERVICE
+    handles: List[int] = [
+        server.services[SERVICE].handle,
+        characteristic.handle,
+        server.get_characteristic(READ_ONLY).handle,
+    ]
+    assert handles == sorted(set(handles))
+    descriptor = characteristic.get_descriptor(DESC)
+    assert descriptor.value == bytearray(b"greeting")
+
+
+@pytest.mark.asyncio
+async def test_read_and_write():
+    server = await make_server()
+    assert await server.read(CHAR) == b"hello"
+    assert await server.read(CHAR, offset=2) == b"llo"
+    server.write(CHAR, b"bye")
+    assert await server.read(CHAR) == b"bye"
+    with pytest.raises(BlessATTError):
+        server.write(READ_ONLY, b"\x02")
+
+
+@pytest.mark.asyncio
+async def test_notifications_and_indications():
+    server = await make_server()
+    connected: List[str] = []
+    server.on_connect = connected.append
+    await server.start()
+    assert await server.is_advertising()
+
+    assert server.update_value(SERVICE, CHAR, bytearray(b"unheard"))
+    assert server.notifications == []
+
+    server.subscribe(CHAR, "central")
+    assert connected == ["central"]
+    assert await server.is_connected()
+    server.update_value(SERVICE, CHAR, bytearray(b"heard"))
+    latencies = await server.indicate(SERVICE, CHAR, timeout=1)
+    assert list(latencies) == ["central"]
+    assert server.notifications == [
+        ("central", CHAR, b"heard"),
+        ("central", CHAR, b"heard"),
+    ]
+    with pytest.raises(BlessATTError):
+        server.subscribe(READ_ONLY)
+
+    await server.stop()
+    assert not await server.is_connected()
+    assert not server.subscriptions.is_subscribed(CHAR)
+    assert not server.update_value("0000180f-0000-1000-8000-00805f9b34fb", CHAR)
+
+
+@pytest.mark.asyncio
+async def test_unsent_indication_fails_fast():
+    server = await make_server()
+    await server.start()
+    server.subscribe(CHAR, "central")
+
+    async def gone(service_uuid: str, char_uuid: str, central: str) -> bool:
+        return False
+
+    # The central went away, so no confirmation can come
+    server._send_indication = gone  # type: ignore
+    begin: float = time.monotonic()
+    assert await server.indicate(SERVICE, CHAR, timeout=5) == {"central": None}
+    assert time.monotonic() - begin < 1
+    assert server.indications.in_flight == 0
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_attributes_share_metadata():
+    server = await make_server()
+    other: str = "0000180f-0000-1000-8000-00805f9b34fb"
+    await server.add_new_service(other)
+    await server.add_new_characteristic(
+        other,
+        CHAR.upper(),
+        GATTCharacteristicProperties.read
+        | GATTCharacteristicProperties.write
+        | GATTCharacteristicProperties.notify
+        | GATTCharacteristicProperties.indicate,
+        None,
+        GATTAttributePermissions.readable,
+    )
+    first = server.services[SERVICE].get_characteristic(CHAR)
+    second = server.services[other].get_characteristic(CHAR)
+    assert first is not second
+    assert first.uuid is second.uuid
+    assert first.properties is second.properties
+    assert (
+        first._max_write_without_response_size
+        is second._max_write_without_response_size
+    )
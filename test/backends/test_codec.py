@@ -0,0 +1,56 @@
+import pytest
+
+from bless.backends.codec import BatchEncoder, CharacteristicCodec, Field
+
+
+def test_format_codec():
+    codec = CharacteristicCodec("<hhh")
+    assert codec.size == 6
+    assert codec.encode((1, -2, 3)) == b"\x01\x00\xfe\xff\x03\x00"
+    assert codec.decode(b"\x01\x00\xfe\xff\x03\x00") == (1, -2, 3)
+
+    single = CharacteristicCodec("H")
+    assert single.encode(513) == b"\x01\x02"
+    assert single.decode(b"\x01\x02") == 513
+
+    padded = CharacteristicCodec("<B2x4s")
+    assert padded.encode((1, b"ab")) == b"\x01\x00\x00ab\x00\x00"
+
+
+def test_scaled_fields():
+    codec = CharacteristicCodec(
+        [
+            Field("temperature", "h", scale=0.01),
+            Field("pressure", "I", scale=0.1, offset=50000),
+        ]
+    )
+    data: bytes = codec.encode({"temperature": 21.37, "pressure": 101325.04})
+    assert data == (2137).to_bytes(2, "little") + (513250).to_bytes(4, "little")
+    temperature, pressure = codec.decode(data)
+    assert temperature == pytest.approx(21.37)
+    assert pressure == pytest.approx(101325.0)
+
+
+def test_numpy_values():
+    np = pytest.importorskip("numpy")
+    codec = CharacteristicCodec("<hf")
+    assert codec.encode(np.array((3, 1.5), dtype="<i2,<f4")[()]) == codec.encode(
+        (3, 1.5)
+    )
+    assert CharacteristicCodec("<h").encode(np.int16(-1)) == b"\xff\xff"
+
+
+def test_batch_encoder():
+    encoder = BatchEncoder(CharacteristicCodec("<hh"), mtu=23)
+    # 20 byte payload holds five 4 byte samples
+    assert encoder.capacity == 5
+    # A 6 byte header of the caller's own leaves room for three
+    assert BatchEncoder.samples_per_payload(CharacteristicCodec("<hh"), 23, 6) == 3
+
+    samples = [(i, -i) for i in range(12)]
+    packets = [bytes(packet) for packet in encoder.packets(samples)]
+    assert [len(packet) for packet in packets] == [20, 20, 8]
+    assert packets[2] == b"\x0a\x00\xf6\xff\x0b\x00\xf5\xff"
+
+    with pytest.raises(ValueError):
+        encoder.encode(samples)
@@ -0,0 +1,121 @@
+import os
+import sys
+import uuid
+import asyncio
+import tempfile
+import pytest
+
+from typing import Any, Dict, List, Tuple
+
+if sys.platform == "win32":
+    pytest.skip("Unix domain sockets only", allow_module_level=True)
+
+from bless.backends.control import (  # noqa: E402
+    COUNT,
+    HEADER,
+    ControlServer,
+    Opcode,
+    frame,
+)
+
+SERVICE: str = "a07498ca-ad5b-474e-940d-16f1fbe7e8cd"
+CHAR: str = "51ff12bb-3ed8-46e5-b4f9-d64e2fec021b"
+KEY: bytes = uuid.UUID(CHAR).bytes
+
+
+class Characteristic:
+    uuid: str = CHAR
+    service_uuid: str = SERVICE
+    typed_value: Any = None
+
+
+class Server:
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self._write_listeners: List[Any] = []
+        self.characteristic = Characteristic()
+        self.updates: List[Tuple[str, bytes]] = []
+
+    def get_characteristic(self, uuid: str):
+        return self.characteristic if uuid == CHAR else None
+
+    def update_value(self, service_uuid: str, char_uuid: str, value=None) -> bool:
+        self.updates.append((char_uuid, value))
+        return True
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[int, int, bytes]:
+    length, opcode, request_id = HEADER.unpack(await reader.readexactly(HEADER.size))
+    return opcode, request_id, await reader.readexactly(length)
+
+
+@pytest.mark.asyncio
+async def test_control_server():
+    server = Server()
+    path: str = os.path.join(tempfile.mkdtemp(), "bless.sock")
+    control = ControlServer(server, path)  # type: ignore
+    await control.start()
+    try:
+        reader, writer = await asyncio.open_unix_connection(path)
+        unknown: bytes = uuid.uuid4().bytes
+        entry: bytes = KEY + (1).to_bytes(2, "little") + b"\x07"
+        # Pipelined requests, the first one without a reply
+        writer.write(
+            frame(Opcode.SET_VALUE, 0, KEY + b"\x01")
+            + frame(Opcode.NOTIFY, 1, KEY + b"\x02\x03")
+            + frame(Opcode.NOTIFY, 2, unknown + b"\x00")
+            + frame(Opcode.BATCH_NOTIFY, 3, entry * 3)
+            + frame(Opcode.SUBSCRIBE_WRITES, 4)
+        )
+
+        replies: Dict[int, Tuple[int, bytes]] = {}
+        for _ in range(4):
+            opcode, request_id, body = await read_frame(reader)
+            replies[request_id] = (opcode, body)
+
+        assert server.characteristic.typed_value == b"\x01"
+        assert replies[1] == (Opcode.OK, b"")
+        assert replies[2][0] == Opcode.ERROR
+        assert replies[3] == (Opcode.OK, COUNT.pack(3))
+        assert server.updates == [(CHAR, b"\x02\x03")] + [(CHAR, b"\x07")] * 3
+
+        # Central writes are forwarded to subscribed connections
+        server._write_listeners[0](server.characteristic, b"\x09")
+        assert await read_frame(reader) == (Opcode.WRITE_EVENT, 0, KEY + b"\x09")
+
+        writer.close()
+    finally:
+        await control.stop()
+    assert not os.path.exists(path)
+
+
+@pytest.mark.asyncio
+async def test_control_server_stop_with_clients():
+    server = Server()
+    path: str = os.path.join(tempfile.mkdtemp(), "bless.sock")
+    control = ControlServer(server, path)  # type: ignore
+    await control.start()
+    idle_reader, idle_writer = await asyncio.open_unix_connection(path)
+    reader, writer = await asyncio.open_unix_connection(path)
+    writer.write(frame(Opcode.SUBSCRIBE_WRITES, 1))
+    assert await read_frame(reader) == (Opcode.OK, 1, b"")
+
+    await asyncio.wait_for(control.stop(), 2.0)
+    assert control._connections == {}
+    assert await idle_reader.read() == b""
+    assert await reader.read() == b""
+    idle_writer.close()
+    writer.close()
+    assert not os.path.exists(path)
+
+
+@pytest.mark.asyncio
+async def test_control_server_keeps_other_files():
+    path: str = os.path.join(tempfile.mkdtemp(), "bless.sock")
+    with open(path, "w") as f:
+        f.write("not a socket")
+    control = ControlServer(Server(), path)  # type: ignore
+    with pytest.raises(OSError):
+        await control.start()
+    with open(path) as f:
+        assert f.read() == "not a socket"
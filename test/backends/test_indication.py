@@ -0,0 +1,64 @@
+import asyncio
+import pytest
+
+from typing import List
+
+from bless.backends.indication import IndicationTracker
+from bless.backends.metrics import LatencyStats
+
+CHAR: str = "a07498ca-ad5b-474e-940d-16f1fbe7e8cd"
+
+
+@pytest.mark.asyncio
+async def test_indications_pipeline_across_centrals():
+    tracker = IndicationTracker()
+    order: List[str] = []
+
+    async def indicate(central: str):
+        async with tracker.lock(central):
+            confirmation = tracker.expect(CHAR, central)
+            order.append("sent " + central)
+            await confirmation
+            order.append("confirmed " + central)
+
+    tasks = [
+        asyncio.ensure_future(indicate(central)) for central in ["a", "b", "a"]
+    ]
+    await asyncio.sleep(0)
+
+    # Both centrals have an indication in flight, the second one to "a" waits
+    assert tracker.in_flight == 2
+    assert order == ["sent a", "sent b"]
+
+    assert tracker.confirm(CHAR, "b") is not None
+    assert tracker.confirm(CHAR, "a") is not None
+    assert tracker.confirm(CHAR, "a") is None
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert order[2:] == ["confirmed b", "confirmed a", "sent a"]
+
+    # A confirmation for a different characteristic is ignored
+    assert tracker.confirm("2a37", "a") is None
+    tracker.discard("a")
+    await asyncio.gather(*tasks, return_exceptions=True)
+    assert tracker.in_flight == 0
+
+
+def test_latency_stats():
+    stats = LatencyStats(window=4)
+    assert stats.mean is None
+    assert stats.percentile(50) is None
+
+    for sample in [0.4, 0.1, 0.2, 0.3, 0.5]:
+        stats.record(sample)
+
+    assert stats.count == 5
+    assert stats.min == 0.1
+    assert stats.max == 0.5
+    assert stats.mean == pytest.approx(0.3)
+    # Percentiles only cover the most recent window
+    assert stats.percentile(50) == 0.2
+    assert stats.percentile(100) == 0.5
+
+    stats.reset()
+    assert stats.as_dict()["count"] == 0
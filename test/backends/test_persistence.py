@@ -0,0 +1,94 @@
+import os
+import tempfile
+import pytest
+
+from bless.backends.attribute import GATTAttributePermissions  # type: ignore
+from bless.backends.characteristic import (  # type: ignore
+    GATTCharacteristicProperties,
+)
+from bless.backends.loopback.server import BlessServerLoopback  # type: ignore
+from bless.backends.persistence import FsyncPolicy, PersistentValueStore
+
+CHAR: str = "51ff12bb-3ed8-46e5-b4f9-d64e2fec021b"
+DESC: str = "00002901-0000-1000-8000-00805f9b34fb"
+
+
+class Attribute:
+    def __init__(self, value: bytes):
+        self.value: bytearray = bytearray(value)
+
+
+@pytest.mark.asyncio
+async def test_persistent_value_store():
+    path: str = os.path.join(tempfile.mkdtemp(), "values.bin")
+    store = PersistentValueStore(path, fsync=FsyncPolicy.ALWAYS)
+    characteristic = Attribute(b"\x01")
+    descriptor = Attribute(b"name")
+    store.track(characteristic, CHAR.upper())
+    store.track(descriptor, CHAR, DESC)
+
+    store.flush()
+    size: int = os.path.getsize(path)
+    # Unchanged values are not written again
+    store.flush()
+    assert os.path.getsize(path) == size
+
+    characteristic.value = bytearray(b"\x02\x03")
+    store.close()
+
+    store = PersistentValueStore(path)
+    assert store.get(CHAR) == b"\x02\x03"
+    assert store.get(CHAR, DESC) == b"name"
+    assert store.get(DESC) is None
+
+    # A record torn by a crash is dropped
+    store.put(CHAR, b"\x04")
+    store.close()
+    with open(path, "ab") as f:
+        f.write(b"\x00" * 10)
+    store = PersistentValueStore(path)
+    assert store.get(CHAR) == b"\x04"
+    store.close()
+
+    # Compaction keeps only the latest values
+    store = PersistentValueStore(path, fsync=FsyncPolicy.NEVER, compact_ratio=1.0)
+    for i in range(200):
+        store.put(CHAR, bytes([i]))
+        store.flush()
+    assert os.path.getsize(path) <= 4096
+    store.close()
+    store = PersistentValueStore(path)
+    assert store.get(CHAR) == bytes([199])
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_value_store_flushed_on_stop():
+    path: str = os.path.join(tempfile.mkdtemp(), "values.bin")
+    store = PersistentValueStore(path, flush_interval=60)
+    server = BlessServerLoopback("Persisted", value_store=store)
+    await server.add_gatt(
+        {
+            "a07498ca-ad5b-474e-940d-16f1fbe7e8cd": {
+                CHAR: {
+                    "Properties": GATTCharacteristicProperties.read,
+                    "Permissions": GATTAttributePermissions.readable,
+                    "Value": bytearray(b"\x01"),
+                    "Persist": True,
+                }
+            }
+        }
+    )
+    await server.start()
+    assert store._task is not None
+    server.get_characteristic(CHAR).value = bytearray(b"\x02")
+    await server.stop()
+
+    # Written without waiting for the flush interval or __aexit__
+    assert store._task is None
+    assert PersistentValueStore(path).get(CHAR) == b"\x02"
+
+    await server.start()
+    assert store._task is not None
+    await server.stop()
+    store.close()
@@ -0,0 +1,77 @@
+import asyncio
+import pytest
+
+from typing import List, Tuple
+
+from bless.backends.policy import (  # type: ignore
+    AdvertisingIntervalPolicy,
+    AdvertisingIntervalTier,
+)
+
+
+@pytest.mark.asyncio
+async def test_policy_steps_tiers_and_follows_connections():
+    applied: List[Tuple[int, int]] = []
+
+    async def apply(min_interval: int, max_interval: int):
+        applied.append((min_interval, max_interval))
+
+    policy = AdvertisingIntervalPolicy(
+        [
+            AdvertisingIntervalTier(20, 30, 0.01),
+            AdvertisingIntervalTier(1000, 1200),
+        ],
+        connected_tier=AdvertisingIntervalTier(2000, 2500),
+    )
+    await policy.start(apply)
+    assert applied == [(20, 30)]
+
+    await asyncio.sleep(0.05)
+    assert applied == [(20, 30), (1000, 1200)]
+
+    policy.on_connection_changed(True)
+    await asyncio.sleep(0)
+    assert policy.current_tier == AdvertisingIntervalTier(2000, 2500)
+
+    # A disconnect restarts fast discovery
+    policy.on_connection_changed(False)
+    await asyncio.sleep(0)
+    assert applied[-1] == (20, 30)
+
+    policy.stop()
+    await asyncio.sleep(0.05)
+    assert applied[-1] == (20, 30)
+
+
+@pytest.mark.asyncio
+async def test_policy_cancels_pending_change():
+    applied: List[Tuple[int, int]] = []
+    release: asyncio.Event = asyncio.Event()
+
+    async def apply(min_interval: int, max_interval: int):
+        if applied:
+            await release.wait()
+        applied.append((min_interval, max_interval))
+
+    policy = AdvertisingIntervalPolicy(
+        [AdvertisingIntervalTier(20, 30)],
+        connected_tier=AdvertisingIntervalTier(2000, 2500),
+    )
+    await policy.start(apply)
+
+    # The connected tier is still being applied when the central leaves
+    policy.on_connection_changed(True)
+    await asyncio.sleep(0)
+    policy.on_connection_changed(False)
+    release.set()
+    await asyncio.sleep(0.01)
+    assert applied == [(20, 30)]
+    assert policy.current_tier == AdvertisingIntervalTier(20, 30)
+
+    release.clear()
+    policy.on_connection_changed(True)
+    await asyncio.sleep(0)
+    policy.stop()
+    release.set()
+    await asyncio.sleep(0.01)
+    assert applied == [(20, 30)]
@@ -0,0 +1,128 @@
+import time
+import asyncio
+import pytest
+
+from typing import Any, Optional
+
+from bless.backends.server import BaseBlessServer
+from bless.exceptions import BlessATTError, BlessError
+
+CHAR: str = "51ff12bb-3ed8-46e5-b4f9-d64e2fec021b"
+
+
+class Characteristic:
+    uuid: str = CHAR
+    codec: Any = None
+    read_deadline: Optional[float] = None
+    read_error: Optional[BlessATTError] = None
+    _last_read: Optional[bytearray] = None
+    value: bytearray = bytearray(b"\x00")
+
+
+class Server(BaseBlessServer):
+    def __init__(self, **kwargs):
+        super(Server, self).__init__(**kwargs)
+        self.characteristic = Characteristic()
+
+    async def start(self, advertisement_data=None, **kwargs) -> bool:
+        return True
+
+    async def stop(self) -> bool:
+        self._stopped()
+        return True
+
+    async def is_connected(self) -> bool:
+        return False
+
+    async def is_advertising(self) -> bool:
+        return False
+
+    async def add_new_service(self, uuid: str):
+        pass
+
+    async def add_new_characteristic(self, *args):
+        pass
+
+    async def add_new_descriptor(self, *args):
+        pass
+
+    def update_value(self, service_uuid: str, char_uuid: str, value: Any = None):
+        return True
+
+    def get_characteristic(self, uuid: str):  # type: ignore
+        return self.characteristic if uuid == CHAR else None
+
+
+@pytest.mark.asyncio
+async def test_read_deadline():
+    server = Server(loop=asyncio.get_running_loop())
+    delay: float = 0.0
+
+    def read(characteristic: Any) -> bytes:
+        time.sleep(delay)
+        return bytes([int(delay * 10)])
+
+    server.read_request_func = read
+    server.set_read_deadline(CHAR, 0.05)
+
+    assert server.read_request(CHAR) == b"\x00"
+    assert await server.read_request_async(CHAR) == b"\x00"
+
+    # Late reads get the stored value, then the handler's last result
+    delay = 0.2
+    assert server.read_request(CHAR) == b"\x00"
+    assert server.metrics.counts() == {"read_deadline_miss": 1}
+    await asyncio.sleep(0.3)
+    assert await server.read_request_async(CHAR) == b"\x02"
+    assert server.metrics.counts() == {"read_deadline_miss": 2}
+
+    server.set_read_deadline(
+        CHAR, 0.05, BlessATTError(BlessATTError.UNLIKELY_ERROR, "Busy")
+    )
+    with pytest.raises(BlessATTError):
+        await server.read_request_async(CHAR)
+    assert server.metrics.latency("read").count == 2
+
+    async def read_async(characteristic: Any) -> bytes:
+        await asyncio.sleep(delay)
+        return b"\x05"
+
+    server.read_request_func = read_async
+    server.set_read_deadline(CHAR, None)
+    assert await server.read_request_async(CHAR) == b"\x05"
+
+
+@pytest.mark.asyncio
+async def test_read_deadline_coroutine_handler_from_thread():
+    loop = asyncio.get_running_loop()
+    server = Server(loop=loop)
+
+    async def read(characteristic: Any) -> bytes:
+        await asyncio.sleep(0)
+        return b"\x07"
+
+    server.read_request_func = read
+    server.set_read_deadline(CHAR, 1.0)
+    # Backends like WinRT call read_request from their own threads
+    assert await loop.run_in_executor(None, server.read_request, CHAR) == b"\x07"
+    # It cannot block the loop that would run the handler
+    with pytest.raises(BlessError):
+        server.read_request(CHAR)
+
+
+@pytest.mark.asyncio
+async def test_read_executor_shut_down_on_stop():
+    server = Server(loop=asyncio.get_running_loop())
+    server.read_request_func = lambda characteristic: b"\x01"
+    server.set_read_deadline(CHAR, 1.0)
+    assert server.read_request(CHAR) == b"\x01"
+    assert server._read_executor is not None
+    workers = list(server._read_executor._threads)
+    assert all(worker.name.startswith("bless-read") for worker in workers)
+    assert len(workers) > 0
+
+    await server.stop()
+    assert server._read_executor is None
+    for worker in workers:
+        worker.join(1)
+        assert not worker.is_alive()
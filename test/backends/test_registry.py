@@ -0,0 +1,78 @@
+import sys
+import subprocess
+
+import pytest
+
+import bless
+from bless.backends.registry import (  # type: ignore
+    BlessBackend,
+    backend_names,
+    get_backend,
+    register_backend,
+)
+from bless.backends.server import BaseBlessServer  # type: ignore
+from bless.exceptions import BlessError  # type: ignore
+
+
+def test_import_does_not_load_a_backend():
+    code: str = (
+        "import sys, bless; "
+        "print(any(m.startswith(('bless.backends.bluezdbus', "
+        "'bless.backends.corebluetooth', 'bless.backends.winrt', 'bleak')) "
+        "for m in sys.modules))"
+    )
+    output: bytes = subprocess.check_output([sys.executable, "-c", code])
+    assert output.strip() == b"False"
+
+
+def test_backends_are_registered():
+    assert {"bluezdbus", "corebluetooth", "winrt", "loopback"} <= set(
+        backend_names()
+    )
+
+
+def test_environment_selects_the_backend(monkeypatch):
+    monkeypatch.setenv("BLESS_BACKEND", "loopback")
+    assert get_backend().name == "loopback"
+    assert get_backend("winrt").name == "winrt"
+
+
+def test_unknown_backend_raises(monkeypatch):
+    monkeypatch.setenv("BLESS_BACKEND", "nope")
+    with pytest.raises(BlessError):
+        get_backend()
+    with pytest.raises(BlessError):
+        BaseBlessServer("name", backend="nope")  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_backend_argument_selects_the_server():
+    from bless.backends.loopback.server import BlessServerLoopback
+
+    assert type(BaseBlessServer("name", backend="loopback")) is BlessServerLoopback
+    server = bless.BlessServer("name", backend="loopback")
+    assert type(server) is BlessServerLoopback
+    assert server.name == "name"
+
+
+def test_registered_backend_is_loaded_by_name():
+    register_backend(
+        BlessBackend(
+            name="test",
+            server="bless.backends.loopback.server:BlessServerLoopback",
+            service="bless.backends.loopback.service:BlessGATTServiceLoopback",
+            characteristic=(
+                "bless.backends.loopback.characteristic:"
+                "BlessGATTCharacteristicLoopback"
+            ),
+            descriptor="bless.backends.loopback.descriptor:BlessGATTDescriptorLoopback",
+        )
+    )
+    assert get_backend("test").load("server").__name__ == "BlessServerLoopback"
+
+
+def test_lazy_attributes():
+    assert "BlessServer" in dir(bless)
+    assert bless.GATTCharacteristicProperties.read.value == 0x2
+    with pytest.raises(AttributeError):
+        bless.NotAnAttribute
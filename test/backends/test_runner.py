@@ -0,0 +1,136 @@
+import threading
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from bless.backends.runner import BlessServerThread
+
+SERVICE: str = "a07498ca-ad5b-474e-940d-16f1fbe7e8cd"
+CHAR: str = "51ff12bb-3ed8-46e5-b4f9-d64e2fec021b"
+
+
+class Characteristic:
+    typed_value: Any = None
+
+
+class Server:
+    def __init__(self, loop=None, **kwargs):
+        self.loop = loop
+        self.kwargs: Dict[str, Any] = kwargs
+        self.gatt: Optional[Dict] = None
+        self.started: bool = False
+        self.stopped: bool = False
+        self.characteristic = Characteristic()
+        self.updates: List[Tuple[str, Any]] = []
+        self.threads: set = set()
+
+    async def add_gatt(self, gatt: Dict):
+        self.gatt = gatt
+
+    async def start(self, advertisement_data=None):
+        self.started = True
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.stopped = True
+
+    async def echo(self, value: Any) -> Any:
+        return value
+
+    def get_characteristic(self, uuid: str):
+        return self.characteristic if uuid == CHAR else None
+
+    def update_value(self, service_uuid: str, char_uuid: str, value: Any = None):
+        self.threads.add(threading.get_ident())
+        self.updates.append((char_uuid, value))
+        return True
+
+
+def test_server_thread():
+    runner = BlessServerThread(Server, name="Test")  # type: ignore
+    with runner:
+        server: Any = runner.start(gatt={SERVICE: {}})
+        assert server.started and server.gatt == {SERVICE: {}}
+        assert server.kwargs == {"name": "Test"}
+        assert runner.call(server.echo(1)) == 1
+
+        count: int = 10000
+
+        def produce(producer: int):
+            for i in range(count):
+                runner.update_value(SERVICE, CHAR, (producer, i))
+
+        producers: List[threading.Thread] = [
+            threading.Thread(target=produce, args=(k,)) for k in range(2)
+        ]
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+        runner.set_value(CHAR, b"\x01")
+        runner.notify(SERVICE, CHAR)
+        runner.set_value("unknown", b"\x00")
+        loop_thread: Optional[int] = runner._thread.ident  # type: ignore
+
+    assert server.stopped
+    assert runner.loop is None
+    values: List[Any] = [value for _, value in server.updates]
+    assert len(values) == 2 * count + 1
+    assert values[-1] is None
+    # Each producer's calls arrive in order
+    for k in range(2):
+        assert [i for producer, i in values[:-1] if producer == k] == list(
+            range(count)
+        )
+    assert server.characteristic.typed_value == b"\x01"
+    assert server.threads == {loop_thread}
+    assert 0 < runner.wakeups < 2 * count
+
+
+def test_server_thread_handlers():
+    from bless.backends.attribute import GATTAttributePermissions
+    from bless.backends.characteristic import GATTCharacteristicProperties
+    from bless.backends.loopback.server import BlessServerLoopback
+
+    reads: List[int] = []
+    writes: List[bytes] = []
+
+    def read(characteristic: Any, **kwargs) -> bytearray:
+        reads.append(threading.get_ident())
+        return characteristic.value
+
+    def write(characteristic: Any, value: Any, **kwargs):
+        writes.append(bytes(value))
+        characteristic.value = value
+
+    gatt: Dict = {
+        SERVICE: {
+            CHAR: {
+                "Properties": (
+                    GATTCharacteristicProperties.read
+                    | GATTCharacteristicProperties.write
+                ),
+                "Permissions": (
+                    GATTAttributePermissions.readable
+                    | GATTAttributePermissions.writeable
+                ),
+                "Value": bytearray(b"\x01"),
+            }
+        }
+    }
+    with BlessServerThread(
+        BlessServerLoopback,
+        read_request_func=read,
+        write_request_func=write,
+        name="Test",
+    ) as runner:
+        server: Any = runner.start(gatt=gatt)
+        assert runner.call(server.read(CHAR)) == b"\x01"
+
+        async def central_write():
+            server.write(CHAR, b"\x02")
+
+        runner.call(central_write())
+        assert runner.call(server.read(CHAR)) == b"\x02"
+        loop_thread: Optional[int] = runner._thread.ident  # type: ignore
+
+    assert writes == [b"\x02"]
+    assert set(reads) == {loop_thread}
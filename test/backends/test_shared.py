@@ -0,0 +1,90 @@
+import os
+import sys
+import bless
+import pytest
+import subprocess
+import multiprocessing
+
+from typing import List, Tuple
+
+from bless.backends.shared import SharedValueFeed, SharedValueStore
+
+SERVICE: str = "a07498ca-ad5b-474e-940d-16f1fbe7e8cd"
+CHARS: List[str] = [
+    "51ff12bb-3ed8-46e5-b4f9-d64e2fec021b",
+    "bfc0c92f-317d-4ba9-976b-cc11ce77b4ca",
+]
+
+
+class Server:
+    def __init__(self):
+        self.updates: List[Tuple[str, bytes]] = []
+
+    def update_value(self, service_uuid: str, char_uuid: str, value=None) -> bool:
+        self.updates.append((char_uuid, value))
+        return True
+
+
+def produce(name: str):
+    store = SharedValueStore.attach(name)
+    for i in range(100):
+        store.write(1, i.to_bytes(2, "little"))
+    store.close()
+
+
+def test_shared_value_store():
+    store = SharedValueStore.create(slots=2, slot_size=4)
+    try:
+        producer = SharedValueStore.attach(store.name)
+        producer.write(0, b"\x01\x02")
+        assert store.read(0) == (2, b"\x01\x02")
+        assert store.read(1) == (0, b"")
+        with pytest.raises(ValueError):
+            producer.write(0, b"\x00" * 5)
+        producer.close()
+
+        server = Server()
+        feed = SharedValueFeed(server, store, [(SERVICE, c) for c in CHARS])
+        assert feed.poll() == 1
+        assert feed.poll() == 0
+        assert server.updates == [(CHARS[0], b"\x01\x02")]
+    finally:
+        store.close()
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Uses fork")
+def test_shared_value_store_across_processes():
+    store = SharedValueStore.create(slots=2, slot_size=2)
+    try:
+        process = multiprocessing.get_context("fork").Process(
+            target=produce, args=(store.name,)
+        )
+        process.start()
+        process.join(10)
+        assert process.exitcode == 0
+        assert store.read(1) == (200, (99).to_bytes(2, "little"))
+    finally:
+        store.close()
+
+
+def test_shared_value_store_outlives_producer():
+    # An unrelated producer process has its own resource tracker, which must
+    # not unlink the block when the producer exits
+    store = SharedValueStore.create(slots=2, slot_size=2)
+    try:
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from bless.backends.shared import SharedValueStore; "
+                "SharedValueStore.attach({!r}).close()".format(store.name),
+            ],
+            check=True,
+            timeout=30,
+            # Import bless from the same tree as this test
+            cwd=os.path.dirname(os.path.dirname(bless.__file__)),
+        )
+        assert store.read(1) == (0, b"")
+        SharedValueStore.attach(store.name).close()
+    finally:
+        store.close()
@@ -0,0 +1,73 @@
+import asyncio
+import pytest
+
+from typing import List, Optional
+
+from bless.backends.codec import CharacteristicCodec
+from bless.backends.metrics import ServerMetrics
+from bless.backends.stream import TimeSeriesStream
+
+SERVICE: str = "a07498ca-ad5b-474e-940d-16f1fbe7e8cd"
+CHAR: str = "51ff12bb-3ed8-46e5-b4f9-d64e2fec021b"
+
+
+class Server:
+    def __init__(self, mtu: Optional[int]):
+        self.mtu: Optional[int] = mtu
+        self.metrics: ServerMetrics = ServerMetrics()
+        self.subscribed: bool = True
+        self.packets: List[bytes] = []
+
+    def is_subscribed(self, char_uuid: str) -> bool:
+        return self.subscribed
+
+    def update_value(self, service_uuid: str, char_uuid: str, value=None) -> bool:
+        self.packets.append(bytes(value))
+        return True
+
+
+@pytest.mark.asyncio
+async def test_stream_fills_packets():
+    server = Server(mtu=247)
+    stream = TimeSeriesStream(
+        server, SERVICE, CHAR, CharacteristicCodec("<ff"), max_latency=10
+    )  # type: ignore
+    # (247 - 3 - 6) // 8 samples per packet
+    assert stream.samples_per_packet == 29
+
+    for i in range(60):
+        stream.append((i, -i))
+    await asyncio.sleep(0)
+
+    assert [len(packet) for packet in server.packets] == [238, 238]
+    sequence, timestamp = TimeSeriesStream.HEADER.unpack_from(server.packets[1])
+    assert sequence == 1
+    assert CharacteristicCodec("<ff").decode(server.packets[1][6:14]) == (29, -29)
+
+    # The remaining samples go out with the next flush
+    stream.close()
+    assert len(server.packets[2]) == 6 + 2 * 8
+    assert stream.throughput()["efficiency"] == pytest.approx(60 * 8 / (3 * 244))
+
+
+@pytest.mark.asyncio
+async def test_stream_latency_deadline():
+    server = Server(mtu=None)
+    stream = TimeSeriesStream(
+        server, SERVICE, CHAR, CharacteristicCodec("<h"), max_latency=0.01
+    )  # type: ignore
+    stream.append(1)
+    stream.append(2)
+    assert server.packets == []
+
+    await asyncio.sleep(0.05)
+    assert len(server.packets) == 1
+    assert server.packets[0][:2] == b"\x00\x00"
+    assert server.packets[0][6:] == b"\x01\x00\x02\x00"
+    assert server.metrics.latency("stream").count == 1
+
+    # Samples are discarded while nobody listens
+    server.subscribed = False
+    stream.append(3)
+    stream.close()
+    assert len(server.packets) == 1
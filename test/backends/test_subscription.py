@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+
+from typing import List, Tuple
+
+from bless.backends.subscription import SubscriptionState
+
+CHAR: str = "a07498ca-ad5b-474e-940d-16f1fbe7e8cd"
+
+
+def test_subscriptions():
+    events: List[Tuple[str, str, bool]] = []
+    state = SubscriptionState(
+        lambda char, central, subscribed: events.append((char, central, subscribed))
+    )
+    assert not state.is_subscribed(CHAR)
+
+    assert state.subscribe(CHAR.upper(), "central-1")
+    assert not state.subscribe(CHAR, "central-1")
+    assert state.is_subscribed(CHAR)
+    assert state.any_subscribed
+
+    # Short UUIDs are expanded so that every backend agrees on the key
+    state.set_subscribers("2A37", ["central-1", "central-2"])
+    state.set_subscribers("2a37", ["central-2"])
+    assert state.subscribers("00002a37-0000-1000-8000-00805f9b34fb") == {"central-2"}
+
+    state.clear()
+    assert not state.any_subscribed
+    assert not state.unsubscribe(CHAR, "central-1")
+
+    heart_rate: str = "00002a37-0000-1000-8000-00805f9b34fb"
+    assert events == [
+        (CHAR, "central-1", True),
+        (heart_rate, "central-1", True),
+        (heart_rate, "central-2", True),
+        (heart_rate, "central-1", False),
+        (CHAR, "central-1", False),
+        (heart_rate, "central-2", False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_subscribers():
+    state = SubscriptionState()
+    assert not await state.wait_for_subscribers(CHAR, timeout=0.01)
+
+    waiter = asyncio.ensure_future(state.wait_for_subscribers(CHAR))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    state.subscribe(CHAR, "central-1")
+    assert await asyncio.wait_for(waiter, 1.0)
+    assert await state.wait_for_subscribers(CHAR, timeout=0)
+
+    state.unsubscribe(CHAR, "central-1")
+    assert not await state.wait_for_subscribers(CHAR, timeout=0.01)
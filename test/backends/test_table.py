@@ -0,0 +1,62 @@
+import pytest
+
+from typing import Dict, List, Optional, Tuple
+
+from bless.backends.subscription import SubscriptionState
+
+np = pytest.importorskip("numpy")
+
+from bless.backends.table import CharacteristicTable  # noqa: E402
+
+SERVICE: str = "a07498ca-ad5b-474e-940d-16f1fbe7e8cd"
+CHARS: List[str] = [
+    "51ff12bb-3ed8-46e5-b4f9-d64e2fec021b",
+    "bfc0c92f-317d-4ba9-976b-cc11ce77b4ca",
+    "ab1d5f2c-7f3a-4bd5-8c2f-2d0c1e4f6a71",
+]
+
+
+class Characteristic:
+    def __init__(self):
+        self.value: Optional[memoryview] = None
+
+
+class Server:
+    def __init__(self):
+        self.characteristics: Dict[str, Characteristic] = {
+            uuid: Characteristic() for uuid in CHARS
+        }
+        self.subscriptions: SubscriptionState = SubscriptionState()
+        self.updates: List[Tuple[str, bytes]] = []
+
+    def get_characteristic(self, uuid: str) -> Optional[Characteristic]:
+        return self.characteristics.get(uuid)
+
+    def update_value(self, service_uuid: str, char_uuid: str) -> bool:
+        value = self.characteristics[char_uuid].value
+        self.updates.append((char_uuid, bytes(value)))  # type: ignore
+        return True
+
+
+def test_characteristic_table():
+    server = Server()
+    table = CharacteristicTable(server, SERVICE, CHARS, "<i2")  # type: ignore
+    server.subscriptions.subscribe(CHARS[0], "central")
+    server.subscriptions.subscribe(CHARS[2], "central")
+
+    # Values are views of the table rows
+    table.values[:] = [1, 2, 3]
+    assert bytes(server.characteristics[CHARS[1]].value) == b"\x02\x00"  # type: ignore
+    assert bytes(table.read(CHARS[2])) == b"\x03\x00"
+
+    # Only subscribed characteristics are notified
+    assert table.flush() == [CHARS[0], CHARS[2]]
+    assert table.changed().size == 0
+
+    table.values[:] = [1, 5, 4]
+    table.set(CHARS[0], 1)
+    assert list(table.changed()) == [1, 2]
+    server.updates.clear()
+    assert table.flush() == [CHARS[2]]
+    assert server.updates == [(CHARS[2], b"\x04\x00")]
+    assert table.flush() == []